@@ -16,6 +16,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# dtype pd.to_datetime gives timestamp strings (resolution differs across pandas versions)
+_PARSED_DATETIME_DTYPE = pd.to_datetime(pd.Series(['2000-01-01 00:00:00'])).dtype
+
 
 class DataLoader:
     """Universal loader for OHLCV market data from various sources."""
@@ -125,7 +128,21 @@ class DataLoader:
             kwargs['sep'] = sep
         
         logger.debug(f"Loading CSV with separator: '{sep}'")
-        df = pd.read_csv(file_path, **kwargs)
+        df = None
+        if 'engine' not in kwargs:
+            # The pyarrow parser is multithreaded and much faster on large files,
+            # but rejects some options and malformed rows; fall back to the C parser
+            try:
+                df = pd.read_csv(file_path, engine='pyarrow', **kwargs)
+            except Exception as e:
+                logger.debug(f"pyarrow CSV parser failed, using default parser: {e}")
+            else:
+                # pyarrow parses timestamp columns itself, at second resolution;
+                # use the resolution pandas gives parsed strings instead
+                for col in df.select_dtypes(include=['datetime64']).columns:
+                    df[col] = df[col].astype(_PARSED_DATETIME_DTYPE)
+        if df is None:
+            df = pd.read_csv(file_path, **kwargs)
         
         logger.debug(f"CSV loaded: {df.shape[0]} rows, {df.shape[1]} columns")
         logger.debug(f"Columns: {df.columns.tolist()}")
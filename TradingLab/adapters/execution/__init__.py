@@ -1,6 +1,10 @@
 """Execution adapters for live trading with various exchanges."""
 
-from adapters.execution.binance_futures import BinanceFuturesAdapter
+from adapters.execution.binance_futures import (
+    BinanceFuturesAdapter,
+    TransientAPIError,
+    FatalAPIError
+)
 
-__all__ = ['BinanceFuturesAdapter']
+__all__ = ['BinanceFuturesAdapter', 'TransientAPIError', 'FatalAPIError']
 
@@ -6,11 +6,10 @@ Supports both paper trading (simulated) and live trading modes.
 import os
 import time
 import logging
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-import pandas as pd
 
 try:
     from dotenv import load_dotenv
@@ -20,15 +19,98 @@ except ImportError:
 
 try:
     from binance.client import Client
-    from binance.exceptions import BinanceAPIException
+    from binance.exceptions import BinanceAPIException, BinanceRequestException
+    from binance import ThreadedWebsocketManager
+    from requests.adapters import HTTPAdapter
+    from requests.exceptions import RequestException
     BINANCE_AVAILABLE = True
 except ImportError:
     BINANCE_AVAILABLE = False
     Client = None
+    ThreadedWebsocketManager = None
     BinanceAPIException = Exception
+    BinanceRequestException = Exception
+    RequestException = Exception
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if BINANCE_AVAILABLE and ORJSON_AVAILABLE:
+    class _OrjsonClient(Client):
+        """python-binance Client that decodes REST responses with orjson."""
+        
+        @staticmethod
+        def _handle_response(response):
+            if not (200 <= response.status_code < 300):
+                raise BinanceAPIException(response, response.status_code, response.text)
+            if not response.content:
+                return {}
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                raise BinanceRequestException("Invalid Response: %s" % response.text)
+    
+    _ClientClass = _OrjsonClient
+else:
+    _ClientClass = Client
 
 logger = logging.getLogger(__name__)
 
+# Maximum orders per POST /fapi/v1/batchOrders request
+BATCH_ORDER_LIMIT = 5
+
+# Maximum order ids per DELETE /fapi/v1/batchOrders request
+BATCH_CANCEL_LIMIT = 10
+
+# Keep-alive connections pooled per host for REST calls
+HTTP_POOL_SIZE = 16
+
+
+# Binance error codes that signal a temporary condition rather than a bad request
+_TRANSIENT_ERROR_CODES = {
+    -1001,  # Internal error; unable to process your request
+    -1003,  # Too many requests
+    -1007,  # Timeout waiting for response from backend server
+}
+
+
+class TransientAPIError(Exception):
+    """Exchange request failed in a way that may succeed on retry (5xx, rate limit, network)."""
+
+
+class FatalAPIError(Exception):
+    """Exchange rejected the request; retrying will not help (auth, parameters, account state)."""
+
+
+def _translate_api_error(e: Exception) -> Exception:
+    """Map a python-binance / requests exception to TransientAPIError or FatalAPIError."""
+    if isinstance(e, BinanceAPIException):
+        status = getattr(e, 'status_code', 0) or 0
+        if status >= 500 or status == 429 or getattr(e, 'code', None) in _TRANSIENT_ERROR_CODES:
+            return TransientAPIError(str(e))
+        return FatalAPIError(str(e))
+    # Network failures and unparseable responses
+    return TransientAPIError(str(e))
+
+
+def _pool_session(client) -> None:
+    """Mount a sized keep-alive connection pool on a python-binance client session.
+    
+    urllib3 already sets TCP_NODELAY on pooled sockets; this sizes the pool so
+    concurrent calls (order worker + monitoring loop) reuse warm TLS connections
+    instead of opening new ones, and disables transport-level retries so order
+    requests are never silently resent.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=0
+    )
+    client.session.mount('https://', adapter)
+
 # Load .env file if available
 if DOTENV_AVAILABLE:
     # Try to find .env file in project root (2 levels up from this file)
@@ -134,18 +216,19 @@ class BinanceFuturesAdapter:
             
             # Initialize Binance client
             if testnet:
-                self.client = Client(
+                self.client = _ClientClass(
                     api_key=self.api_key,
                     api_secret=self.api_secret,
                     testnet=True
                 )
                 logger.info("Using Binance Testnet for live trading")
             else:
-                self.client = Client(
+                self.client = _ClientClass(
                     api_key=self.api_key,
                     api_secret=self.api_secret
                 )
                 logger.warning("Using Binance LIVE API - real money at risk!")
+            _pool_session(self.client)
         else:
             self.client = None
             logger.info("Paper trading mode enabled - no real orders will be placed")
@@ -156,6 +239,53 @@ class BinanceFuturesAdapter:
         self._paper_orders: Dict[str, Order] = {}
         self._paper_order_counter = 0
         
+        # User-data stream (live mode only)
+        self._user_stream = None
+        
+        # Unauthenticated client for paper-mode prices, created on first use
+        self._public_client = None
+        
+    def _call(self, method: Callable, **params) -> Any:
+        """Invoke a python-binance client method, raising TransientAPIError/FatalAPIError."""
+        try:
+            return method(**params)
+        except (BinanceAPIException, BinanceRequestException, RequestException) as e:
+            raise _translate_api_error(e) from e
+    
+    def start_user_stream(self, callback: Callable[[Dict[str, Any]], None]) -> bool:
+        """Subscribe to the futures user-data stream.
+        
+        Delivers ACCOUNT_UPDATE / ORDER_TRADE_UPDATE events to ``callback`` from a
+        background thread. python-binance handles the listenKey and its keep-alive.
+        Paper mode has no exchange-side account to stream, so this is a no-op there.
+        
+        Args:
+            callback: Called with each raw event dict
+            
+        Returns:
+            True if the stream was started
+        """
+        if self.paper_mode:
+            return False
+        
+        if self._user_stream is None:
+            self._user_stream = ThreadedWebsocketManager(
+                api_key=self.api_key,
+                api_secret=self.api_secret,
+                testnet=self.testnet
+            )
+            self._user_stream.start()
+        
+        self._user_stream.start_futures_user_socket(callback=callback)
+        logger.info("Subscribed to futures user-data stream")
+        return True
+    
+    def stop_user_stream(self):
+        """Stop the user-data stream if running."""
+        if self._user_stream is not None:
+            self._user_stream.stop()
+            self._user_stream = None
+        
     def get_account_balance(self) -> AccountBalance:
         """Get account balance."""
         if self.paper_mode:
@@ -171,7 +301,7 @@ class BinanceFuturesAdapter:
             )
         else:
             # Get real balance from Binance
-            account = self.client.futures_account()
+            account = self._call(self.client.futures_account)
             balance = float(account['totalWalletBalance'])
             available = float(account['availableBalance'])
             margin_used = float(account['totalMarginBalance']) - available
@@ -193,9 +323,9 @@ class BinanceFuturesAdapter:
         else:
             # Get real positions from Binance
             if symbol:
-                positions_data = self.client.futures_position_information(symbol=symbol)
+                positions_data = self._call(self.client.futures_position_information, symbol=symbol)
             else:
-                positions_data = self.client.futures_position_information()
+                positions_data = self._call(self.client.futures_position_information)
             
             positions = []
             for pos_data in positions_data:
@@ -261,6 +391,47 @@ class BinanceFuturesAdapter:
         else:
             return self._place_real_stop_order(symbol, side, quantity, stop_price, reduce_only)
     
+    def modify_stop_order(
+        self,
+        symbol: str,
+        order_id: str,
+        side: str,
+        quantity: float,
+        new_stop_price: float
+    ) -> Order:
+        """Move a stop market order to a new stop price.
+        
+        Binance only supports in-place modification (PUT /fapi/v1/order) for
+        LIMIT orders, so live mode places the replacement stop before
+        cancelling the old one. The position is never left without a stop.
+        
+        Args:
+            symbol: Trading symbol
+            order_id: Existing stop order ID
+            side: Stop order side ('BUY' or 'SELL')
+            quantity: Stop order quantity
+            new_stop_price: New stop trigger price
+            
+        Returns:
+            The order now protecting the position
+        """
+        if self.paper_mode:
+            order = self._paper_orders.get(order_id)
+            if order is not None and order.status == 'NEW':
+                order.stop_price = new_stop_price
+                order.quantity = quantity
+                logger.info(f"PAPER: STOP {side} {quantity} {symbol} moved to {new_stop_price}")
+                return order
+            return self._place_paper_stop_order(symbol, side, quantity, new_stop_price)
+        
+        new_order = self._place_real_stop_order(symbol, side, quantity, new_stop_price, True)
+        try:
+            self.cancel_order(symbol, order_id)
+        except TransientAPIError as e:
+            # The replacement is live; a leftover reduce-only stop cannot add exposure
+            logger.warning(f"Replaced stop {order_id} but failed to cancel it: {e}")
+        return new_order
+    
     def cancel_order(self, symbol: str, order_id: str) -> bool:
         """Cancel an order."""
         if self.paper_mode:
@@ -271,28 +442,128 @@ class BinanceFuturesAdapter:
             return False
         else:
             try:
-                self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
+                self._call(self.client.futures_cancel_order, symbol=symbol, orderId=order_id)
                 return True
-            except BinanceAPIException as e:
+            except FatalAPIError as e:
                 logger.error(f"Failed to cancel order {order_id}: {e}")
                 return False
     
+    def cancel_orders(self, symbol: str, order_ids: List[str]) -> List[str]:
+        """Cancel several orders of one symbol, BATCH_CANCEL_LIMIT per request.
+        
+        Args:
+            symbol: Trading symbol
+            order_ids: IDs of the orders to cancel
+            
+        Returns:
+            IDs of the orders that were cancelled (rejected ones are logged and skipped)
+        """
+        if self.paper_mode:
+            return [order_id for order_id in order_ids if self.cancel_order(symbol, order_id)]
+        
+        cancelled = []
+        for start in range(0, len(order_ids), BATCH_CANCEL_LIMIT):
+            chunk = order_ids[start:start + BATCH_CANCEL_LIMIT]
+            try:
+                responses = self._call(
+                    self.client.futures_cancel_orders,
+                    symbol=symbol,
+                    orderIdList='[' + ','.join(chunk) + ']'
+                )
+            except FatalAPIError as e:
+                logger.error(f"Failed to cancel orders {chunk}: {e}")
+                continue
+            
+            for order_id, order_response in zip(chunk, responses):
+                if 'orderId' not in order_response:
+                    logger.error(
+                        f"Cancel rejected for order {order_id}: "
+                        f"{order_response.get('msg', order_response)}"
+                    )
+                    continue
+                cancelled.append(order_id)
+        
+        return cancelled
+    
+    def place_batch_market_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        reduce_only: bool = False
+    ) -> List[Order]:
+        """Place several market orders, BATCH_ORDER_LIMIT per request.
+        
+        Args:
+            orders: Dicts with 'symbol', 'side' ('BUY' or 'SELL') and 'quantity'
+            reduce_only: Applied to every order
+            
+        Returns:
+            Orders accepted by the exchange (rejected ones are logged and skipped)
+        """
+        if self.paper_mode:
+            return [
+                self._place_paper_market_order(o['symbol'], o['side'], o['quantity'])
+                for o in orders
+            ]
+        
+        placed = []
+        for start in range(0, len(orders), BATCH_ORDER_LIMIT):
+            chunk = orders[start:start + BATCH_ORDER_LIMIT]
+            try:
+                responses = self._call(self.client.futures_place_batch_order, batchOrders=[
+                    {
+                        'symbol': o['symbol'],
+                        'side': o['side'],
+                        'type': 'MARKET',
+                        'quantity': str(o['quantity']),
+                        'reduceOnly': 'true' if reduce_only else 'false'
+                    }
+                    for o in chunk
+                ])
+            except (TransientAPIError, FatalAPIError) as e:
+                logger.error(f"Failed to place batch market orders: {e}")
+                raise
+            
+            for o, order_response in zip(chunk, responses):
+                if 'orderId' not in order_response:
+                    logger.error(
+                        f"Batch market order rejected for {o['symbol']}: "
+                        f"{order_response.get('msg', order_response)}"
+                    )
+                    continue
+                
+                order = Order(
+                    order_id=str(order_response['orderId']),
+                    symbol=o['symbol'],
+                    side=o['side'],
+                    order_type='MARKET',
+                    quantity=float(order_response['origQty']),
+                    status=order_response['status'],
+                    filled_quantity=float(order_response.get('executedQty', 0)),
+                    avg_price=float(order_response.get('avgPrice', 0)) if order_response.get('avgPrice') else None,
+                    timestamp=datetime.fromtimestamp(order_response['updateTime'] / 1000)
+                )
+                logger.info(f"LIVE: {o['side']} {o['quantity']} {o['symbol']} - Order ID: {order.order_id}")
+                placed.append(order)
+        
+        return placed
+    
     def get_current_price(self, symbol: str) -> float:
         """Get current market price."""
         if self.paper_mode:
             # In paper mode, we need to fetch real price for simulation
             # Use public API (no auth needed)
             try:
-                from binance.client import Client as PublicClient
-                public_client = PublicClient()
-                ticker = public_client.get_symbol_ticker(symbol=symbol)
+                if self._public_client is None:
+                    self._public_client = _ClientClass()
+                    _pool_session(self._public_client)
+                ticker = self._call(self._public_client.get_symbol_ticker, symbol=symbol)
                 return float(ticker['price'])
             except Exception as e:
                 logger.error(f"Failed to get price for {symbol}: {e}")
                 raise
         else:
             # Use the client (works for both testnet and live)
-            ticker = self.client.get_symbol_ticker(symbol=symbol)
+            ticker = self._call(self.client.get_symbol_ticker, symbol=symbol)
             return float(ticker['price'])
     
     def _place_paper_market_order(
@@ -432,7 +703,8 @@ class BinanceFuturesAdapter:
     ) -> Order:
         """Place a real market order on Binance."""
         try:
-            order_response = self.client.futures_create_order(
+            order_response = self._call(
+                self.client.futures_create_order,
                 symbol=symbol,
                 side=side,
                 type='MARKET',
@@ -455,7 +727,7 @@ class BinanceFuturesAdapter:
             logger.info(f"LIVE: {side} {quantity} {symbol} - Order ID: {order.order_id}")
             return order
             
-        except BinanceAPIException as e:
+        except (TransientAPIError, FatalAPIError) as e:
             logger.error(f"Failed to place market order: {e}")
             raise
     
@@ -470,7 +742,8 @@ class BinanceFuturesAdapter:
     ) -> Order:
         """Place a real limit order on Binance."""
         try:
-            order_response = self.client.futures_create_order(
+            order_response = self._call(
+                self.client.futures_create_order,
                 symbol=symbol,
                 side=side,
                 type='LIMIT',
@@ -494,7 +767,7 @@ class BinanceFuturesAdapter:
             logger.info(f"LIVE: LIMIT {side} {quantity} {symbol} @ {price} - Order ID: {order.order_id}")
             return order
             
-        except BinanceAPIException as e:
+        except (TransientAPIError, FatalAPIError) as e:
             logger.error(f"Failed to place limit order: {e}")
             raise
     
@@ -509,7 +782,8 @@ class BinanceFuturesAdapter:
         """Place a real stop market order on Binance."""
         try:
             # Binance uses STOP_MARKET for stop loss orders
-            order_response = self.client.futures_create_order(
+            order_response = self._call(
+                self.client.futures_create_order,
                 symbol=symbol,
                 side=side,
                 type='STOP_MARKET',
@@ -532,7 +806,7 @@ class BinanceFuturesAdapter:
             logger.info(f"LIVE: STOP {side} {quantity} {symbol} @ {stop_price} - Order ID: {order.order_id}")
             return order
             
-        except BinanceAPIException as e:
+        except (TransientAPIError, FatalAPIError) as e:
             logger.error(f"Failed to place stop order: {e}")
             raise
 
@@ -0,0 +1,76 @@
+"""Array kernels for bulk margin and P&L calculations.
+
+Compiled with Numba when it is installed; otherwise the same functions run
+as plain Python/NumPy. MarketSpec scalar methods stay in Python because the
+call overhead of a JIT-compiled function exceeds a couple of multiplies.
+"""
+
+import numpy as np
+
+from engine.jit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _pnl_batch(entry_prices, current_prices, quantities, direction_signs):
+    n = entry_prices.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = (current_prices[i] - entry_prices[i]) * quantities[i] * direction_signs[i]
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _margin_leverage_batch(prices, quantities, inv_leverage):
+    n = prices.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = prices[i] * abs(quantities[i]) * inv_leverage
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _margin_fixed_batch(quantities, per_contract):
+    n = quantities.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = abs(quantities[i]) * per_contract
+    return out
+
+
+def pnl_batch(entry_prices, current_prices, quantities, direction_signs) -> np.ndarray:
+    """Unrealized P&L per position: (current - entry) * quantity * sign."""
+    arrays = np.broadcast_arrays(
+        np.asarray(entry_prices, dtype=np.float64),
+        np.asarray(current_prices, dtype=np.float64),
+        np.asarray(quantities, dtype=np.float64),
+        np.asarray(direction_signs, dtype=np.float64)
+    )
+    if not NUMBA_AVAILABLE:
+        entry, current, qty, sign = arrays
+        return (current - entry) * qty * sign
+    return _pnl_batch(*(np.ascontiguousarray(a).ravel() for a in arrays)).reshape(arrays[0].shape)
+
+
+def margin_leverage_batch(prices, quantities, inv_leverage: float) -> np.ndarray:
+    """Leverage-based margin per position: price * |quantity| / leverage."""
+    prices, quantities = np.broadcast_arrays(
+        np.asarray(prices, dtype=np.float64),
+        np.asarray(quantities, dtype=np.float64)
+    )
+    if not NUMBA_AVAILABLE:
+        return prices * np.abs(quantities) * inv_leverage
+    return _margin_leverage_batch(
+        np.ascontiguousarray(prices).ravel(),
+        np.ascontiguousarray(quantities).ravel(),
+        inv_leverage
+    ).reshape(prices.shape)
+
+
+def margin_fixed_batch(quantities, per_contract: float) -> np.ndarray:
+    """Fixed margin per position: |quantity| * margin per contract."""
+    quantities = np.asarray(quantities, dtype=np.float64)
+    if not NUMBA_AVAILABLE:
+        return np.abs(quantities) * per_contract
+    return _margin_fixed_batch(
+        np.ascontiguousarray(quantities).ravel(), per_contract
+    ).reshape(quantities.shape)
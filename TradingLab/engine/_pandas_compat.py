@@ -0,0 +1,11 @@
+"""Helpers for behaviour that differs between pandas 2.x and 3.x."""
+
+import pandas as pd
+
+# pandas >= 3 always uses Copy-on-Write; on 2.x it is opt-in via mode.copy_on_write
+_PANDAS_ALWAYS_COW = int(pd.__version__.split('.')[0]) >= 3
+
+
+def copy_on_write_enabled() -> bool:
+    """True if pandas Copy-on-Write is active, so shallow copies are safe to hand out."""
+    return _PANDAS_ALWAYS_COW or pd.get_option('mode.copy_on_write') is True
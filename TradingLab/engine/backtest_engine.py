@@ -27,6 +27,7 @@ import logging
 from datetime import datetime
 
 from strategies.base import StrategyBase
+from engine._pandas_compat import copy_on_write_enabled
 from engine.market import MarketSpec
 from engine.broker import BrokerModel
 from engine.account import AccountState
@@ -435,6 +436,18 @@ class BacktestEngine:
         # Track trades per day: {date: count}
         self._trades_per_day: Dict[pd.Timestamp, int] = {}
     
+    def load_data(self, file_path: Union[Path, str]) -> pd.DataFrame:
+        """
+        Load OHLCV data from a CSV or Parquet file.
+        
+        Args:
+            file_path: Path to data file
+            
+        Returns:
+            DataFrame with datetime index and OHLCV columns
+        """
+        return self.data_loader.load(Path(file_path))
+    
     def run(
         self,
         data: Union[Path, pd.DataFrame],
@@ -454,9 +467,10 @@ class BacktestEngine:
         """
         # Load and prepare data
         if isinstance(data, Path) or isinstance(data, str):
-            df_base = self.data_loader.load(Path(data))
+            df_base = self.load_data(data)
         else:
-            df_base = data.copy()
+            # Under Copy-on-Write a shallow copy already protects the caller's frame
+            df_base = data.copy(deep=not copy_on_write_enabled())
         
         # Filter by date if provided
         if start_date is not None:
@@ -0,0 +1,35 @@
+"""Optional Numba JIT compilation shared by the engine and validation kernels.
+
+When numba is not installed, njit returns the function unchanged and prange
+is range, so kernels still run as plain Python. Callers with a NumPy
+equivalent should check NUMBA_AVAILABLE and use it instead of the Python loop.
+"""
+
+try:
+    from numba import njit, prange, threading_layer
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+def parallel_threads_started() -> bool:
+    """True once a parallel kernel has started Numba's worker threads.
+    
+    Numba's threading layers are not fork-safe: a process forked after they
+    start can hang, so process pools must not use the 'fork' start method.
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+    try:
+        threading_layer()
+    except ValueError:
+        # Raised until the threading layer has been initialized
+        return False
+    return True
@@ -1,19 +1,61 @@
 """Live trading engine that executes strategies in real-time."""
 
+import functools
 import logging
+import queue
+import sys
+import threading
 import time
-from typing import Optional, Dict, Any, Tuple
-from datetime import datetime
-import pandas as pd
+from typing import Optional, Dict, Any, Tuple, List, Callable, Union
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
 from strategies.base import StrategyBase
-from adapters.execution.binance_futures import BinanceFuturesAdapter, Position as AdapterPosition
+from adapters.execution.binance_futures import (
+    BATCH_ORDER_LIMIT,
+    BinanceFuturesAdapter,
+    AccountBalance,
+    Position as AdapterPosition,
+    TransientAPIError,
+    FatalAPIError
+)
 from engine.market import MarketSpec
 from engine.account import AccountState
 from engine.broker import BrokerModel
 
 logger = logging.getLogger(__name__)
 
+# Retries for TransientAPIError on calls that are safe to repeat
+_MAX_RETRIES = 1
+_RETRY_BACKOFF_S = 0.05
+
+# Order side that offsets an entry side ('BUY'/'SELL') or position side ('LONG'/'SHORT')
+_OPPOSITE_SIDE: Dict[str, str] = {
+    'BUY': 'SELL',
+    'SELL': 'BUY',
+    'LONG': 'SELL',
+    'SHORT': 'BUY'
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Signal:
+    """Trading signal passed from a strategy to the live engine."""
+    action: str  # 'BUY', 'SELL', 'CLOSE' or 'UPDATE_STOP'
+    quantity: float = 0.0
+    stop_price: Optional[float] = None
+    target_price: Optional[float] = None
+    
+    @classmethod
+    def from_dict(cls, signal: Dict[str, Any]) -> 'Signal':
+        """Build a Signal from the legacy dict form."""
+        return cls(
+            action=signal.get('action') or '',
+            quantity=signal.get('quantity') or 0.0,
+            stop_price=signal.get('stop_price'),
+            target_price=signal.get('target_price')
+        )
+
 
 class LiveTradingEngine:
     """Engine for live trading with real-time execution."""
@@ -25,7 +67,9 @@ class LiveTradingEngine:
         market_spec: MarketSpec,
         initial_capital: float = 10000.0,
         max_daily_loss_pct: float = 5.0,
-        max_drawdown_pct: float = 15.0
+        max_drawdown_pct: float = 15.0,
+        cache_ttl_s: float = 0.25,
+        reconcile_interval_s: float = 60.0
     ):
         """
         Initialize live trading engine.
@@ -37,6 +81,10 @@ class LiveTradingEngine:
             initial_capital: Starting capital
             max_daily_loss_pct: Maximum daily loss percentage before stopping
             max_drawdown_pct: Maximum drawdown percentage before stopping
+            cache_ttl_s: Seconds a fetched balance/position snapshot is reused
+                before hitting the exchange again
+            reconcile_interval_s: Seconds between REST position reconciliations
+                while the user-data stream is running
         """
         self.strategy = strategy
         self.adapter = adapter
@@ -44,31 +92,265 @@ class LiveTradingEngine:
         self.initial_capital = initial_capital
         self.max_daily_loss_pct = max_daily_loss_pct
         self.max_drawdown_pct = max_drawdown_pct
+        self.cache_ttl_s = cache_ttl_s
+        self.reconcile_interval_s = reconcile_interval_s
+        
+        # Margin per (price, quantity) rounded to the market's precision;
+        # call clear_margin_cache() if market_spec parameters change
+        self._margin_cached = functools.lru_cache(maxsize=4096)(self.market_spec.calculate_margin)
         
         # Initialize account and broker
         self.account = AccountState(initial_capital)
         self.broker = BrokerModel(market_spec)
         
         # Trading state
-        self.symbol = market_spec.symbol
+        # Interned so position/stop dict keys share this object and lookups
+        # resolve on identity rather than a string compare
+        self.symbol = sys.intern(market_spec.symbol)
         self.active_positions: Dict[str, AdapterPosition] = {}
         self.active_stop_orders: Dict[str, str] = {}  # position_id -> stop_order_id
         self.daily_pnl = 0.0
-        self.daily_start_balance = initial_capital
         self.peak_equity = initial_capital
         
+        # Safety limits as equity thresholds, so the per-signal check is a plain compare
+        self._dd_factor = 1.0 - max_drawdown_pct / 100.0
+        self._set_daily_start_balance(initial_capital)
+        
+        # Signal action -> handler(signal, current_price, current_time)
+        self._signal_handlers: Dict[str, Callable[[Signal, float, datetime], None]] = {
+            'BUY': self._process_entry_signal,
+            'SELL': self._process_entry_signal,
+            'CLOSE': self._handle_close_signal,
+            'UPDATE_STOP': self._handle_update_stop_signal
+        }
+        
+        # Set when the exchange returns a non-retryable error; blocks new signals
+        self.halt_reason: Optional[str] = None
+        
         # Statistics
         self.trades_executed = 0
         self.trades_skipped = 0
         
+        # Short-lived REST snapshots: (monotonic timestamp, value)
+        self._balance_cache: Optional[Tuple[float, AccountBalance]] = None
+        self._status_cache: Optional[Tuple[tuple, Dict[str, Any]]] = None
+        self._positions_cache: Optional[Tuple[float, List[AdapterPosition]]] = None
+        
+        # User-data stream state: active_positions is mirrored from stream events
+        # and only reconciled over REST every reconcile_interval_s
+        self._positions_lock = threading.Lock()
+        self._user_stream_active = False
+        self._last_reconcile = float('-inf')
+        
+        # Order submission worker: when running, order I/O is queued and executed
+        # in FIFO order off the signal thread; otherwise it runs inline
+        self._order_queue: "queue.Queue[Optional[Tuple[Callable, tuple]]]" = queue.Queue()
+        self._order_worker: Optional[threading.Thread] = None
+        self._pending_entry = False
+        
+        # UTC-midnight daily loss reset, scheduled so signals never check the date
+        self._rollover_timer: Optional[threading.Timer] = None
+    
+    def clear_margin_cache(self):
+        """Forget memoized margin requirements (after changing market_spec)."""
+        self._margin_cached = functools.lru_cache(maxsize=4096)(self.market_spec.calculate_margin)
+    
+    def _retry(self, fn: Callable, *args, **kwargs):
+        """Call an adapter method, retrying TransientAPIError with exponential backoff.
+        
+        Only for calls that are safe to repeat (reads, cancels, reduce-only orders).
+        """
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                return fn(*args, **kwargs)
+            except TransientAPIError as e:
+                if attempt == _MAX_RETRIES:
+                    raise
+                delay = _RETRY_BACKOFF_S * 2 ** attempt
+                logger.warning("Transient API error (%s), retrying in %.2fs", e, delay)
+                time.sleep(delay)
+    
+    def _halt(self, reason: str):
+        """Stop accepting signals after a non-retryable exchange error."""
+        self.halt_reason = reason
+        logger.error("Trading halted: %s", reason)
+    
+    def start_order_worker(self):
+        """Start the background thread that submits orders to the exchange."""
+        if self._order_worker is not None:
+            return
+        self._order_worker = threading.Thread(
+            target=self._order_worker_loop,
+            name=f"order-worker-{self.symbol}",
+            daemon=True
+        )
+        self._order_worker.start()
+    
+    def stop_order_worker(self):
+        """Drain queued orders and stop the worker; later orders run inline."""
+        if self._order_worker is None:
+            return
+        self._order_queue.put(None)
+        self._order_worker.join()
+        self._order_worker = None
+    
+    def _order_worker_loop(self):
+        """Execute queued order actions until the stop sentinel arrives."""
+        while True:
+            item = self._order_queue.get()
+            if item is None:
+                break
+            fn, args = item
+            try:
+                fn(*args)
+            except (TransientAPIError, FatalAPIError):
+                # Keep the worker alive on exchange errors; anything else is a
+                # bug and ends the thread through threading.excepthook
+                logger.exception("Order worker action %s failed", fn.__name__)
+            finally:
+                # Only one entry is in flight at a time, so it is always this one
+                if fn == self._execute_entry:
+                    self._pending_entry = False
+    
+    def _submit(self, fn: Callable, *args):
+        """Run an order action on the worker if it is running, else inline."""
+        if self._order_worker is not None and self._order_worker.is_alive():
+            self._order_queue.put((fn, args))
+        else:
+            fn(*args)
+    
+    def start_user_stream(self) -> bool:
+        """Start mirroring positions from the exchange user-data stream.
+        
+        Returns:
+            True if the stream is running (False in paper mode, where
+            update_positions keeps polling the local paper state)
+        """
+        self._user_stream_active = self.adapter.start_user_stream(self._on_user_event)
+        if self._user_stream_active:
+            logger.info("Position updates streaming for %s", self.symbol)
+        return self._user_stream_active
+    
+    def stop_user_stream(self):
+        """Stop the user-data stream and fall back to REST polling."""
+        self._user_stream_active = False
+        self.adapter.stop_user_stream()
+    
+    def _on_user_event(self, msg: Dict[str, Any]):
+        """Apply a user-data stream event (runs on the stream thread)."""
+        event = msg.get('e')
+        
+        if event == 'ACCOUNT_UPDATE':
+            with self._positions_lock:
+                positions = dict(self.active_positions)
+                for pos_data in msg.get('a', {}).get('P', []):
+                    symbol = pos_data.get('s')
+                    if symbol != self.symbol:
+                        continue
+                    size = float(pos_data.get('pa', 0))
+                    if abs(size) > 0.0001:
+                        positions[self.symbol] = AdapterPosition(
+                            symbol=self.symbol,
+                            side='LONG' if size > 0 else 'SHORT',
+                            size=abs(size),
+                            entry_price=float(pos_data.get('ep', 0)),
+                            unrealized_pnl=float(pos_data.get('up', 0))
+                        )
+                    else:
+                        positions.pop(self.symbol, None)
+                self.active_positions = positions
+            self._balance_cache = None
+        elif event == 'ORDER_TRADE_UPDATE':
+            # Fills move the balance; position changes arrive via ACCOUNT_UPDATE
+            self._balance_cache = None
+        elif event == 'error':
+            logger.warning("User-data stream error, falling back to REST polling: %s", msg.get('m'))
+            self._user_stream_active = False
+    
+    def _cached_balance(self) -> AccountBalance:
+        """Get account balance, reusing the last fetch if within cache_ttl_s."""
+        now = time.monotonic()
+        cached = self._balance_cache
+        if cached is not None and now - cached[0] < self.cache_ttl_s:
+            return cached[1]
+        
+        balance = self._retry(self.adapter.get_account_balance)
+        self._balance_cache = (now, balance)
+        return balance
+    
+    def _cached_positions(self) -> List[AdapterPosition]:
+        """Get open positions, reusing the last fetch if within cache_ttl_s."""
+        now = time.monotonic()
+        cached = self._positions_cache
+        if cached is not None and now - cached[0] < self.cache_ttl_s:
+            return cached[1]
+        
+        positions = self._retry(self.adapter.get_positions, self.symbol)
+        self._positions_cache = (now, positions)
+        return positions
+    
+    def _invalidate_cache(self):
+        """Drop cached account state so the next read reflects a fresh order/cancel."""
+        self._balance_cache = None
+        self._positions_cache = None
+        # Reconcile once after our own orders rather than wait for the stream
+        self._last_reconcile = float('-inf')
+        
     def update_positions(self):
-        """Update active positions from exchange."""
-        positions = self.adapter.get_positions(self.symbol)
-        self.active_positions = {pos.symbol: pos for pos in positions if abs(pos.size) > 0.0001}
+        """Update active positions from exchange.
         
-        # Update account with unrealized P&L
-        total_unrealized = sum(pos.unrealized_pnl for pos in self.active_positions.values())
-        # Note: In live trading, we track this separately from account equity
+        While the user-data stream is running, positions are kept current by
+        stream events and this only reconciles over REST every
+        reconcile_interval_s to correct drift.
+        """
+        now = time.monotonic()
+        if self._user_stream_active and now - self._last_reconcile < self.reconcile_interval_s:
+            return
+        
+        positions = self._cached_positions()
+        active = {sys.intern(pos.symbol): pos for pos in positions if abs(pos.size) > 0.0001}
+        with self._positions_lock:
+            self.active_positions = active
+        self._last_reconcile = now
+    
+    @property
+    def unrealized_pnl(self) -> float:
+        """Unrealized P&L across active positions (computed on access)."""
+        return sum(pos.unrealized_pnl for pos in self.active_positions.values())
+        
+    def _set_daily_start_balance(self, balance: float):
+        """Set the balance daily loss is measured from and its stop-equity threshold."""
+        self.daily_start_balance = balance
+        self._daily_stop_equity = balance * (1.0 - self.max_daily_loss_pct / 100.0)
+        
+    def start_daily_rollover(self):
+        """Schedule the daily loss baseline to reset at each UTC midnight."""
+        now = datetime.now(timezone.utc)
+        next_midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        self._rollover_timer = threading.Timer(
+            (next_midnight - now).total_seconds(),
+            self._roll_daily
+        )
+        self._rollover_timer.daemon = True
+        self._rollover_timer.start()
+    
+    def stop_daily_rollover(self):
+        """Cancel the scheduled daily reset."""
+        if self._rollover_timer is not None:
+            self._rollover_timer.cancel()
+            self._rollover_timer = None
+    
+    def _roll_daily(self):
+        """Start a new trading day from the current balance and reschedule."""
+        try:
+            self._balance_cache = None
+            self._set_daily_start_balance(self._cached_balance().total_balance)
+            self.daily_pnl = 0.0
+            logger.info("Daily loss baseline reset: %s", self.daily_start_balance)
+        except (TransientAPIError, FatalAPIError) as e:
+            logger.error("Failed to reset daily loss baseline: %s", e)
+        finally:
+            self.start_daily_rollover()
         
     def check_safety_limits(self) -> Tuple[bool, Optional[str]]:
         """Check if safety limits are exceeded.
@@ -76,194 +358,298 @@ class LiveTradingEngine:
         Returns:
             (should_stop, reason)
         """
-        balance = self.adapter.get_account_balance()
-        current_equity = balance.total_balance
+        current_equity = self._cached_balance().total_balance
         
         # Check daily loss
-        daily_loss_pct = ((self.daily_start_balance - current_equity) / self.daily_start_balance) * 100
-        if daily_loss_pct >= self.max_daily_loss_pct:
+        if current_equity <= self._daily_stop_equity:
+            daily_loss_pct = ((self.daily_start_balance - current_equity) / self.daily_start_balance) * 100
             return True, f"Daily loss limit exceeded: {daily_loss_pct:.2f}%"
         
         # Check drawdown
         if current_equity > self.peak_equity:
             self.peak_equity = current_equity
         
-        drawdown_pct = ((self.peak_equity - current_equity) / self.peak_equity) * 100
-        if drawdown_pct >= self.max_drawdown_pct:
+        if current_equity <= self.peak_equity * self._dd_factor:
+            drawdown_pct = ((self.peak_equity - current_equity) / self.peak_equity) * 100
             return True, f"Drawdown limit exceeded: {drawdown_pct:.2f}%"
         
         return False, None
     
-    def process_signal(self, signal: Dict[str, Any], current_price: float, current_time: pd.Timestamp):
+    def process_signal(
+        self,
+        signal: Union[Signal, Dict[str, Any]],
+        current_price: float,
+        current_time: datetime
+    ):
         """Process a trading signal from the strategy.
         
         Args:
-            signal: Signal dict with 'action' ('BUY', 'SELL', 'CLOSE'), 'quantity', etc.
+            signal: Signal (or legacy dict with 'action', 'quantity', etc.)
             current_price: Current market price
             current_time: Current timestamp
         """
-        action = signal.get('action')
-        if not action:
+        if isinstance(signal, dict):
+            signal = Signal.from_dict(signal)
+        if not signal.action:
+            return
+        
+        if self.halt_reason is not None:
+            logger.warning("Trading halted: %s", self.halt_reason)
             return
         
         # Check safety limits
         should_stop, reason = self.check_safety_limits()
         if should_stop:
-            logger.warning(f"Trading stopped: {reason}")
+            logger.warning("Trading stopped: %s", reason)
             return
         
         # Update positions
         self.update_positions()
         
-        # Handle different actions
-        if action == 'CLOSE':
-            self._close_all_positions()
-        elif action in ['BUY', 'SELL']:
-            self._process_entry_signal(signal, current_price, current_time)
-        elif action == 'UPDATE_STOP':
-            self._update_stop_loss(signal, current_price)
+        # Handle different actions (order I/O goes through _submit)
+        handler = self._signal_handlers.get(signal.action)
+        if handler is not None:
+            handler(signal, current_price, current_time)
+    
+    def _handle_close_signal(self, signal: Signal, current_price: float, current_time: datetime):
+        """Handle a CLOSE signal."""
+        self._submit(self._close_all_positions)
+    
+    def _handle_update_stop_signal(
+        self,
+        signal: Signal,
+        current_price: float,
+        current_time: datetime
+    ):
+        """Handle an UPDATE_STOP signal."""
+        self._submit(self._update_stop_loss, signal, current_price)
     
     def _process_entry_signal(
         self,
-        signal: Dict[str, Any],
+        signal: Signal,
         current_price: float,
-        current_time: pd.Timestamp
+        current_time: datetime
     ):
         """Process an entry signal."""
-        action = signal.get('action')  # 'BUY' or 'SELL'
-        quantity = signal.get('quantity')
-        stop_price = signal.get('stop_price')
-        target_price = signal.get('target_price')
+        action = signal.action  # 'BUY' or 'SELL'
+        stop_price = signal.stop_price
         
-        if not quantity or quantity <= 0:
-            logger.warning(f"Invalid quantity in signal: {quantity}")
+        # Quantize once so the margin check and the order use the same size
+        quantity = round(signal.quantity or 0.0, self.market_spec.quantity_precision)
+        if quantity <= 0:
+            logger.warning("Invalid quantity in signal: %s", signal.quantity)
             return
         
-        # Check if we already have a position
-        if self.symbol in self.active_positions:
-            logger.info(f"Position already exists for {self.symbol}, skipping entry")
+        # Check if we already have a position (or an entry still in flight)
+        if self.symbol in self.active_positions or self._pending_entry:
+            logger.info("Position already exists for %s, skipping entry", self.symbol)
             self.trades_skipped += 1
             return
         
         # Check balance
-        balance = self.adapter.get_account_balance()
+        balance = self._cached_balance()
         if balance.available_balance <= 0:
             logger.warning("Insufficient balance for trade")
             self.trades_skipped += 1
             return
         
         # Calculate margin required
-        margin_required = self.market_spec.calculate_margin(current_price, quantity)
+        margin_required = self._margin_cached(
+            round(current_price, self.market_spec.price_precision),
+            quantity
+        )
         if margin_required > balance.available_balance:
-            logger.warning(f"Insufficient margin: required {margin_required}, available {balance.available_balance}")
+            logger.warning(
+                "Insufficient margin: required %s, available %s",
+                margin_required, balance.available_balance
+            )
             self.trades_skipped += 1
             return
         
-        # Place entry order
+        side = 'BUY' if action == 'BUY' else 'SELL'
+        self._pending_entry = True
+        self._submit(self._execute_entry, side, quantity, stop_price, current_price)
+    
+    def _execute_entry(
+        self,
+        side: str,
+        quantity: float,
+        stop_price: Optional[float],
+        current_price: float
+    ):
+        """Place the entry market order and its stop loss.
+        
+        The entry is not retried: after a transient failure its fill state is
+        unknown and a resend could double the position.
+        """
         try:
-            side = 'BUY' if action == 'BUY' else 'SELL'
             order = self.adapter.place_market_order(
                 symbol=self.symbol,
                 side=side,
                 quantity=quantity
             )
+            self._invalidate_cache()
             
-            logger.info(f"Entry order placed: {side} {quantity} {self.symbol} @ {current_price}")
+            logger.info(
+                "Entry order placed: %s %s %s @ %s",
+                side, quantity, self.symbol, current_price
+            )
             self.trades_executed += 1
             
             # Place stop loss if provided
             if stop_price:
                 self._place_stop_loss(quantity, stop_price, side)
             
-        except Exception as e:
-            logger.error(f"Failed to place entry order: {e}")
+        except TransientAPIError as e:
+            logger.error("Failed to place entry order: %s", e)
+            self.trades_skipped += 1
+        except FatalAPIError as e:
             self.trades_skipped += 1
+            self._halt(f"Entry order rejected: {e}")
+        finally:
+            self._pending_entry = False
     
     def _place_stop_loss(self, quantity: float, stop_price: float, entry_side: str):
         """Place a stop loss order."""
         try:
             # Stop order side is opposite of entry
-            stop_side = 'SELL' if entry_side == 'BUY' else 'BUY'
+            stop_side = _OPPOSITE_SIDE[entry_side]
             
-            stop_order = self.adapter.place_stop_market_order(
+            stop_order = self._retry(
+                self.adapter.place_stop_market_order,
                 symbol=self.symbol,
                 side=stop_side,
                 quantity=quantity,
                 stop_price=stop_price,
                 reduce_only=True
             )
+            self._invalidate_cache()
             
             self.active_stop_orders[self.symbol] = stop_order.order_id
-            logger.info(f"Stop loss placed: {stop_side} {quantity} {self.symbol} @ {stop_price}")
+            logger.info(
+                "Stop loss placed: %s %s %s @ %s",
+                stop_side, quantity, self.symbol, stop_price
+            )
             
-        except Exception as e:
-            logger.error(f"Failed to place stop loss: {e}")
+        except TransientAPIError as e:
+            logger.error("Failed to place stop loss: %s", e)
+        except FatalAPIError as e:
+            self._halt(f"Stop loss rejected: {e}")
     
-    def _update_stop_loss(self, signal: Dict[str, Any], current_price: float):
+    def _update_stop_loss(self, signal: Signal, current_price: float):
         """Update stop loss (trailing stop)."""
-        if self.symbol not in self.active_positions:
+        with self._positions_lock:
+            position = self.active_positions.get(self.symbol)
+        if position is None:
             return
         
-        new_stop_price = signal.get('stop_price')
+        new_stop_price = signal.stop_price
         if not new_stop_price:
             return
         
-        # Cancel old stop order
-        if self.symbol in self.active_stop_orders:
-            try:
-                self.adapter.cancel_order(self.symbol, self.active_stop_orders[self.symbol])
-            except Exception as e:
-                logger.warning(f"Failed to cancel old stop order: {e}")
-        
-        # Place new stop order
-        position = self.active_positions[self.symbol]
-        stop_side = 'SELL' if position.side == 'LONG' else 'BUY'
+        stop_side = _OPPOSITE_SIDE[position.side]
+        old_order_id = self.active_stop_orders.get(self.symbol)
         
         try:
-            stop_order = self.adapter.place_stop_market_order(
-                symbol=self.symbol,
-                side=stop_side,
-                quantity=position.size,
-                stop_price=new_stop_price,
-                reduce_only=True
-            )
+            if old_order_id is not None:
+                # Replace in one step so the position is never unprotected
+                stop_order = self._retry(
+                    self.adapter.modify_stop_order,
+                    symbol=self.symbol,
+                    order_id=old_order_id,
+                    side=stop_side,
+                    quantity=position.size,
+                    new_stop_price=new_stop_price
+                )
+            else:
+                stop_order = self._retry(
+                    self.adapter.place_stop_market_order,
+                    symbol=self.symbol,
+                    side=stop_side,
+                    quantity=position.size,
+                    stop_price=new_stop_price,
+                    reduce_only=True
+                )
+            self._invalidate_cache()
             
             self.active_stop_orders[self.symbol] = stop_order.order_id
-            logger.info(f"Stop loss updated: {stop_side} {position.size} {self.symbol} @ {new_stop_price}")
+            logger.info(
+                "Stop loss updated: %s %s %s @ %s",
+                stop_side, position.size, self.symbol, new_stop_price
+            )
             
-        except Exception as e:
-            logger.error(f"Failed to update stop loss: {e}")
+        except TransientAPIError as e:
+            logger.error("Failed to update stop loss: %s", e)
+        except FatalAPIError as e:
+            self._halt(f"Stop loss update rejected: {e}")
     
     def _close_all_positions(self):
         """Close all open positions."""
-        for symbol, position in self.active_positions.items():
+        # Runs on the order worker: snapshot under the lock the stream thread writes with
+        with self._positions_lock:
+            positions = list(self.active_positions.items())
+        
+        # Close positions with batched reduce-only market orders
+        close_orders = [
+            {
+                'symbol': symbol,
+                'side': _OPPOSITE_SIDE[position.side],
+                'quantity': position.size
+            }
+            for symbol, position in positions
+        ]
+        # Each chunk is one batch request, retried on its own so chunks that
+        # already went through are never resent
+        for start in range(0, len(close_orders), BATCH_ORDER_LIMIT):
             try:
-                side = 'SELL' if position.side == 'LONG' else 'BUY'
-                self.adapter.place_market_order(
-                    symbol=symbol,
-                    side=side,
-                    quantity=position.size,
+                closed = self._retry(
+                    self.adapter.place_batch_market_orders,
+                    close_orders[start:start + BATCH_ORDER_LIMIT],
                     reduce_only=True
                 )
-                logger.info(f"Closed position: {side} {position.size} {symbol}")
-            except Exception as e:
-                logger.error(f"Failed to close position {symbol}: {e}")
+                for order in closed:
+                    logger.info(
+                        "Closed position: %s %s %s",
+                        order.side, order.quantity, order.symbol
+                    )
+            except (TransientAPIError, FatalAPIError) as e:
+                logger.error("Failed to close positions: %s", e)
         
-        # Cancel all stop orders
+        # Cancel only the stop orders this engine placed, batched per symbol
+        stops_by_symbol: Dict[str, List[str]] = {}
         for symbol, order_id in self.active_stop_orders.items():
+            stops_by_symbol.setdefault(symbol, []).append(order_id)
+        for symbol, order_ids in stops_by_symbol.items():
             try:
-                self.adapter.cancel_order(symbol, order_id)
-            except Exception as e:
-                logger.warning(f"Failed to cancel stop order {order_id}: {e}")
+                self._retry(self.adapter.cancel_orders, symbol, order_ids)
+            except (TransientAPIError, FatalAPIError) as e:
+                logger.warning("Failed to cancel stop orders %s: %s", order_ids, e)
         
-        self.active_positions.clear()
+        with self._positions_lock:
+            self.active_positions = {}
         self.active_stop_orders.clear()
+        self._invalidate_cache()
     
     def get_status(self) -> Dict[str, Any]:
-        """Get current trading status."""
-        balance = self.adapter.get_account_balance()
+        """Get current trading status.
+        
+        The dict is rebuilt only when one of its inputs changed since the last
+        call, so callers must treat it as read-only.
+        """
+        balance = self._cached_balance()
+        key = (
+            balance,
+            len(self.active_positions),
+            self.trades_executed,
+            self.trades_skipped,
+            self.daily_start_balance,
+            self.halt_reason
+        )
+        cached = self._status_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         
-        return {
+        status = {
             'balance': balance.total_balance,
             'available': balance.available_balance,
             'margin_used': balance.margin_used,
@@ -272,6 +658,9 @@ class LiveTradingEngine:
             'trades_executed': self.trades_executed,
             'trades_skipped': self.trades_skipped,
             'daily_pnl': balance.total_balance - self.daily_start_balance,
+            'halt_reason': self.halt_reason,
             'paper_mode': self.adapter.paper_mode
         }
+        self._status_cache = (key, status)
+        return status
 
@@ -6,13 +6,164 @@ This module implements the industry-standard separation of concerns:
 - Broker: Whether the trade is allowed (margin checks, position validation)
 """
 
-from dataclasses import dataclass
-from typing import Optional, Literal
+import functools
+import json
+from dataclasses import dataclass, field
+from math import fabs
+from typing import Callable, Optional, Literal
 from pathlib import Path
+import numpy as np
 import yaml
 
+from engine._market_math import pnl_batch, margin_leverage_batch, margin_fixed_batch
 
-@dataclass
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Position side as a P&L sign
+_DIRECTION_SIGN = {'long': 1.0, 'short': -1.0}
+
+# Profile keys read by MarketSpec.from_market_profile, with their fallbacks
+_FIELD_DEFAULTS = (
+    ('exchange', 'unknown'),
+    ('asset_class', 'crypto'),
+    ('market_type', 'spot'),
+    ('leverage', 1.0),
+    ('contract_size', None),
+    ('pip_value', None),
+    ('min_trade_size', 0.01),
+    ('price_precision', 5),
+    ('quantity_precision', 2),
+    ('commission_rate', 0.0004),
+    ('commission_per_contract', None),
+    ('slippage_ticks', 0.0),
+    ('initial_margin_per_contract', None),
+    ('intraday_margin_per_contract', None),
+    ('maintenance_margin_rate', None),
+    ('margin_mode', 'cross'),
+)
+
+# Entries kept per MarketSpec for USD-base pip values
+_PIP_CACHE_SIZE = 32
+
+# Shared MarketSpec instances handed out by MarketSpec.get
+_SPEC_POOL: dict[tuple, 'MarketSpec'] = {}
+
+_DEFAULT_PROFILES_PATH = Path(__file__).parent.parent / "config" / "market_profiles.yml"
+
+# libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_profiles_file(path: str, mtime_ns: int) -> dict:
+    """Parse a market profiles file (.yml or .json) once per (path, modification time).
+    
+    The returned dict is shared between callers and must not be mutated.
+    """
+    if path.endswith('.json'):
+        with open(path, 'rb') as f:
+            return _json_loads(f.read())
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def export_profiles_json(profiles_path: Optional[Path] = None) -> Path:
+    """Write a JSON copy of market_profiles.yml next to it.
+    
+    load_from_profiles prefers the JSON copy while it is at least as new as
+    the YAML file, which skips the YAML parse at startup.
+    
+    Args:
+        profiles_path: Path to market_profiles.yml (defaults to config/market_profiles.yml)
+        
+    Returns:
+        Path of the written JSON file
+    """
+    if profiles_path is None:
+        profiles_path = _DEFAULT_PROFILES_PATH
+    profiles_path = Path(profiles_path)
+    json_path = profiles_path.with_suffix('.json')
+    
+    with open(profiles_path, 'r') as f:
+        profiles = yaml.load(f, Loader=_YamlLoader)
+    with open(json_path, 'w') as f:
+        json.dump(profiles, f, indent=2)
+    return json_path
+
+
+def _resolve_profiles_file(profiles_path: Path) -> tuple[str, int]:
+    """Pick the profiles file to parse: a fresh JSON sibling if present, else the path itself."""
+    mtime_ns = profiles_path.stat().st_mtime_ns
+    if profiles_path.suffix in ('.yml', '.yaml'):
+        json_path = profiles_path.with_suffix('.json')
+        try:
+            json_mtime_ns = json_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            pass
+        else:
+            if json_mtime_ns >= mtime_ns:
+                return str(json_path), json_mtime_ns
+    return str(profiles_path), mtime_ns
+
+
+# Margin implementations; MarketSpec binds one of each kind in __post_init__
+
+def _margin_fixed_intraday(spec, entry_price, quantity, is_intraday):
+    # Traditional futures with a day trading margin (lower) and an overnight margin
+    if is_intraday:
+        return fabs(quantity) * spec.intraday_margin_per_contract
+    return fabs(quantity) * spec.initial_margin_per_contract
+
+
+def _margin_fixed_overnight(spec, entry_price, quantity, is_intraday):
+    # Traditional futures: Fixed margin per contract (CME, ICE, etc.)
+    return fabs(quantity) * spec.initial_margin_per_contract
+
+
+def _margin_leverage_based(spec, entry_price, quantity, is_intraday):
+    # Binance-style futures and other asset classes: Margin = Notional Value / Leverage
+    return entry_price * fabs(quantity) * spec._inv_leverage
+
+
+def _maint_rate_based(spec, entry_price, quantity, current_price):
+    # Binance-style: Percentage of notional value
+    price = entry_price if current_price is None else current_price
+    return price * fabs(quantity) * spec.maintenance_margin_rate
+
+
+def _maint_fixed(spec, entry_price, quantity, current_price):
+    # Traditional futures: Use initial margin (maintenance typically same or lower)
+    # For simplicity, we use initial margin as maintenance margin
+    # In reality, maintenance might be lower, but this is conservative
+    return fabs(quantity) * spec.initial_margin_per_contract
+
+
+def _maint_leverage_based(spec, entry_price, quantity, current_price):
+    # Maintenance margin = initial margin (leverage-based, on the entry notional)
+    return entry_price * fabs(quantity) * spec._inv_leverage
+
+
+def _pick_margin_impl(spec):
+    if spec._is_futures and spec._has_fixed_margin:
+        if spec._has_intraday_margin:
+            return _margin_fixed_intraday
+        return _margin_fixed_overnight
+    return _margin_leverage_based
+
+
+def _pick_maint_impl(spec):
+    if spec._is_futures:
+        if spec._has_maint_rate:
+            return _maint_rate_based
+        if spec._has_fixed_margin:
+            return _maint_fixed
+    return _maint_leverage_based
+
+
+@dataclass(frozen=True, slots=True)
 class MarketSpec:
     """Market specification defining market-specific trading rules.
     
@@ -22,6 +173,8 @@ class MarketSpec:
     Key principle: Leverage only affects margin, NOT P&L.
     P&L is always calculated as: (price_change) * quantity
     
+    Instances are immutable; use dataclasses.replace() to derive a modified spec.
+    
     Attributes:
         symbol: Trading symbol (e.g., 'EURUSD', 'BTCUSDT')
         exchange: Exchange name (e.g., 'oanda', 'binance')
@@ -54,6 +207,41 @@ class MarketSpec:
     maintenance_margin_rate: Optional[float] = None  # Maintenance margin rate (e.g., 0.005 for 0.5%) for Binance-style futures
     margin_mode: Literal["isolated", "cross"] = "cross"  # Margin mode: isolated (per position) or cross (account-wide)
     
+    # Derived from the fields above in __post_init__
+    _is_futures: bool = field(init=False, repr=False, compare=False)
+    _has_fixed_margin: bool = field(init=False, repr=False, compare=False)
+    _has_intraday_margin: bool = field(init=False, repr=False, compare=False)
+    _has_maint_rate: bool = field(init=False, repr=False, compare=False)
+    _inv_leverage: float = field(init=False, repr=False, compare=False)
+    _usd_is_base: bool = field(init=False, repr=False, compare=False)
+    _pip_size: float = field(init=False, repr=False, compare=False)
+    _pip_value_per_lot_fixed: float = field(init=False, repr=False, compare=False)
+    _pip_cache: dict = field(init=False, repr=False, compare=False)
+    _margin_fn: Callable = field(init=False, repr=False, compare=False)
+    _maint_fn: Callable = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute flags used by the margin calculations on every call."""
+        set_ = object.__setattr__
+        set_(self, '_is_futures', self.asset_class == 'futures')
+        set_(self, '_has_fixed_margin', self.initial_margin_per_contract is not None)
+        set_(self, '_has_intraday_margin', self.intraday_margin_per_contract is not None)
+        set_(self, '_has_maint_rate', self.maintenance_margin_rate is not None)
+        set_(self, '_inv_leverage', 1.0 / self.leverage)
+        
+        # Pip value per lot: constant unless USD is the base currency (USDJPY, USDCHF)
+        is_forex_lot = self.asset_class == 'forex' and self.contract_size is not None
+        usd_is_quote = self.symbol.endswith('USD')
+        is_jpy_pair = 'JPY' in self.symbol
+        set_(self, '_usd_is_base', is_forex_lot and not usd_is_quote and self.symbol.startswith('USD'))
+        set_(self, '_pip_size', 0.01 if is_jpy_pair else (self.pip_value or 0.0001))
+        set_(self, '_pip_value_per_lot_fixed', 10.0 if is_forex_lot else 0.0)
+        set_(self, '_pip_cache', {})
+        
+        # The margin rules never change for a spec, so pick the implementations once
+        set_(self, '_margin_fn', _pick_margin_impl(self))
+        set_(self, '_maint_fn', _pick_maint_impl(self))
+    
     def calculate_margin(self, entry_price: float, quantity: float, is_intraday: bool = True) -> float:
         """Calculate margin required for a position.
         
@@ -71,27 +259,31 @@ class MarketSpec:
         Returns:
             Margin required in cash units
         """
-        # For futures, check if using fixed margin (traditional) or leverage-based (Binance-style)
-        if self.asset_class == 'futures':
-            # Traditional futures: Fixed margin per contract (CME, ICE, etc.)
-            if self.initial_margin_per_contract is not None:
-                if is_intraday and self.intraday_margin_per_contract is not None:
-                    # Use day trading margin (lower)
-                    return abs(quantity) * self.intraday_margin_per_contract
-                else:
-                    # Use initial margin (overnight)
-                    return abs(quantity) * self.initial_margin_per_contract
-            else:
-                # Binance-style futures: Leverage-based margin
-                # Margin = Notional Value / Leverage
-                notional_value = entry_price * abs(quantity)
-                margin = notional_value / self.leverage
-                return margin
+        return self._margin_fn(self, entry_price, quantity, is_intraday)
+    
+    def calculate_margin_vec(
+        self,
+        entry_prices: np.ndarray,
+        quantities: np.ndarray,
+        is_intraday: bool = True
+    ) -> np.ndarray:
+        """Calculate margin required for many positions at once.
+        
+        Vectorized form of calculate_margin.
         
-        # For other asset classes (forex, crypto spot, stocks), use leverage-based calculation
-        notional_value = entry_price * abs(quantity)
-        margin = notional_value / self.leverage
-        return margin
+        Args:
+            entry_prices: Entry price per position
+            quantities: Position quantity per position
+            is_intraday: True for intraday/day trading (uses lower margin for traditional futures)
+            
+        Returns:
+            Array of margin requirements in cash units
+        """
+        if self._is_futures and self._has_fixed_margin:
+            if is_intraday and self._has_intraday_margin:
+                return margin_fixed_batch(quantities, self.intraday_margin_per_contract)
+            return margin_fixed_batch(quantities, self.initial_margin_per_contract)
+        return margin_leverage_batch(entry_prices, quantities, self._inv_leverage)
     
     def calculate_maintenance_margin(
         self,
@@ -116,24 +308,7 @@ class MarketSpec:
         Returns:
             Maintenance margin required
         """
-        price = current_price or entry_price
-        notional_value = price * abs(quantity)
-        
-        if self.asset_class == 'futures':
-            if self.maintenance_margin_rate is not None:
-                # Binance-style: Percentage of notional value
-                return notional_value * self.maintenance_margin_rate
-            elif self.initial_margin_per_contract is not None:
-                # Traditional futures: Use initial margin (maintenance typically same or lower)
-                # For simplicity, we use initial margin as maintenance margin
-                # In reality, maintenance might be lower, but this is conservative
-                return abs(quantity) * self.initial_margin_per_contract
-            else:
-                # Fallback: Use initial margin calculation
-                return self.calculate_margin(entry_price, quantity)
-        
-        # For other assets, maintenance margin = initial margin
-        return self.calculate_margin(entry_price, quantity)
+        return self._maint_fn(self, entry_price, quantity, current_price)
     
     def calculate_unrealized_pnl(
         self,
@@ -156,10 +331,31 @@ class MarketSpec:
         Returns:
             Unrealized P&L (positive = profit, negative = loss)
         """
-        if direction == 'long':
-            return (current_price - entry_price) * quantity
-        else:  # short
-            return (entry_price - current_price) * quantity
+        # Anything other than 'long' is treated as short
+        return (current_price - entry_price) * quantity * _DIRECTION_SIGN.get(direction, -1.0)
+    
+    @staticmethod
+    def calculate_pnl_signed(
+        entry_price: float,
+        current_price: float,
+        quantity: float,
+        direction_sign: float
+    ) -> float:
+        """Calculate P&L with the side given as a sign (+1 long, -1 short).
+        
+        Same result as calculate_unrealized_pnl without the direction lookup;
+        use it where the side is already held as a sign.
+        
+        Args:
+            entry_price: Entry price
+            current_price: Current (or exit) price
+            quantity: Position quantity
+            direction_sign: +1 for long, -1 for short
+            
+        Returns:
+            P&L (positive = profit, negative = loss)
+        """
+        return (current_price - entry_price) * quantity * direction_sign
     
     def calculate_realized_pnl(
         self,
@@ -181,7 +377,30 @@ class MarketSpec:
         Returns:
             Realized P&L (positive = profit, negative = loss)
         """
-        return self.calculate_unrealized_pnl(entry_price, exit_price, quantity, direction)
+        return (exit_price - entry_price) * quantity * _DIRECTION_SIGN.get(direction, -1.0)
+    
+    def calculate_unrealized_pnl_vec(
+        self,
+        entry_prices: np.ndarray,
+        current_prices: np.ndarray,
+        quantities: np.ndarray,
+        direction_signs: np.ndarray
+    ) -> np.ndarray:
+        """Calculate unrealized P&L for many positions at once.
+        
+        Vectorized form of calculate_unrealized_pnl for marking a whole set of
+        positions (or an equity curve) to market in one call.
+        
+        Args:
+            entry_prices: Entry price per position
+            current_prices: Current market price per position (or per bar)
+            quantities: Position quantity per position
+            direction_signs: +1 for long, -1 for short
+            
+        Returns:
+            Array of unrealized P&L values
+        """
+        return pnl_batch(entry_prices, current_prices, quantities, direction_signs)
     
     def calculate_pip_value_per_lot(self, entry_price: float) -> float:
         """Calculate pip value per standard lot for forex pairs.
@@ -199,25 +418,21 @@ class MarketSpec:
         Returns:
             Pip value per standard lot in USD
         """
-        if self.asset_class != 'forex' or self.contract_size is None:
-            # For non-forex or if contract_size not set, return 0
-            return 0.0
-        
-        # For major pairs where USD is quote (EURUSD, GBPUSD, AUDUSD, etc.)
-        # 1 pip = $10 per standard lot
-        if 'USD' in self.symbol[-3:]:  # USD is quote currency
-            return 10.0  # $10 per pip per standard lot
-        
         # For pairs where USD is base (USDJPY, USDCHF, etc.)
         # Pip value = (contract_size × pip_size) / entry_price
-        if self.symbol.startswith('USD'):
-            pip_size = self.pip_value or 0.0001
-            if 'JPY' in self.symbol:  # JPY pairs use 0.01 for pip
-                pip_size = 0.01
-            return (self.contract_size * pip_size) / entry_price
-        
-        # Default: assume USD is quote
-        return 10.0
+        # Tick streams repeat prices, so recent results are kept (FIFO, exact price keys)
+        if self._usd_is_base:
+            cache = self._pip_cache
+            value = cache.get(entry_price)
+            if value is None:
+                if len(cache) >= _PIP_CACHE_SIZE:
+                    cache.pop(next(iter(cache)), None)
+                value = cache[entry_price] = (self.contract_size * self._pip_size) / entry_price
+            return value
+        
+        # USD is quote (EURUSD, GBPUSD, ...) or assumed so: $10 per pip per standard lot.
+        # 0 for non-forex or if contract_size not set.
+        return self._pip_value_per_lot_fixed
     
     def calculate_pip_value_per_unit(self, entry_price: float) -> float:
         """Calculate pip value per unit (not per lot) for forex pairs.
@@ -317,6 +532,39 @@ class MarketSpec:
         quantity = risk_amount / (stop_loss_pips * pip_value_per_unit)
         return quantity
     
+    def quantities_from_risk(
+        self,
+        risk_amounts: np.ndarray,
+        stop_loss_pips: np.ndarray,
+        entry_price: float
+    ) -> np.ndarray:
+        """Calculate quantities for many (risk, stop loss) candidates at one entry price.
+        
+        Vectorized form of calculate_quantity_from_risk: the pip value is
+        computed once and broadcast over the candidates.
+        
+        Args:
+            risk_amounts: Amount to risk in USD per candidate (or a scalar)
+            stop_loss_pips: Stop loss distance in pips per candidate
+            entry_price: Entry price (needed for USD base pairs)
+            
+        Returns:
+            Position quantities in units (0 where the stop loss is not positive)
+        """
+        risk_amounts, stop_loss_pips = np.broadcast_arrays(
+            np.asarray(risk_amounts, dtype=np.float64),
+            np.asarray(stop_loss_pips, dtype=np.float64)
+        )
+        quantities = np.zeros(risk_amounts.shape)
+        
+        pip_value_per_unit = self.calculate_pip_value_per_unit(entry_price)
+        if self.asset_class != 'forex' or pip_value_per_unit <= 0:
+            return quantities
+        
+        valid = stop_loss_pips > 0
+        quantities[valid] = risk_amounts[valid] / (stop_loss_pips[valid] * pip_value_per_unit)
+        return quantities
+    
     def lot_size_to_units(self, lot_size: float) -> float:
         """Convert lot size to units (quantity).
         
@@ -350,32 +598,37 @@ class MarketSpec:
         Returns:
             MarketSpec instance
         """
-        # Merge with asset class defaults if provided
-        merged = {}
-        if asset_class_defaults:
-            merged.update(asset_class_defaults)
-        merged.update(profile)
-        
-        # Extract required fields
-        return cls(
-            symbol=symbol,
-            exchange=merged.get('exchange', 'unknown'),
-            asset_class=merged.get('asset_class', 'crypto'),
-            market_type=merged.get('market_type', 'spot'),
-            leverage=merged.get('leverage', 1.0),
-            contract_size=merged.get('contract_size'),
-            pip_value=merged.get('pip_value'),
-            min_trade_size=merged.get('min_trade_size', 0.01),
-            price_precision=merged.get('price_precision', 5),
-            quantity_precision=merged.get('quantity_precision', 2),
-            commission_rate=merged.get('commission_rate', 0.0004),
-            commission_per_contract=merged.get('commission_per_contract'),
-            slippage_ticks=merged.get('slippage_ticks', 0.0),
-            initial_margin_per_contract=merged.get('initial_margin_per_contract'),
-            intraday_margin_per_contract=merged.get('intraday_margin_per_contract'),
-            maintenance_margin_rate=merged.get('maintenance_margin_rate'),
-            margin_mode=merged.get('margin_mode', 'cross')
-        )
+        # Profile values take precedence over asset class defaults
+        defaults = asset_class_defaults or {}
+        values = {
+            key: profile.get(key, defaults.get(key, default))
+            for key, default in _FIELD_DEFAULTS
+        }
+        return cls(symbol=symbol, **values)
+    
+    @classmethod
+    def get(cls, symbol: str, profiles_path: Optional[Path] = None) -> 'MarketSpec':
+        """Get the shared MarketSpec for a symbol.
+        
+        Returns the same instance for every call with the same arguments, for
+        the lifetime of the process. Unlike load_from_profiles, the profiles file
+        is not checked again after the first load.
+        
+        Args:
+            symbol: Trading symbol
+            profiles_path: Path to market_profiles.yml (defaults to config/market_profiles.yml)
+            
+        Returns:
+            MarketSpec instance
+            
+        Raises:
+            ValueError: If symbol not found in profiles
+        """
+        key = (cls, symbol, profiles_path)
+        spec = _SPEC_POOL.get(key)
+        if spec is None:
+            spec = _SPEC_POOL[key] = cls.load_from_profiles(symbol, profiles_path)
+        return spec
     
     @classmethod
     def load_from_profiles(
@@ -385,6 +638,9 @@ class MarketSpec:
     ) -> 'MarketSpec':
         """Load MarketSpec from market_profiles.yml.
         
+        A market_profiles.json written by export_profiles_json() is used instead
+        when it is at least as new as the YAML file.
+        
         Args:
             symbol: Trading symbol
             profiles_path: Path to market_profiles.yml (defaults to config/market_profiles.yml)
@@ -396,13 +652,20 @@ class MarketSpec:
             ValueError: If symbol not found in profiles
         """
         if profiles_path is None:
-            profiles_path = Path(__file__).parent.parent / "config" / "market_profiles.yml"
+            profiles_path = _DEFAULT_PROFILES_PATH
         
-        if not profiles_path.exists():
-            raise ValueError(f"Market profiles file not found: {profiles_path}")
+        try:
+            path, mtime_ns = _resolve_profiles_file(Path(profiles_path))
+        except FileNotFoundError:
+            raise ValueError(f"Market profiles file not found: {profiles_path}") from None
         
-        with open(profiles_path, 'r') as f:
-            profiles = yaml.safe_load(f)
+        return cls._load_cached(symbol, path, mtime_ns)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_cached(cls, symbol: str, profiles_path: str, mtime_ns: int) -> 'MarketSpec':
+        """Build the MarketSpec for load_from_profiles; cached per profiles file version."""
+        profiles = _load_profiles_file(profiles_path, mtime_ns)
         
         markets = profiles.get('markets', {})
         asset_class_defaults = profiles.get('asset_class_defaults', {})
@@ -448,6 +711,12 @@ class Broker:
     market_spec: MarketSpec
     margin_call_level: float = 1.0  # Margin call when equity < margin_used * margin_call_level
     
+    def __post_init__(self):
+        # Cash needed per unit of notional at the market's default commission rate
+        self._inv_lev_plus_default_comm = (
+            self.market_spec._inv_leverage + self.market_spec.commission_rate
+        )
+    
     def calculate_margin_required(self, entry_price: float, quantity: float) -> float:
         """Calculate margin required for a position.
         
@@ -479,13 +748,61 @@ class Broker:
             Tuple of (can_afford, required_cash)
             required_cash = margin + commission
         """
-        margin = self.calculate_margin_required(entry_price, quantity)
+        required_cash = self.required_cash_for(entry_price, quantity, commission_rate)
+        return required_cash <= available_cash, required_cash
+    
+    def required_cash_for(
+        self,
+        entry_price: float,
+        quantity: float,
+        commission_rate: Optional[float] = None
+    ) -> float:
+        """Calculate cash required to open a position (margin + commission).
+        
+        Use this in order-validation loops and compare against available cash
+        directly; can_afford_position wraps it.
+        
+        Args:
+            entry_price: Entry price
+            quantity: Position quantity
+            commission_rate: Commission rate (uses market_spec if None)
+            
+        Returns:
+            Required cash
+        """
+        commission_rate = commission_rate or self.market_spec.commission_rate
+        margin = self.market_spec.calculate_margin(entry_price, quantity)
+        return margin + entry_price * abs(quantity) * commission_rate
+    
+    def can_afford_batch(
+        self,
+        entry_prices: np.ndarray,
+        quantities: np.ndarray,
+        available_cash: float,
+        commission_rate: Optional[float] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Check many candidate positions against the same available cash.
+        
+        Vectorized form of can_afford_position, e.g. for entry checks across a
+        portfolio of symbols sharing this market spec.
+        
+        Args:
+            entry_prices: Entry price per candidate
+            quantities: Quantity per candidate
+            available_cash: Available cash in account
+            commission_rate: Commission rate (uses market_spec if None)
+            
+        Returns:
+            Tuple of (can_afford, required_cash) arrays
+            required_cash = margin + commission
+        """
         commission_rate = commission_rate or self.market_spec.commission_rate
-        commission = entry_price * quantity * commission_rate
-        required_cash = margin + commission
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        quantities = np.asarray(quantities, dtype=np.float64)
         
-        can_afford = required_cash <= available_cash
-        return can_afford, required_cash
+        margin = self.market_spec.calculate_margin_vec(entry_prices, quantities)
+        required_cash = margin + entry_prices * np.abs(quantities) * commission_rate
+        return required_cash <= available_cash, required_cash
     
     def check_margin_call(
         self,
@@ -541,16 +858,17 @@ class Broker:
         Returns:
             Adjusted quantity that fits available cash
         """
-        commission_rate = commission_rate or self.market_spec.commission_rate
-        
         # Solve: margin + commission = cash
         # (price * qty) / leverage + price * qty * commission_rate = cash
         # qty * price * (1/leverage + commission_rate) = cash
         # qty = cash / (price * (1/leverage + commission_rate))
         
-        max_affordable_qty = available_cash / (
-            entry_price * (1.0 / self.market_spec.leverage + commission_rate)
-        )
+        if commission_rate:
+            cash_per_notional = self.market_spec._inv_leverage + commission_rate
+        else:
+            cash_per_notional = self._inv_lev_plus_default_comm
+        
+        max_affordable_qty = available_cash / (entry_price * cash_per_notional)
         
         return min(desired_quantity, max_affordable_qty)
 
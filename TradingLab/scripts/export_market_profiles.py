@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Write config/market_profiles.json from market_profiles.yml for faster startup."""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.market_spec import export_profiles_json
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export market profiles to JSON (re-run after editing the YAML file)'
+    )
+    parser.add_argument(
+        '--profiles',
+        type=Path,
+        default=None,
+        help='Path to market_profiles.yml (default: config/market_profiles.yml)'
+    )
+    args = parser.parse_args()
+    
+    json_path = export_profiles_json(args.profiles)
+    print(f"Wrote {json_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -342,6 +342,19 @@ Examples:
         max_drawdown_pct=args.max_drawdown_pct
     )
     
+    # Submit orders from a background worker so the loop never blocks on REST
+    engine.start_order_worker()
+    
+    # Reset the daily loss limit at each UTC midnight
+    engine.start_daily_rollover()
+    
+    # Mirror positions from the user-data stream instead of polling each update
+    try:
+        if engine.start_user_stream():
+            logger.info("✓ Subscribed to user-data stream")
+    except Exception as e:
+        logger.warning(f"User-data stream unavailable, polling positions over REST: {e}")
+    
     logger.info("="*60)
     logger.info("LIVE TRADING ENGINE STARTED")
     logger.info("="*60)
@@ -420,7 +433,10 @@ Examples:
     finally:
         # Close all positions on exit
         logger.info("Closing all positions...")
+        engine.stop_daily_rollover()
+        engine.stop_order_worker()
         engine._close_all_positions()
+        engine.stop_user_stream()
         
         # Final status
         status = engine.get_status()
@@ -2,6 +2,7 @@
 """Run Phase 1: Training Validation on training data only."""
 
 import argparse
+import logging
 import sys
 from pathlib import Path
 import pandas as pd
@@ -120,6 +121,9 @@ Examples:
     
     args = parser.parse_args()
     
+    # Show the validator's suitability report on the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     # Load strategy
     strategy_dir = Path(__file__).parent.parent / 'strategies' / args.strategy
     if not strategy_dir.exists():
@@ -1,20 +1,53 @@
 """Base strategy interface that all strategies must implement."""
 
+import functools
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+import numpy as np
 import pandas as pd
 from config.schema import StrategyConfig
 from strategies.filters import FilterManager
-from strategies.filters.base import FilterContext
+from strategies.filters.base import DIRECTION_SIGN, FilterContext
 import yaml
 from pathlib import Path
 
 if TYPE_CHECKING:
     from engine.market import MarketSpec
 
+SIGNAL_DIRECTION_DTYPE = pd.CategoricalDtype(['long', 'short'])
+
+MASTER_FILTERS_PATH = Path(__file__).parent.parent.parent / 'config' / 'master_filters.yml'
+
+
+@functools.lru_cache(maxsize=4)
+def _load_master_filters(path: str, mtime_ns: int) -> Optional[Dict]:
+    """Parse the master filter config once per (path, modification time).
+    
+    The returned dict is shared; FilterManager copies it before merging.
+    """
+    try:
+        with open(path, 'r') as f:
+            master_data = yaml.safe_load(f)
+            return master_data.get('master_filters', {})
+    except Exception:
+        # If master config can't be loaded, continue without it
+        return None
+
 
 class StrategyBase(ABC):
-    """Abstract base class for all trading strategies."""
+    """Abstract base class for all trading strategies.
+    
+    Instance state is declared in __slots__. Subclasses that add no attributes
+    should declare `__slots__ = ()`; those that do get a __dict__ as usual.
+    """
+    
+    __slots__ = ('config', 'name', 'filter_manager', '_market_spec_cache', '_ctx', '_blackout')
+    
+    # Max threads prepare_data uses to compute timeframes concurrently
+    # (None = one per timeframe, capped at the CPU count; 1 = sequential)
+    indicator_workers: Optional[int] = None
     
     def __init__(self, config: StrategyConfig):
         """
@@ -29,6 +62,22 @@ class StrategyBase(ABC):
         # Initialize filter manager
         self.filter_manager: Optional[FilterManager] = None
         self._initialize_filters()
+        
+        # MarketSpecs loaded by apply_filters, per symbol
+        self._market_spec_cache: Dict[str, "MarketSpec"] = {}
+        
+        # FilterContext reused by apply_filters (not thread-safe; parallel
+        # callers should use apply_filters_batch)
+        self._ctx = FilterContext(
+            timestamp=None,
+            symbol=config.market.symbol,
+            signal_direction=1,
+            signal_data=None,
+            df_by_tf={}
+        )
+        
+        # Blackout mask from precompute_blackout_mask: (index, symbol, mask)
+        self._blackout: Optional[Tuple[pd.DatetimeIndex, str, np.ndarray]] = None
     
     @abstractmethod
     def generate_signals(self, df_by_tf: Dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -93,16 +142,34 @@ class StrategyBase(ABC):
         """
         Prepare data by computing indicators for each timeframe.
         
+        Timeframes are independent, so they are computed on a thread pool
+        (pandas/NumPy release the GIL in most indicator kernels). get_indicators
+        must therefore not modify shared strategy state; set indicator_workers = 1
+        on strategies where it does.
+        
         Args:
             df_by_tf: Dictionary mapping timeframe strings to DataFrames
         
         Returns:
             Dictionary with indicators computed for each timeframe
         """
-        prepared = {}
-        for tf, df in df_by_tf.items():
-            prepared[tf] = self.get_indicators(df.copy(), tf=tf)
-        return prepared
+        # Import here to avoid circular import at module level
+        from engine._pandas_compat import copy_on_write_enabled
+        
+        # Under Copy-on-Write a shallow copy is enough to protect the caller's frames;
+        # data is only copied if get_indicators modifies existing columns
+        deep = not copy_on_write_enabled()
+        
+        workers = self.indicator_workers or min(len(df_by_tf), os.cpu_count() or 1)
+        if workers <= 1 or len(df_by_tf) <= 1:
+            return {tf: self.get_indicators(df.copy(deep=deep), tf=tf) for tf, df in df_by_tf.items()}
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                tf: pool.submit(self.get_indicators, df.copy(deep=deep), tf=tf)
+                for tf, df in df_by_tf.items()
+            }
+            return {tf: future.result() for tf, future in futures.items()}
     
     def _validate_dataframe(self, df: pd.DataFrame, required_cols: list[str] = None) -> None:
         """
@@ -130,16 +197,19 @@ class StrategyBase(ABC):
         Create empty signal DataFrame with correct schema.
         
         Returns:
-            Empty DataFrame with signal columns
+            Empty DataFrame with signal columns and their dtypes set, so
+            appending or concatenating signals does not re-infer them
         """
-        return pd.DataFrame(columns=[
-            'timestamp',
-            'direction',
-            'entry_price',
-            'stop_price',
-            'weight',
-            'metadata'
-        ]).set_index('timestamp')
+        return pd.DataFrame(
+            {
+                'direction': pd.Series(dtype=SIGNAL_DIRECTION_DTYPE),
+                'entry_price': pd.Series(dtype='float64'),
+                'stop_price': pd.Series(dtype='float64'),
+                'weight': pd.Series(dtype='float64'),
+                'metadata': pd.Series(dtype='object'),
+            },
+            index=pd.DatetimeIndex([], dtype='datetime64[ns]', name='timestamp')
+        )
     
     def _initialize_filters(self) -> None:
         """
@@ -148,17 +218,13 @@ class StrategyBase(ABC):
         This method loads the master filter configuration and merges it with
         strategy-specific filter configuration.
         """
-        # Load master config if available
-        master_config = None
-        master_config_path = Path(__file__).parent.parent.parent / 'config' / 'master_filters.yml'
-        if master_config_path.exists():
-            try:
-                with open(master_config_path, 'r') as f:
-                    master_data = yaml.safe_load(f)
-                    master_config = master_data.get('master_filters', {})
-            except Exception:
-                # If master config can't be loaded, continue without it
-                master_config = None
+        # Load master config if available (parsed once per file version)
+        try:
+            mtime_ns = MASTER_FILTERS_PATH.stat().st_mtime_ns
+        except FileNotFoundError:
+            master_config = None
+        else:
+            master_config = _load_master_filters(str(MASTER_FILTERS_PATH), mtime_ns)
         
         # Create filter manager
         self.filter_manager = FilterManager(
@@ -166,6 +232,36 @@ class StrategyBase(ABC):
             strategy_config=self.config
         )
     
+    def precompute_blackout_mask(self, index: pd.DatetimeIndex, symbol: str) -> np.ndarray:
+        """
+        Evaluate time blackout filters for a whole index up front.
+        
+        Call this before a signal generation loop over `index`; afterwards
+        _should_block_signal_generation answers with an array lookup for
+        timestamps in the index.
+        
+        Args:
+            index: Timestamps the loop will visit (assumed UTC+00)
+            symbol: Symbol to check
+            
+        Returns:
+            Boolean array, True where signal generation is blocked
+        """
+        mask = np.zeros(len(index), dtype=bool)
+        if self.filter_manager:
+            for filter_obj in self.filter_manager.filters:
+                if hasattr(filter_obj, 'batch_blocked_mask'):
+                    mask |= filter_obj.batch_blocked_mask(index, symbol)
+                elif hasattr(filter_obj, 'should_block_signal_generation'):
+                    mask |= np.fromiter(
+                        (filter_obj.should_block_signal_generation(ts, symbol) for ts in index),
+                        dtype=bool,
+                        count=len(index)
+                    )
+        
+        self._blackout = (index, symbol, mask)
+        return mask
+    
     def _should_block_signal_generation(self, timestamp: pd.Timestamp, symbol: str) -> bool:
         """
         Check if signal generation should be blocked at this timestamp.
@@ -183,6 +279,16 @@ class StrategyBase(ABC):
         if not self.filter_manager:
             return False
         
+        # Use the precomputed mask when the timestamp is in it
+        if self._blackout is not None and self._blackout[1] == symbol:
+            index, _, mask = self._blackout
+            try:
+                loc = index.get_loc(timestamp)
+            except KeyError:
+                pass
+            else:
+                return bool(mask[loc].any() if not isinstance(loc, int) else mask[loc])
+        
         # Check time blackout filters
         for filter_obj in self.filter_manager.filters:
             if hasattr(filter_obj, 'should_block_signal_generation'):
@@ -191,6 +297,20 @@ class StrategyBase(ABC):
         
         return False
     
+    def _load_market_spec(self, symbol: str) -> "MarketSpec":
+        """Load the MarketSpec for a symbol, falling back to a basic crypto spec."""
+        # Import here to avoid circular import at module level
+        from engine.market import MarketSpec
+        try:
+            return MarketSpec.load_from_profiles(symbol)
+        except (ValueError, FileNotFoundError):
+            # Fallback: create basic MarketSpec
+            return MarketSpec(
+                symbol=symbol,
+                exchange='unknown',
+                asset_class='crypto'  # Default fallback
+            )
+    
     def apply_filters(
         self,
         signal: pd.Series,
@@ -218,32 +338,57 @@ class StrategyBase(ABC):
         if not self.filter_manager:
             return True  # No filters = always pass
         
-        # Load MarketSpec if not provided
+        # Load MarketSpec if not provided (once per symbol)
         if market_spec is None:
-            # Import here to avoid circular import at module level
-            from engine.market import MarketSpec
-            try:
-                market_spec = MarketSpec.load_from_profiles(symbol)
-            except (ValueError, FileNotFoundError):
-                # Fallback: create basic MarketSpec
-                market_spec = MarketSpec(
-                    symbol=symbol,
-                    exchange='unknown',
-                    asset_class='crypto'  # Default fallback
-                )
-        
-        # Create filter context
-        context = FilterContext(
-            timestamp=timestamp,
-            symbol=symbol,
-            signal_direction=1 if signal.get('direction') == 'long' else -1,
-            signal_data=signal,
-            df_by_tf=df_by_tf,
-            market_spec=market_spec
-        )
+            market_spec = self._market_spec_cache.get(symbol)
+            if market_spec is None:
+                market_spec = self._market_spec_cache[symbol] = self._load_market_spec(symbol)
+        
+        # Refill the shared filter context
+        context = self._ctx
+        context.timestamp = timestamp
+        context.symbol = symbol
+        context.signal_direction = DIRECTION_SIGN.get(signal.get('direction'), -1)
+        context.signal_data = signal
+        context.df_by_tf = df_by_tf
+        context.market_spec = market_spec
+        # Fresh per signal so nothing a filter cached leaks into the next one
+        context.indicators = {}
         
         # Apply filters
         result = self.filter_manager.apply_filters(signal, context)
         return result.passed
+    
+    def apply_filters_batch(
+        self,
+        signals: pd.DataFrame,
+        symbol: str,
+        df_by_tf: Dict[str, pd.DataFrame],
+        market_spec: Optional["MarketSpec"] = None
+    ) -> np.ndarray:
+        """
+        Apply the filter chain to all signals at once.
+        
+        Batch counterpart of apply_filters; select the surviving signals with
+        `signals[mask]`.
+        
+        Args:
+            signals: Signal DataFrame indexed by timestamp
+            symbol: Trading symbol
+            df_by_tf: All timeframe data
+            market_spec: Optional MarketSpec (auto-loaded if None)
+            
+        Returns:
+            Boolean mask, True where the signal passed all filters
+        """
+        if not self.filter_manager:
+            return np.ones(len(signals), dtype=bool)  # No filters = always pass
+        
+        if market_spec is None:
+            market_spec = self._market_spec_cache.get(symbol)
+            if market_spec is None:
+                market_spec = self._market_spec_cache[symbol] = self._load_market_spec(symbol)
+        
+        return self.filter_manager.apply_filters_batch(signals, symbol, df_by_tf, market_spec)
 
 
@@ -3,19 +3,56 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Dict, Optional, TYPE_CHECKING
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
     from engine.market import MarketSpec
 
 
-@dataclass
+# Signal direction -> FilterContext.signal_direction. Integer keys let frames
+# that already carry +1/-1 pass straight through.
+DIRECTION_SIGN = {'long': 1, 'short': -1, 1: 1, -1: -1}
+
+
+def encode_directions(directions: pd.Series) -> np.ndarray:
+    """
+    Encode a signal 'direction' column as int8 (+1 long, -1 short).
+    
+    Categorical columns (see SIGNAL_DIRECTION_DTYPE) are encoded from their
+    codes without touching the strings; numeric columns are taken as signs.
+    """
+    if isinstance(directions.dtype, pd.CategoricalDtype):
+        signs = np.array([DIRECTION_SIGN.get(c, -1) for c in directions.cat.categories], dtype=np.int8)
+        codes = directions.cat.codes.to_numpy()
+        return np.where(codes >= 0, signs[codes], np.int8(-1)).astype(np.int8)
+    if pd.api.types.is_numeric_dtype(directions.dtype):
+        return np.where(directions.to_numpy() > 0, 1, -1).astype(np.int8)
+    return np.where(directions.to_numpy() == 'long', 1, -1).astype(np.int8)
+
+
+def bars_asof(df: pd.DataFrame, timestamp: pd.Timestamp) -> pd.DataFrame:
+    """
+    Bars of df up to and including timestamp.
+    
+    Same rows as `df[df.index <= timestamp]`, but a binary search plus a
+    positional slice instead of a full boolean mask, for sorted indexes.
+    """
+    if not df.index.is_monotonic_increasing:
+        return df[df.index <= timestamp]
+    return df.iloc[:df.index.searchsorted(timestamp, side='right')]
+
+
+@dataclass(slots=True)
 class FilterContext:
     """Context passed to filters for decision making.
     
     This context provides all information needed for filters to make decisions,
     including market data, signal information, and market specification for
     unit conversions.
+    
+    StrategyBase reuses one instance across signals, so filters must not keep
+    a reference to the context after check() returns.
     """
     timestamp: pd.Timestamp
     symbol: str
@@ -24,6 +61,13 @@ class FilterContext:
     df_by_tf: Dict[str, pd.DataFrame]  # All timeframe data
     indicators: Dict[str, pd.Series] = field(default_factory=dict)  # Pre-calculated indicators
     market_spec: Optional['MarketSpec'] = None  # Market specification for unit conversions
+    
+    def asof(self, tf: str) -> Optional[pd.DataFrame]:
+        """Bars of timeframe tf known at the signal timestamp, or None if tf is missing."""
+        df = self.df_by_tf.get(tf)
+        if df is None:
+            return None
+        return bars_asof(df, self.timestamp)
 
 
 @dataclass
@@ -90,6 +134,45 @@ class FilterBase(ABC):
         """
         pass
     
+    def evaluate_batch(
+        self,
+        signals: pd.DataFrame,
+        symbol: str,
+        df_by_tf: Dict[str, pd.DataFrame],
+        market_spec: Optional['MarketSpec'] = None
+    ) -> np.ndarray:
+        """
+        Check many signals at once.
+        
+        The default implementation calls `check` once per signal. Filters whose
+        decision can be computed column-wise should override this.
+        
+        Args:
+            signals: Signal DataFrame indexed by timestamp
+            symbol: Trading symbol
+            df_by_tf: All timeframe data
+            market_spec: Market specification for unit conversions
+            
+        Returns:
+            Boolean array, True where the signal passed
+        """
+        passed = np.ones(len(signals), dtype=bool)
+        if 'direction' in signals:
+            signs = encode_directions(signals['direction'])
+        else:
+            signs = np.full(len(signals), -1, dtype=np.int8)
+        for i, (timestamp, signal) in enumerate(signals.iterrows()):
+            context = FilterContext(
+                timestamp=timestamp,
+                symbol=symbol,
+                signal_direction=int(signs[i]),
+                signal_data=signal,
+                df_by_tf=df_by_tf,
+                market_spec=market_spec
+            )
+            passed[i] = self.check(context).passed
+        return passed
+    
     def is_enabled(self) -> bool:
         """
         Check if filter is enabled.
@@ -7,9 +7,12 @@ blocks signal generation during the specified time ranges.
 
 from strategies.filters.base import FilterBase, FilterContext, FilterResult
 from typing import List, Dict, Optional
+import numpy as np
 import pandas as pd
 from datetime import time
 
+_NS_PER_MINUTE = 60 * 1_000_000_000
+
 
 class TimeBlackoutSlot:
     """Individual time blackout slot configuration."""
@@ -127,6 +130,42 @@ class TimeBlackoutSlot:
             # Spans midnight (e.g., 23:00 to 08:00)
             return current_time >= self.start_time or current_time <= self.end_time
     
+    def batch_active(self, index: pd.DatetimeIndex, symbol: str) -> np.ndarray:
+        """
+        Vectorized is_active() over a whole DatetimeIndex.
+        
+        Args:
+            index: Timestamps to check (assumed UTC+00)
+            symbol: Symbol to check
+            
+        Returns:
+            Boolean array, True where the blackout is active
+        """
+        if (not self.enabled or self.start_time is None or self.end_time is None
+                or (self.symbols and symbol not in self.symbols)):
+            return np.zeros(len(index), dtype=bool)
+        
+        # Time of day in nanoseconds since midnight (keeps seconds, like timestamp.time())
+        time_of_day = (
+            ((np.asarray(index.hour, dtype=np.int64) * 60 + np.asarray(index.minute)) * 60
+             + np.asarray(index.second)) * 1_000_000_000
+            + np.asarray(index.microsecond) * 1_000 + np.asarray(index.nanosecond)
+        )
+        start = (self.start_time.hour * 60 + self.start_time.minute) * _NS_PER_MINUTE
+        end = (self.end_time.hour * 60 + self.end_time.minute) * _NS_PER_MINUTE
+        
+        if start <= end:
+            active = (time_of_day >= start) & (time_of_day <= end)
+        else:
+            # Spans midnight
+            active = (time_of_day >= start) | (time_of_day <= end)
+        
+        if self.days:
+            day_ints = [d for d in (self._day_name_to_int(name) for name in self.days) if d is not None]
+            active &= np.isin(np.asarray(index.weekday), day_ints)
+        
+        return active
+    
     def should_block_signal_generation(self, timestamp: pd.Timestamp, symbol: str) -> bool:
         """
         Check if signal generation should be blocked.
@@ -201,6 +240,10 @@ class TimeBlackoutFilter(FilterBase):
         
         return self._create_pass_result()
     
+    def evaluate_batch(self, signals, symbol, df_by_tf, market_spec=None) -> np.ndarray:
+        """Vectorized `check`: a signal passes unless a blackout slot is active at its timestamp."""
+        return ~self.batch_blocked_mask(pd.DatetimeIndex(signals.index), symbol)
+    
     def should_block_signal_generation(self, timestamp: pd.Timestamp, symbol: str) -> bool:
         """
         Check if signal generation should be blocked at this timestamp.
@@ -223,3 +266,23 @@ class TimeBlackoutFilter(FilterBase):
                 return True
         
         return False
+    
+    def batch_blocked_mask(self, index: pd.DatetimeIndex, symbol: str) -> np.ndarray:
+        """
+        Vectorized should_block_signal_generation() over a whole DatetimeIndex.
+        
+        Args:
+            index: Timestamps to check (assumed UTC+00)
+            symbol: Symbol to check
+            
+        Returns:
+            Boolean array, True where signal generation should be blocked
+        """
+        mask = np.zeros(len(index), dtype=bool)
+        if not self.enabled:
+            return mask
+        
+        for slot in self.slots:
+            mask |= slot.batch_active(index, symbol)
+        
+        return mask
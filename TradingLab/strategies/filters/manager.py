@@ -1,10 +1,16 @@
 """Filter manager for applying filter chain to signals."""
 
-from typing import List, Dict, Optional
-from strategies.filters.base import FilterBase, FilterContext, FilterResult
+import copy
+import logging
+from typing import List, Dict, Optional, TYPE_CHECKING
+from strategies.filters.base import DIRECTION_SIGN, FilterBase, FilterContext, FilterResult
 from config.schema import StrategyConfig
+import numpy as np
 import pandas as pd
 
+if TYPE_CHECKING:
+    from engine.market import MarketSpec
+
 
 class FilterManager:
     """Manages and applies filter chain to signals.
@@ -79,7 +85,8 @@ class FilterManager:
         Returns:
             Merged configuration dict
         """
-        merged = master.copy()
+        # Deep copy: the master config may be shared between managers and is merged into in place
+        merged = copy.deepcopy(master)
         
         if strategy is None:
             return merged
@@ -148,7 +155,7 @@ class FilterManager:
         # Update context with signal data
         context.signal_data = signal
         if 'direction' in signal:
-            context.signal_direction = 1 if signal['direction'] == 'long' else -1
+            context.signal_direction = DIRECTION_SIGN.get(signal['direction'], -1)
         
         # Ensure MarketSpec is available in context
         # Import MarketSpec here to avoid circular import at module level
@@ -187,6 +194,55 @@ class FilterManager:
         # All filters passed
         return FilterResult(passed=True)
     
+    def apply_filters_batch(
+        self,
+        signals: pd.DataFrame,
+        symbol: str,
+        df_by_tf: Dict[str, pd.DataFrame],
+        market_spec: Optional["MarketSpec"] = None
+    ) -> np.ndarray:
+        """
+        Apply all enabled filters to a whole signal DataFrame.
+        
+        Equivalent to calling apply_filters per signal: each filter only sees
+        the signals that passed the filters before it.
+        
+        Args:
+            signals: Signal DataFrame indexed by timestamp
+            symbol: Trading symbol
+            df_by_tf: All timeframe data
+            market_spec: Market specification for unit conversions
+            
+        Returns:
+            Boolean mask over signals, True where the signal passed all filters
+        """
+        passed = np.ones(len(signals), dtype=bool)
+        
+        for filter_obj in self.filters:
+            if not filter_obj.is_enabled():
+                continue
+            
+            alive = np.flatnonzero(passed)
+            if len(alive) == 0:
+                break
+            
+            result = filter_obj.evaluate_batch(signals.iloc[alive], symbol, df_by_tf, market_spec)
+            rejected = alive[~result]
+            if len(rejected):
+                passed[rejected] = False
+                # Track filter failures for debugging
+                if not hasattr(self, '_filter_failure_counts'):
+                    self._filter_failure_counts = {}
+                filter_name = filter_obj.name
+                self._filter_failure_counts[filter_name] = (
+                    self._filter_failure_counts.get(filter_name, 0) + len(rejected)
+                )
+                logging.getLogger(__name__).debug(
+                    f"Filter {filter_name} rejected {len(rejected)} of {len(alive)} signals"
+                )
+        
+        return passed
+    
     def _build_calendar_filters(self, config: Dict) -> List[FilterBase]:
         """Build calendar filter chain."""
         filters = []
@@ -4,7 +4,7 @@ This filter checks if volume is increasing on both middle and higher timeframes.
 Supports two modes: raw volume or volume oscillator.
 """
 
-from strategies.filters.base import FilterBase, FilterContext, FilterResult
+from strategies.filters.base import FilterBase, FilterContext, FilterResult, bars_asof
 import pandas as pd
 import numpy as np
 
@@ -73,7 +73,7 @@ class VolumeIncreasingFilter(FilterBase):
         """
         # Filter to bars up to and including the timestamp (if provided)
         if timestamp is not None:
-            df = df[df.index <= timestamp]
+            df = bars_asof(df, timestamp)
             if len(df) < 2:
                 return False, f"Not enough data for {tf_label} at timestamp {timestamp}"
         if self.mode == 'raw_volume':
@@ -24,6 +24,8 @@ class MeanReversionStrategy(StrategyBase):
     - _generate_mean_reversion_signal(): Generate mean-reversion signals
     """
     
+    __slots__ = ()
+    
     def __init__(self, config: StrategyConfig):
         """
         Initialize mean-reversion strategy.
@@ -62,6 +64,7 @@ class MeanReversionStrategy(StrategyBase):
             return self._create_signal_dataframe()
         
         df_signal = df_by_tf[signal_tf]
+        self.precompute_blackout_mask(df_signal.index, symbol)
         
         # Iterate through signal timeframe
         for idx, row in df_signal.iterrows():
@@ -23,6 +23,8 @@ class TrendStrategy(StrategyBase):
     - _generate_trend_signals(): Generate trend-following signals
     """
     
+    __slots__ = ()
+    
     def __init__(self, config: StrategyConfig):
         """
         Initialize trend strategy.
@@ -60,6 +62,7 @@ class TrendStrategy(StrategyBase):
             return self._create_signal_dataframe()
         
         df_signal = df_by_tf[signal_tf]
+        self.precompute_blackout_mask(df_signal.index, symbol)
         
         # Iterate through signal timeframe
         for idx, row in df_signal.iterrows():
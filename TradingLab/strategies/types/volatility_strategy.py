@@ -24,6 +24,8 @@ class VolatilityStrategy(StrategyBase):
     - _generate_volatility_signal(): Generate volatility-based signals
     """
     
+    __slots__ = ()
+    
     def __init__(self, config: StrategyConfig):
         """
         Initialize volatility strategy.
@@ -61,6 +63,7 @@ class VolatilityStrategy(StrategyBase):
             return self._create_signal_dataframe()
         
         df_signal = df_by_tf[signal_tf]
+        self.precompute_blackout_mask(df_signal.index, symbol)
         
         # Iterate through signal timeframe
         for idx, row in df_signal.iterrows():
@@ -0,0 +1,163 @@
+"""Tests for StrategyBase's filter entry points."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.schema import StrategyConfig
+from engine.market_spec import MarketSpec
+from strategies.filters.base import FilterBase, bars_asof
+from strategies.filters.calendar.time_blackout_filter import TimeBlackoutFilter
+from strategies.filters.regime.adx_filter import ADXFilter
+from tests.test_backtest import DummyStrategy
+
+
+CONFIG = {
+    "strategy_name": "test_strategy",
+    "market": {"exchange": "binance", "symbol": "BTCUSDT", "base_timeframe": "1m"},
+    "timeframes": {"signal_tf": "1h", "entry_tf": "15m"},
+    "moving_averages": {"ema5": {"enabled": True, "length": 5}},
+    "alignment_rules": {
+        "long": {"macd_bars_signal_tf": 1, "macd_bars_entry_tf": 2},
+        "short": {"macd_bars_signal_tf": 1, "macd_bars_entry_tf": 2},
+    },
+}
+
+SPEC = MarketSpec(symbol='BTCUSDT', exchange='binance', asset_class='crypto')
+
+
+def make_strategy(*filters) -> DummyStrategy:
+    strategy = DummyStrategy(StrategyConfig(**CONFIG))
+    strategy.filter_manager.filters = list(filters)
+    return strategy
+
+
+class CachingFilter(FilterBase):
+    """Stashes a value in context.indicators and records what it saw there."""
+
+    def __init__(self):
+        super().__init__({'enabled': True})
+        self.seen = []
+
+    def check(self, context):
+        self.seen.append(dict(context.indicators))
+        context.indicators['cached'] = context.timestamp
+        return self._create_pass_result()
+
+
+def test_apply_filters_starts_each_signal_with_empty_indicators():
+    caching = CachingFilter()
+    strategy = make_strategy(caching)
+    signal = pd.Series({'direction': 'long', 'entry_price': 100.0})
+
+    for ts in pd.date_range('2024-01-01', periods=3, freq='1h'):
+        assert strategy.apply_filters(signal, ts, 'BTCUSDT', {}, SPEC)
+
+    assert caching.seen == [{}, {}, {}]
+
+
+BLACKOUT = {
+    'enabled': True,
+    'slots': {
+        'slot_1': {'enabled': True, 'name': 'NY open', 'start_time': '13:00', 'end_time': '13:45',
+                   'days': ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']},
+        'slot_2': {'enabled': True, 'name': 'Overnight', 'start_time': '23:30', 'end_time': '00:15'},
+        'slot_3': {'enabled': True, 'name': 'Other symbol', 'start_time': '06:00', 'end_time': '07:00',
+                   'symbols': ['EURUSD']},
+        'slot_4': {'enabled': False, 'start_time': '09:00', 'end_time': '10:00'},
+    },
+}
+
+
+class ShortsOnlyBlackout(FilterBase):
+    """Blocks Sunday signal generation without a vectorized mask; rejects longs."""
+
+    def __init__(self):
+        super().__init__({'enabled': True})
+
+    def should_block_signal_generation(self, timestamp, symbol):
+        return timestamp.weekday() == 6
+
+    def check(self, context):
+        if context.signal_direction == 1:
+            return self._create_fail_result("longs disabled")
+        return self._create_pass_result()
+
+
+def test_precompute_blackout_mask_matches_scalar_checks():
+    # A week of minutes plus bars at odd seconds around the slot edges
+    index = pd.date_range('2024-01-06', periods=7 * 24 * 60, freq='1min').union(pd.DatetimeIndex([
+        '2024-01-08 13:45:00.5', '2024-01-08 13:45:30', '2024-01-08 00:15:59', '2024-01-08 12:59:59'
+    ]))
+    strategy = make_strategy(TimeBlackoutFilter(BLACKOUT), ShortsOnlyBlackout())
+
+    expected = np.array([strategy._should_block_signal_generation(ts, 'BTCUSDT') for ts in index])
+    mask = strategy.precompute_blackout_mask(index, 'BTCUSDT')
+
+    np.testing.assert_array_equal(mask, expected)
+    assert 0 < mask.sum() < len(index)
+    # Lookups now come from the mask; timestamps outside it still use the filters
+    assert [strategy._should_block_signal_generation(ts, 'BTCUSDT') for ts in index] == expected.tolist()
+    assert strategy._should_block_signal_generation(pd.Timestamp('2024-02-05 13:10'), 'BTCUSDT')
+    assert not strategy._should_block_signal_generation(pd.Timestamp('2024-02-05 13:50'), 'BTCUSDT')
+
+
+def test_precompute_blackout_mask_is_per_symbol():
+    index = pd.date_range('2024-01-08', periods=24 * 60, freq='1min')
+    strategy = make_strategy(TimeBlackoutFilter(BLACKOUT))
+
+    eurusd = strategy.precompute_blackout_mask(index, 'EURUSD')
+    assert eurusd.sum() > strategy.precompute_blackout_mask(index, 'BTCUSDT').sum()
+    # A mask built for another symbol is not used for EURUSD
+    assert strategy._should_block_signal_generation(pd.Timestamp('2024-01-08 06:30'), 'EURUSD')
+
+
+@pytest.mark.parametrize('direction_dtype', ['object', 'category', 'int8'])
+def test_apply_filters_batch_matches_per_signal(direction_dtype):
+    rng = np.random.default_rng(7)
+    n = 400
+    signals = pd.DataFrame({
+        'direction': rng.choice(['long', 'short'], n),
+        'entry_price': rng.uniform(90.0, 110.0, n),
+        'adx': np.where(rng.random(n) < 0.1, np.nan, rng.uniform(10.0, 40.0, n)),
+    }, index=pd.date_range('2024-01-05', periods=n, freq='17min'))
+    if direction_dtype == 'int8':
+        signals['direction'] = np.where(signals['direction'] == 'long', 1, -1).astype(np.int8)
+    else:
+        signals['direction'] = signals['direction'].astype(direction_dtype)
+
+    scalar, batch = (
+        make_strategy(TimeBlackoutFilter(BLACKOUT), ADXFilter({'enabled': True}), ShortsOnlyBlackout())
+        for _ in range(2)
+    )
+
+    expected = np.array([
+        scalar.apply_filters(signal, ts, 'BTCUSDT', {}, SPEC) for ts, signal in signals.iterrows()
+    ])
+    mask = batch.apply_filters_batch(signals, 'BTCUSDT', {}, SPEC)
+
+    np.testing.assert_array_equal(mask, expected)
+    assert 0 < mask.sum() < n
+    assert batch.filter_manager._filter_failure_counts == scalar.filter_manager._filter_failure_counts
+
+
+def test_apply_filters_batch_without_filter_manager():
+    strategy = make_strategy()
+    strategy.filter_manager = None
+    signals = pd.DataFrame({'direction': ['long', 'short']}, index=pd.date_range('2024-01-01', periods=2))
+    assert strategy.apply_filters_batch(signals, 'BTCUSDT', {}).tolist() == [True, True]
+
+
+@pytest.mark.parametrize('timestamp', [
+    '2023-12-31', '2024-01-01 00:00', '2024-01-01 05:30', '2024-01-01 05:37', '2024-01-01 10:00', '2024-01-03'
+])
+def test_bars_asof_matches_boolean_mask(timestamp):
+    timestamp = pd.Timestamp(timestamp)
+    index = pd.date_range('2024-01-01', periods=120, freq='5min')
+    df = pd.DataFrame({'close': np.arange(len(index), dtype=float)}, index=index)
+    # Repeated timestamps and an unsorted copy take the same rows
+    repeated = pd.concat([df, df.iloc[60:70]]).sort_index()
+    shuffled = df.sample(frac=1.0, random_state=0)
+
+    for frame in (df, repeated, shuffled):
+        pd.testing.assert_frame_equal(bars_asof(frame, timestamp), frame[frame.index <= timestamp])
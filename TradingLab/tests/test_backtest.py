@@ -9,58 +9,65 @@ from datetime import datetime
 
 from engine.backtest_engine import BacktestEngine, Trade, BacktestResult
 from strategies.base import StrategyBase
+from strategies.base.strategy_base import SIGNAL_DIRECTION_DTYPE
 from config.schema import StrategyConfig
 
 
 class DummyStrategy(StrategyBase):
     """Dummy strategy for testing."""
     
+    __slots__ = ()
+    
     def generate_signals(self, df_by_tf):
-        signals = self._create_signal_dataframe()
+        rows = []
         
         # Generate a simple signal
         if '1h' in df_by_tf and len(df_by_tf['1h']) > 0:
             df_1h = df_by_tf['1h']
             first_bar = df_1h.iloc[0]
             
-            signal = pd.Series({
+            rows.append({
+                'timestamp': df_1h.index[0],
                 'direction': 'long',
                 'entry_price': first_bar['close'],
                 'stop_price': first_bar['close'] * 0.99,  # 1% stop
                 'weight': 1.0,
                 'metadata': {}
-            }, name=df_1h.index[0])
-            
-            signals = pd.concat([signals, signal.to_frame().T])
-            signals = signals.set_index('timestamp') if 'timestamp' in signals.columns else signals
+            })
         
-        return signals
+        if not rows:
+            return self._create_signal_dataframe()
+        
+        # Build the frame once from the accumulated rows, with the empty frame's dtypes
+        return pd.DataFrame.from_records(rows, index='timestamp').astype({
+            'direction': SIGNAL_DIRECTION_DTYPE,
+            'entry_price': 'float64',
+            'stop_price': 'float64',
+            'weight': 'float64'
+        })
     
     def get_indicators(self, df):
         return df
 
 
 def create_test_csv(file_path: Path, n_bars=100):
-    """Create a test CSV file."""
-    dates = pd.date_range(start='2024-01-01 00:00:00', periods=n_bars, freq='1T')
-    np.random.seed(42)
+    """Create a test data file (Parquet if the path ends in .parquet, else CSV)."""
+    dates = pd.date_range(start='2024-01-01 00:00:00', periods=n_bars, freq='1min')
+    rng = np.random.default_rng(42)
     
-    base_price = 100.0
-    data = []
-    for i in range(n_bars):
-        change = np.random.randn() * 0.1
-        base_price += change
-        data.append({
-            'timestamp': dates[i],
-            'open': base_price,
-            'high': base_price * 1.001,
-            'low': base_price * 0.999,
-            'close': base_price * 1.0005,
-            'volume': np.random.randint(100, 1000),
-        })
-    
-    df = pd.DataFrame(data)
-    df.to_csv(file_path, index=False)
+    base_price = 100.0 + np.cumsum(rng.standard_normal(n_bars) * 0.1)
+    df = pd.DataFrame({
+        'timestamp': dates,
+        'open': base_price,
+        'high': base_price * 1.001,
+        'low': base_price * 0.999,
+        'close': base_price * 1.0005,
+        'volume': rng.integers(100, 1000, n_bars),
+    })
+    if file_path.suffix == '.parquet':
+        df.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
+    else:
+        df.to_csv(file_path, index=False)
     return file_path
 
 
@@ -85,9 +92,36 @@ def test_backtest_engine_initialization():
     assert engine.strategy == strategy
 
 
-def test_load_data():
+def test_dummy_signals_match_empty_schema():
+    """Signal frames with and without rows share the StrategyBase column dtypes."""
+    config = StrategyConfig(
+        strategy_name="test_strategy",
+        market={"exchange": "binance", "symbol": "BTCUSDT", "base_timeframe": "1m"},
+        timeframes={"signal_tf": "1h", "entry_tf": "15m"},
+        moving_averages={"ema5": {"enabled": True, "length": 5}},
+        alignment_rules={
+            "long": {"macd_bars_signal_tf": 1, "macd_bars_entry_tf": 2},
+            "short": {"macd_bars_signal_tf": 1, "macd_bars_entry_tf": 2},
+        },
+    )
+    strategy = DummyStrategy(config)
+    bars = pd.DataFrame(
+        {'close': [100.0, 101.0]},
+        index=pd.date_range('2024-01-01', periods=2, freq='1h')
+    )
+    
+    signals = strategy.generate_signals({'1h': bars})
+    empty = strategy.generate_signals({})
+    
+    assert len(signals) == 1 and len(empty) == 0
+    pd.testing.assert_series_equal(signals.dtypes, empty.dtypes)
+    assert signals['direction'].dtype == SIGNAL_DIRECTION_DTYPE
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_load_data(suffix):
     """Test data loading."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+    with tempfile.NamedTemporaryFile(mode='w', suffix=suffix, delete=False) as f:
         file_path = Path(f.name)
     
     try:
@@ -0,0 +1,191 @@
+"""Tests for the Binance Futures adapter's batch, stop-modify and error paths."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('binance')
+
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from adapters.execution.binance_futures import (
+    BATCH_CANCEL_LIMIT,
+    BATCH_ORDER_LIMIT,
+    BinanceFuturesAdapter,
+    FatalAPIError,
+    TransientAPIError,
+    _translate_api_error
+)
+
+
+def api_error(status: int, code: int) -> BinanceAPIException:
+    text = json.dumps({'code': code, 'msg': 'error'})
+    return BinanceAPIException(SimpleNamespace(text=text), status, text)
+
+
+@pytest.mark.parametrize('error, expected', [
+    (api_error(503, -1001), TransientAPIError),
+    (api_error(429, -1003), TransientAPIError),
+    (api_error(400, -1007), TransientAPIError),
+    (api_error(400, -2019), FatalAPIError),
+    (api_error(401, -2015), FatalAPIError),
+    (BinanceRequestException("Invalid Response"), TransientAPIError),
+    (RequestsConnectionError("reset"), TransientAPIError),
+])
+def test_translate_api_error(error, expected):
+    assert type(_translate_api_error(error)) is expected
+
+
+class FakeClient:
+    """python-binance client stand-in recording futures order calls."""
+
+    def __init__(self, reject=()):
+        self.reject = set(reject)
+        self.calls = []
+        self._next_id = 100
+
+    def _response(self, quantity):
+        self._next_id += 1
+        return {'orderId': self._next_id, 'origQty': str(quantity), 'status': 'NEW', 'updateTime': 0}
+
+    def futures_place_batch_order(self, batchOrders):
+        self.calls.append(('batch', batchOrders))
+        return [
+            {'code': -2019, 'msg': 'Margin is insufficient.'} if o['symbol'] in self.reject
+            else self._response(o['quantity'])
+            for o in batchOrders
+        ]
+
+    def futures_create_order(self, **params):
+        self.calls.append(('create', params))
+        return self._response(params['quantity'])
+
+    def futures_cancel_order(self, symbol, orderId):
+        self.calls.append(('cancel', symbol, orderId))
+        return {}
+
+    def futures_cancel_orders(self, symbol, orderIdList):
+        order_ids = json.loads(orderIdList)
+        self.calls.append(('cancel_batch', symbol, order_ids))
+        return [
+            {'code': -2011, 'msg': 'Unknown order sent.'} if str(i) in self.reject else {'orderId': i}
+            for i in order_ids
+        ]
+
+
+def paper_adapter() -> BinanceFuturesAdapter:
+    adapter = BinanceFuturesAdapter(paper_mode=True)
+    adapter.get_current_price = lambda symbol: 100.0
+    return adapter
+
+
+def live_adapter(client: FakeClient) -> BinanceFuturesAdapter:
+    adapter = BinanceFuturesAdapter(paper_mode=True)
+    adapter.paper_mode = False
+    adapter.client = client
+    return adapter
+
+
+def _orders(n):
+    return [{'symbol': f'SYM{i}', 'side': 'BUY' if i % 2 else 'SELL', 'quantity': 1.0 + i} for i in range(n)]
+
+
+def test_live_batch_orders_are_chunked_and_rejections_skipped():
+    n = 2 * BATCH_ORDER_LIMIT + 1
+    client = FakeClient(reject={'SYM1', f'SYM{BATCH_ORDER_LIMIT}'})
+    placed = live_adapter(client).place_batch_market_orders(_orders(n), reduce_only=True)
+
+    assert [len(batch) for _, batch in client.calls] == [BATCH_ORDER_LIMIT, BATCH_ORDER_LIMIT, 1]
+    sent = [o for _, batch in client.calls for o in batch]
+    assert [o['symbol'] for o in sent] == [f'SYM{i}' for i in range(n)]
+    assert {o['reduceOnly'] for o in sent} == {'true'}
+    assert {o['type'] for o in sent} == {'MARKET'}
+
+    expected = [o for o in _orders(n) if o['symbol'] not in client.reject]
+    assert [(o.symbol, o.side, o.quantity) for o in placed] == [
+        (o['symbol'], o['side'], o['quantity']) for o in expected
+    ]
+
+
+def test_paper_batch_orders_match_single_orders():
+    batch, single = paper_adapter(), paper_adapter()
+    orders = _orders(BATCH_ORDER_LIMIT + 2) + [{'symbol': 'SYM0', 'side': 'BUY', 'quantity': 0.5}]
+
+    placed = batch.place_batch_market_orders(orders)
+    expected = [single.place_market_order(o['symbol'], o['side'], o['quantity']) for o in orders]
+
+    assert [(o.symbol, o.side, o.quantity, o.status) for o in placed] == [
+        (o.symbol, o.side, o.quantity, o.status) for o in expected
+    ]
+    assert batch.get_positions() == single.get_positions()
+
+
+
+def test_live_cancel_orders_batches_tracked_ids():
+    order_ids = [str(100 + i) for i in range(BATCH_CANCEL_LIMIT + 3)]
+    client = FakeClient(reject={'101'})
+    cancelled = live_adapter(client).cancel_orders('BTCUSDT', order_ids)
+
+    assert client.calls == [
+        ('cancel_batch', 'BTCUSDT', [int(i) for i in order_ids[:BATCH_CANCEL_LIMIT]]),
+        ('cancel_batch', 'BTCUSDT', [int(i) for i in order_ids[BATCH_CANCEL_LIMIT:]]),
+    ]
+    assert cancelled == [i for i in order_ids if i != '101']
+
+
+def test_paper_cancel_orders_leaves_untracked_orders():
+    adapter = paper_adapter()
+    stops = [adapter.place_stop_market_order('BTCUSDT', 'SELL', 1.0, 90.0 + i) for i in range(3)]
+
+    assert adapter.cancel_orders('BTCUSDT', [stops[0].order_id, stops[2].order_id, 'PAPER_99']) == [
+        stops[0].order_id, stops[2].order_id
+    ]
+    assert [s.status for s in stops] == ['CANCELED', 'NEW', 'CANCELED']
+
+
+def test_paper_modify_stop_moves_order_in_place():
+    adapter = paper_adapter()
+    stop = adapter.place_stop_market_order('BTCUSDT', 'SELL', 1.0, 95.0)
+
+    moved = adapter.modify_stop_order('BTCUSDT', stop.order_id, 'SELL', 0.5, 97.0)
+    assert moved is stop
+    assert (moved.stop_price, moved.quantity, moved.status) == (97.0, 0.5, 'NEW')
+
+    # A cancelled stop is replaced by a new one
+    adapter.cancel_order('BTCUSDT', stop.order_id)
+    replacement = adapter.modify_stop_order('BTCUSDT', stop.order_id, 'SELL', 0.5, 98.0)
+    assert replacement.order_id != stop.order_id
+    assert (replacement.stop_price, replacement.status) == (98.0, 'NEW')
+
+
+def test_live_modify_stop_places_new_stop_before_cancelling_old():
+    client = FakeClient()
+    new = live_adapter(client).modify_stop_order('BTCUSDT', '42', 'SELL', 1.0, 97.0)
+
+    assert [c[0] for c in client.calls] == ['create', 'cancel']
+    assert client.calls[0][1]['type'] == 'STOP_MARKET'
+    assert client.calls[0][1]['stopPrice'] == 97.0
+    assert client.calls[0][1]['reduceOnly'] is True
+    assert client.calls[1] == ('cancel', 'BTCUSDT', '42')
+    assert new.order_id == '101' and new.stop_price == 97.0
+
+
+def test_live_modify_stop_keeps_new_stop_when_cancel_fails():
+    class FlakyCancelClient(FakeClient):
+        def futures_cancel_order(self, symbol, orderId):
+            raise api_error(503, -1001)
+
+    new = live_adapter(FlakyCancelClient()).modify_stop_order('BTCUSDT', '42', 'SELL', 1.0, 97.0)
+    assert new.stop_price == 97.0
+
+    class DownClient(FakeClient):
+        def futures_create_order(self, **params):
+            raise api_error(503, -1001)
+
+    client = DownClient()
+    with pytest.raises(TransientAPIError):
+        live_adapter(client).modify_stop_order('BTCUSDT', '42', 'SELL', 1.0, 97.0)
+    # The old stop is left in place when the replacement could not be placed
+    assert client.calls == []
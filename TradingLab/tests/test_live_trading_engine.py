@@ -0,0 +1,352 @@
+"""Tests for the live trading engine order path."""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+
+from adapters.execution.binance_futures import (
+    BATCH_ORDER_LIMIT,
+    AccountBalance,
+    Order,
+    FatalAPIError,
+    Position,
+    TransientAPIError
+)
+from engine import live_trading_engine
+from engine.live_trading_engine import LiveTradingEngine, Signal
+from engine.market import MarketSpec
+from strategies.base import StrategyBase
+
+
+class RecordingAdapter:
+    """Exchange adapter stand-in that records every order call."""
+
+    paper_mode = True
+
+    def __init__(self, available_balance: float = 10000.0):
+        self.balance = AccountBalance(
+            total_balance=available_balance,
+            available_balance=available_balance
+        )
+        self.positions: List[Position] = []
+        self.calls: List[tuple] = []
+        self._next_id = 0
+
+    def _order(self, symbol: str, side: str, quantity: float, order_type: str, **kwargs) -> Order:
+        self._next_id += 1
+        return Order(str(self._next_id), symbol, side, order_type, quantity, **kwargs)
+
+    def get_account_balance(self) -> AccountBalance:
+        return self.balance
+
+    def get_positions(self, symbol=None) -> List[Position]:
+        return list(self.positions)
+
+    def place_market_order(self, symbol, side, quantity, reduce_only=False) -> Order:
+        self.calls.append(('market', symbol, side, quantity))
+        return self._order(symbol, side, quantity, 'MARKET')
+
+    def place_stop_market_order(self, symbol, side, quantity, stop_price, reduce_only=True) -> Order:
+        self.calls.append(('stop', symbol, side, quantity, stop_price))
+        return self._order(symbol, side, quantity, 'STOP_MARKET', stop_price=stop_price)
+
+    def place_batch_market_orders(self, orders: List[Dict[str, Any]], reduce_only=False) -> List[Order]:
+        self.calls.append(('batch', [dict(o) for o in orders], reduce_only))
+        return [self._order(o['symbol'], o['side'], o['quantity'], 'MARKET') for o in orders]
+
+    def cancel_order(self, symbol, order_id) -> bool:
+        self.calls.append(('cancel', symbol, order_id))
+        return True
+
+    def cancel_orders(self, symbol, order_ids) -> List[str]:
+        self.calls.append(('cancel_orders', symbol, list(order_ids)))
+        return list(order_ids)
+
+
+NOW = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+
+def make_engine(adapter=None, **kwargs) -> LiveTradingEngine:
+    market_spec = MarketSpec(
+        symbol='BTCUSDT',
+        exchange='binance',
+        asset_class='crypto',
+        market_type='futures',
+        leverage=10.0,
+        price_precision=2,
+        quantity_precision=3
+    )
+    return LiveTradingEngine(
+        strategy=None,
+        adapter=adapter or RecordingAdapter(),
+        market_spec=market_spec,
+        **kwargs
+    )
+
+
+def test_entry_uses_quantized_quantity():
+    """The order is sent with the same rounded quantity the margin check used."""
+    engine = make_engine()
+    engine.process_signal(Signal('BUY', quantity=0.12345678), 40000.0, NOW)
+
+    assert engine.adapter.calls == [('market', 'BTCUSDT', 'BUY', 0.123)]
+    assert engine.trades_executed == 1
+
+
+def test_entry_rejected_when_quantity_rounds_to_zero():
+    engine = make_engine()
+    engine.process_signal(Signal('BUY', quantity=0.0004), 40000.0, NOW)
+
+    assert engine.adapter.calls == []
+    assert engine.trades_executed == 0
+    assert not engine._pending_entry
+
+
+def test_entry_margin_checked_on_quantized_quantity():
+    """0.1004 rounds to 0.100, whose 400.0 margin fits the balance exactly."""
+    engine = make_engine(RecordingAdapter(available_balance=400.0), initial_capital=400.0)
+    engine.process_signal(Signal('BUY', quantity=0.1004), 40000.0, NOW)
+
+    assert engine.adapter.calls == [('market', 'BTCUSDT', 'BUY', 0.1)]
+
+
+def test_close_all_retries_only_the_failed_chunk(monkeypatch):
+    """A transient failure resends its own chunk, not the ones already placed."""
+    monkeypatch.setattr(live_trading_engine, '_RETRY_BACKOFF_S', 0.0)
+
+    class FlakyAdapter(RecordingAdapter):
+        failed = False
+
+        def place_batch_market_orders(self, orders, reduce_only=False):
+            if orders[0]['symbol'] == f'SYM{BATCH_ORDER_LIMIT}' and not self.failed:
+                self.failed = True
+                self.calls.append(('batch_failed', len(orders)))
+                raise TransientAPIError("timeout")
+            return super().place_batch_market_orders(orders, reduce_only)
+
+    adapter = FlakyAdapter()
+    engine = make_engine(adapter)
+    n_positions = BATCH_ORDER_LIMIT + 2
+    engine.active_positions = {
+        f'SYM{i}': Position(f'SYM{i}', 'LONG' if i % 2 else 'SHORT', 1.0 + i, 100.0)
+        for i in range(n_positions)
+    }
+    engine.active_stop_orders = {'SYM0': '11', 'SYM3': '12'}
+
+    engine._close_all_positions()
+
+    batches = [c for c in adapter.calls if c[0] == 'batch']
+    assert [len(b[1]) for b in batches] == [BATCH_ORDER_LIMIT, 2]
+    assert all(b[2] for b in batches)
+    assert ('batch_failed', 2) in adapter.calls
+    sent = [o for b in batches for o in b[1]]
+    assert [o['symbol'] for o in sent] == [f'SYM{i}' for i in range(n_positions)]
+    assert [o['side'] for o in sent] == ['BUY' if i % 2 == 0 else 'SELL' for i in range(n_positions)]
+
+    # Only the tracked stop orders are cancelled, one batch per symbol
+    cancels = [c for c in adapter.calls if c[0].startswith('cancel')]
+    assert cancels == [('cancel_orders', 'SYM0', ['11']), ('cancel_orders', 'SYM3', ['12'])]
+    assert engine.active_positions == {}
+    assert engine.active_stop_orders == {}
+
+
+def _account_update(symbol: str, amount: str, entry_price: str = '40000', upnl: str = '5') -> Dict[str, Any]:
+    return {'e': 'ACCOUNT_UPDATE', 'a': {'P': [
+        {'s': symbol, 'pa': amount, 'ep': entry_price, 'up': upnl}
+    ]}}
+
+
+def test_user_stream_account_update_mirrors_position():
+    engine = make_engine()
+    engine._on_user_event(_account_update('BTCUSDT', '-0.5'))
+
+    position = engine.active_positions['BTCUSDT']
+    assert (position.side, position.size, position.entry_price, position.unrealized_pnl) == (
+        'SHORT', 0.5, 40000.0, 5.0
+    )
+
+    # Other symbols are ignored; a flat amount removes the position
+    engine._on_user_event(_account_update('ETHUSDT', '2'))
+    assert list(engine.active_positions) == ['BTCUSDT']
+    engine._on_user_event(_account_update('BTCUSDT', '0'))
+    assert engine.active_positions == {}
+
+
+def test_user_stream_skips_rest_until_reconcile_interval():
+    adapter = RecordingAdapter()
+    adapter.positions = [Position('BTCUSDT', 'LONG', 1.0, 40000.0)]
+    engine = make_engine(adapter, reconcile_interval_s=3600.0)
+
+    engine._user_stream_active = True
+    engine.update_positions()
+    assert list(engine.active_positions) == ['BTCUSDT']
+
+    # Within the interval the stream is trusted over REST
+    adapter.positions = []
+    engine._positions_cache = None
+    engine.update_positions()
+    assert list(engine.active_positions) == ['BTCUSDT']
+
+    # A stream error falls back to polling
+    engine._on_user_event({'e': 'error', 'm': 'disconnected'})
+    engine.update_positions()
+    assert engine.active_positions == {}
+
+
+def test_close_all_waits_for_positions_lock():
+    """The worker-side snapshot/clear is serialized with stream updates."""
+    engine = make_engine()
+    engine.active_positions = {'BTCUSDT': Position('BTCUSDT', 'LONG', 1.0, 40000.0)}
+
+    with engine._positions_lock:
+        worker = threading.Thread(target=engine._close_all_positions)
+        worker.start()
+        worker.join(timeout=0.2)
+        assert worker.is_alive()
+        assert engine.adapter.calls == []
+    worker.join(timeout=5.0)
+
+    assert not worker.is_alive()
+    assert engine.adapter.calls[0][0] == 'batch'
+    assert engine.active_positions == {}
+
+
+def test_order_worker_runs_actions_in_order_off_the_signal_thread():
+    engine = make_engine()
+    seen = []
+    engine.start_order_worker()
+    try:
+        for i in range(5):
+            engine._submit(lambda i=i: seen.append((i, threading.current_thread().name)))
+    finally:
+        engine.stop_order_worker()
+
+    assert [i for i, _ in seen] == list(range(5))
+    assert {name for _, name in seen} == {'order-worker-BTCUSDT'}
+
+
+def test_order_worker_survives_api_errors():
+    engine = make_engine()
+    seen = []
+
+    def rejected():
+        raise FatalAPIError("bad request")
+
+    engine.start_order_worker()
+    try:
+        engine._submit(rejected)
+        engine._submit(seen.append, 'after')
+    finally:
+        engine.stop_order_worker()
+
+    assert seen == ['after']
+
+
+def test_order_worker_bug_reaches_excepthook_and_clears_pending_entry(monkeypatch):
+    hooked = []
+    monkeypatch.setattr(threading, 'excepthook', hooked.append)
+
+    class BrokenAdapter(RecordingAdapter):
+        def place_market_order(self, *args, **kwargs):
+            raise KeyError('bug')
+
+    engine = make_engine(BrokenAdapter())
+    engine.start_order_worker()
+    engine.process_signal(Signal('BUY', quantity=0.1), 40000.0, NOW)
+    engine._order_worker.join(timeout=5.0)
+
+    assert len(hooked) == 1 and hooked[0].exc_type is KeyError
+    assert not engine._pending_entry
+
+    # With the worker gone, later actions run inline
+    seen = []
+    engine._submit(seen.append, 'inline')
+    assert seen == ['inline']
+    engine.stop_order_worker()
+
+
+def test_signal_from_dict_matches_legacy_dict():
+    assert Signal.from_dict({'action': 'SELL', 'quantity': 0.5, 'stop_price': 41000.0}) == Signal(
+        'SELL', quantity=0.5, stop_price=41000.0
+    )
+    assert Signal.from_dict({'quantity': None}) == Signal('', quantity=0.0)
+
+    # process_signal accepts both forms with the same effect
+    legacy, typed = make_engine(), make_engine()
+    legacy.process_signal({'action': 'BUY', 'quantity': 0.12345678}, 40000.0, NOW)
+    typed.process_signal(Signal('BUY', quantity=0.12345678), 40000.0, NOW)
+    assert legacy.adapter.calls == typed.adapter.calls
+
+
+def test_roll_daily_resets_baseline_and_reschedules():
+    adapter = RecordingAdapter(available_balance=10000.0)
+    engine = make_engine(adapter)
+    scheduled = []
+    engine.start_daily_rollover = lambda: scheduled.append(True)
+
+    engine.daily_pnl = -250.0
+    adapter.balance = AccountBalance(total_balance=9000.0, available_balance=9000.0)
+    engine._roll_daily()
+
+    assert engine.daily_start_balance == 9000.0
+    assert engine._daily_stop_equity == pytest.approx(9000.0 * (1.0 - engine.max_daily_loss_pct / 100.0))
+    assert engine.daily_pnl == 0.0
+    assert scheduled == [True]
+
+    # An API failure keeps the old baseline but still schedules the next reset
+    def down():
+        raise FatalAPIError("auth")
+
+    adapter.get_account_balance = down
+    engine._roll_daily()
+    assert engine.daily_start_balance == 9000.0
+    assert scheduled == [True, True]
+
+
+def test_daily_rollover_timer_fires_at_next_utc_midnight():
+    engine = make_engine()
+    engine.start_daily_rollover()
+    try:
+        timer = engine._rollover_timer
+        assert timer.daemon and timer.is_alive()
+        fires_at = datetime.now(timezone.utc) + timedelta(seconds=timer.interval)
+        assert 0.0 < timer.interval <= 24 * 3600
+        assert abs(fires_at - fires_at.replace(hour=0, minute=0, second=0, microsecond=0)) < timedelta(seconds=5)
+    finally:
+        engine.stop_daily_rollover()
+    assert engine._rollover_timer is None
+
+
+def test_retry_repeats_transient_errors_only(monkeypatch):
+    monkeypatch.setattr(live_trading_engine, '_RETRY_BACKOFF_S', 0.0)
+    engine = make_engine()
+    attempts = []
+
+    def flaky(value):
+        attempts.append(value)
+        if len(attempts) <= live_trading_engine._MAX_RETRIES:
+            raise TransientAPIError("timeout")
+        return value
+
+    assert engine._retry(flaky, 'ok') == 'ok'
+    assert len(attempts) == live_trading_engine._MAX_RETRIES + 1
+
+    def always_down():
+        attempts.append('down')
+        raise TransientAPIError("timeout")
+
+    attempts.clear()
+    with pytest.raises(TransientAPIError):
+        engine._retry(always_down)
+    assert len(attempts) == live_trading_engine._MAX_RETRIES + 1
+
+    def rejected():
+        attempts.append('rejected')
+        raise FatalAPIError("bad request")
+
+    attempts.clear()
+    with pytest.raises(FatalAPIError):
+        engine._retry(rejected)
+    assert attempts == ['rejected']
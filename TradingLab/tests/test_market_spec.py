@@ -0,0 +1,126 @@
+"""Tests for MarketSpec margin dispatch, the shared spec pool and batch APIs."""
+
+import dataclasses
+
+import numpy as np
+import pytest
+import yaml
+
+from engine import market_spec
+from engine.market_spec import Broker, MarketSpec
+
+
+PROFILES = {
+    'crypto': {'asset_class': 'crypto', 'exchange': 'binance', 'leverage': 5.0},
+    'forex': {
+        'asset_class': 'forex', 'exchange': 'oanda', 'leverage': 30.0,
+        'contract_size': 100000, 'pip_value': 0.0001
+    },
+    'futures_fixed': {
+        'asset_class': 'futures', 'exchange': 'cme', 'leverage': 1.0,
+        'initial_margin_per_contract': 1500.0, 'intraday_margin_per_contract': 50.0
+    },
+    'futures_leverage': {
+        'asset_class': 'futures', 'exchange': 'binance', 'leverage': 20.0,
+        'maintenance_margin_rate': 0.005
+    },
+    'stock': {'asset_class': 'stock', 'exchange': 'nasdaq', 'leverage': 2.0},
+}
+
+SYMBOLS = {
+    'crypto': 'BTCUSDT',
+    'forex': 'USDJPY',
+    'futures_fixed': 'MES',
+    'futures_leverage': 'BTCUSDT',
+    'stock': 'AAPL',
+}
+
+
+@pytest.fixture(params=list(PROFILES))
+def spec(request):
+    return MarketSpec.from_market_profile(SYMBOLS[request.param], PROFILES[request.param])
+
+
+def test_replace_rebinds_margin_rules():
+    """dataclasses.replace() re-runs __post_init__, so the bound margin rules follow the new fields."""
+    crypto = MarketSpec.from_market_profile('BTCUSDT', PROFILES['crypto'])
+    assert crypto.calculate_margin(40000.0, 0.5) == pytest.approx(4000.0)
+
+    fixed = dataclasses.replace(crypto, asset_class='futures', initial_margin_per_contract=1500.0)
+    assert fixed.calculate_margin(5000.0, -2.0) == 3000.0
+    assert fixed.calculate_maintenance_margin(5000.0, 2.0) == 3000.0
+
+    rate = dataclasses.replace(crypto, asset_class='futures', maintenance_margin_rate=0.005)
+    assert rate.calculate_maintenance_margin(40000.0, 1.0, 42000.0) == pytest.approx(210.0)
+
+    forex = dataclasses.replace(crypto, symbol='EURUSD', asset_class='forex', contract_size=100000)
+    assert forex.calculate_pip_value_per_lot(1.1) == 10.0
+    assert crypto.calculate_pip_value_per_lot(40000.0) == 0.0
+
+
+def test_specs_differ_on_any_field(spec):
+    assert spec != dataclasses.replace(spec, commission_rate=spec.commission_rate * 2)
+    assert spec != 'BTCUSDT'
+
+
+def test_get_returns_pooled_instance(tmp_path, monkeypatch):
+    monkeypatch.setattr(market_spec, '_SPEC_POOL', {})
+    path = tmp_path / 'market_profiles.yml'
+    path.write_text(yaml.safe_dump({
+        'markets': {'BTCUSDT': PROFILES['crypto'], 'EURUSD': PROFILES['forex']},
+        'asset_class_defaults': {},
+    }))
+
+    btc = MarketSpec.get('BTCUSDT', path)
+    assert MarketSpec.get('BTCUSDT', path) is btc
+    assert MarketSpec.get('EURUSD', path).asset_class == 'forex'
+    assert btc == MarketSpec.load_from_profiles('BTCUSDT', path)
+    with pytest.raises(ValueError):
+        MarketSpec.get('NOPE', path)
+
+
+def test_vectorized_apis_match_scalar(spec):
+    rng = np.random.default_rng(0)
+    n = 64
+    entry = rng.uniform(1.0, 50000.0, n)
+    current = entry * rng.uniform(0.9, 1.1, n)
+    qty = rng.uniform(-5.0, 5.0, n)
+    signs = np.where(rng.random(n) < 0.5, 1.0, -1.0)
+
+    for intraday in (True, False):
+        np.testing.assert_allclose(
+            spec.calculate_margin_vec(entry, qty, intraday),
+            [spec.calculate_margin(e, q, intraday) for e, q in zip(entry, qty)]
+        )
+    np.testing.assert_allclose(
+        spec.calculate_unrealized_pnl_vec(entry, current, qty, signs),
+        [
+            spec.calculate_unrealized_pnl(e, c, q, 'long' if s > 0 else 'short')
+            for e, c, q, s in zip(entry, current, qty, signs)
+        ]
+    )
+
+    risk = rng.uniform(10.0, 500.0, n)
+    stops = rng.uniform(-5.0, 50.0, n)
+    expected = [
+        spec.calculate_quantity_from_risk(r, s, 110.0) if s > 0 else 0.0
+        for r, s in zip(risk, stops)
+    ]
+    np.testing.assert_allclose(spec.quantities_from_risk(risk, stops, 110.0), expected)
+
+
+@pytest.mark.parametrize('commission_rate', [None, 0.001])
+def test_broker_batch_matches_scalar(spec, commission_rate):
+    """can_afford_batch agrees with required_cash_for / can_afford_position, shorts included."""
+    broker = Broker(spec)
+    entry = np.array([0.9, 120.0, 42000.0, 42000.0, 1.1])
+    qty = np.array([1000.0, -3.0, 0.05, -0.05, 0.0])
+    available = 2000.0
+
+    affordable, required = broker.can_afford_batch(entry, qty, available, commission_rate)
+    for i, (e, q) in enumerate(zip(entry, qty)):
+        cash = broker.required_cash_for(e, q, commission_rate)
+        assert required[i] == pytest.approx(cash)
+        assert broker.can_afford_position(e, q, available, commission_rate) == (affordable[i], cash)
+    # A short costs the same as the long of the same size
+    assert broker.required_cash_for(42000.0, -0.05) == pytest.approx(broker.required_cash_for(42000.0, 0.05))
@@ -0,0 +1,202 @@
+"""Tests for Monte Carlo early stopping and its suite wiring."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from engine.backtest_engine import BacktestResult, Trade
+from validation.monte_carlo import MonteCarloPermutation
+from validation.monte_carlo import utils as mc_utils
+from validation.monte_carlo.runner import EARLY_STOP_MIN_ITERATIONS, MonteCarloSuite
+from validation.monte_carlo.utils import SequentialStop, exceedance_counts
+from validation.suitability import TestSuitability as Suitability
+
+
+def agresti_coull(k: int, n: int, alpha: float = 0.01):
+    """Reference Agresti-Coull interval for k successes in n draws."""
+    z = stats.norm.ppf(1.0 - alpha / 2.0)
+    p = (k + 2) / (n + 4)
+    half = z * np.sqrt(p * (1.0 - p) / (n + 4))
+    return p - half, p + half
+
+
+def test_exceedance_counts_matches_comparisons():
+    values = np.array([0.5, 1.0, np.nan, 2.0, 1.0, -3.0])
+    assert exceedance_counts(values, 1.0) == (3, 2)
+    assert exceedance_counts(values.astype(np.float32), 1.0) == (3, 2)
+    assert exceedance_counts(np.array([]), 0.0) == (0, 0)
+
+
+@pytest.mark.parametrize('numba_available', [True, False])
+def test_exceedance_counts_kernel_matches_numpy(monkeypatch, numba_available):
+    """The JIT kernel and the NumPy fallback count the same values."""
+    monkeypatch.setattr(mc_utils, 'NUMBA_AVAILABLE', numba_available)
+    rng = np.random.default_rng(2)
+    values = rng.normal(size=5000)
+    values[rng.random(5000) < 0.05] = np.nan
+    # A non-contiguous 2-D view is counted like its flattened copy
+    for arr in (values, values.reshape(50, 100)[:, ::2]):
+        for observed in (-10.0, -0.3, 0.0, 1.7, np.inf):
+            expected = (int(np.sum(arr >= observed)), int(np.sum(arr < observed)))
+            assert exceedance_counts(arr, observed) == expected
+
+
+def test_sequential_stop_waits_for_min_iterations_and_check_every():
+    rule = SequentialStop(threshold=0.05, min_iterations=200, check_every=50)
+    # Observed beats every draw: p-value is clearly below threshold
+    dist = {'m': np.zeros(1000)}
+    observed = {'m': 1.0}
+
+    assert not rule.settled(dist, observed, 150)
+    assert not rule.settled(dist, observed, 249)
+    assert rule.settled(dist, observed, 250)
+
+
+@pytest.mark.parametrize('k_fraction', [0.0, 0.01, 0.05, 0.08, 0.5, 1.0])
+def test_sequential_stop_settles_only_when_interval_clears_threshold(k_fraction):
+    """settled() is True exactly when the Agresti-Coull interval excludes threshold."""
+    rule = SequentialStop(threshold=0.05, min_iterations=50, check_every=50)
+    rng = np.random.default_rng(3)
+    n_max = 2000
+    # A draw >= observed (1.0) with probability k_fraction
+    values = np.where(rng.random(n_max) < k_fraction, 2.0, 0.0)
+
+    for n in range(50, n_max + 1, 50):
+        k = int(np.count_nonzero(values[:n] >= 1.0))
+        lo, hi = agresti_coull(k, n)
+        clear = not (lo <= rule.threshold <= hi)
+        assert rule.settled({'m': values}, {'m': 1.0}, n) == clear
+
+
+def test_sequential_stop_needs_every_metric_settled():
+    rule = SequentialStop(threshold=0.05, min_iterations=100, check_every=50)
+    dist = {'clear': np.zeros(500), 'borderline': np.r_[np.full(25, 2.0), np.zeros(475)]}
+    observed = {'clear': 1.0, 'borderline': 1.0}
+
+    assert rule.settled({'clear': dist['clear']}, observed, 500)
+    assert not rule.settled(dist, observed, 500)
+    assert not rule.settled({'clear': dist['clear']}, {'clear': np.nan}, 500)
+
+
+def test_sequential_stop_first_checkpoint_with_no_exceedances():
+    """With k=0, n=100 still leaves threshold inside the interval; n=150 does not."""
+    rule = SequentialStop(threshold=0.05)
+    dist = {'m': np.zeros(1000)}
+    assert not rule.settled(dist, {'m': 1.0}, 100)
+    assert rule.settled(dist, {'m': 1.0}, 150)
+
+
+def _result(n_trades: int = 40) -> BacktestResult:
+    rng = np.random.default_rng(5)
+    start = pd.Timestamp('2023-01-01')
+    trades = [
+        Trade(
+            entry_time=start + pd.Timedelta(days=i),
+            exit_time=start + pd.Timedelta(days=i, hours=6),
+            direction='long',
+            entry_price=100.0,
+            exit_price=100.0,
+            quantity=1.0,
+            pnl_raw=float(p),
+            pnl_after_costs=float(p)
+        )
+        for i, p in enumerate(rng.normal(10.0, 100.0, n_trades))
+    ]
+    equity = 10000.0 + np.r_[0.0, np.cumsum([t.pnl_after_costs for t in trades])]
+    return BacktestResult(
+        initial_capital=10000.0,
+        final_capital=float(equity[-1]),
+        equity_curve=pd.Series(equity),
+        trades=trades,
+        total_pnl=float(equity[-1] - 10000.0),
+        total_trades=n_trades
+    )
+
+
+def test_permutation_stops_at_first_settled_checkpoint():
+    rule = SequentialStop(threshold=0.05)
+    perm = MonteCarloPermutation(seed=1).run(
+        _result(), metrics=['ulcer_index'], n_iterations=1000, show_progress=False, early_stop=rule
+    )
+
+    n = perm.n_iterations
+    values = perm.permuted_distributions['ulcer_index']
+    observed = perm.observed_metrics['ulcer_index']
+    assert n < 1000 and values.shape == (n,)
+    k, _ = exceedance_counts(values, observed)
+    lo, hi = agresti_coull(k, n)
+    assert not (lo <= 0.05 <= hi)
+    assert not any(
+        rule.settled({'ulcer_index': values}, perm.observed_metrics, m)
+        for m in range(rule.min_iterations, n, rule.check_every)
+    )
+
+
+class _RecordingEngine:
+    """MC engine stand-in that records the stopping rule it was given."""
+
+    def __init__(self, **extra):
+        self.early_stop = 'unset'
+        self.extra = extra
+
+    def run(self, *, n_iterations, early_stop=None, **kwargs):
+        self.early_stop = early_stop
+        return SimpleNamespace(
+            observed_metrics={'final_pnl': 1.0},
+            p_values={'final_pnl': 0.01},
+            percentiles={'final_pnl': 99.0},
+            n_iterations=n_iterations,
+            **self.extra
+        )
+
+
+def _recording_suite() -> MonteCarloSuite:
+    suite = MonteCarloSuite()
+    suite.permutation_engine = _RecordingEngine(permuted_distributions={}, equity_curves=None)
+    suite.bootstrap_engine = _RecordingEngine(block_length=5, bootstrap_distributions={})
+    suite.randomized_entry_engine = _RecordingEngine(
+        avg_random_trades=10.0, random_distributions={}, randomized_entry_diagnostics={}
+    )
+    return suite
+
+
+def _run_conditional(suite, **kwargs):
+    suitable = Suitability(suitable=True, reason='ok', priority=1.0)
+    prices = pd.DataFrame({c: [100.0, 101.0] for c in ('open', 'high', 'low', 'close', 'volume')})
+    suite.run_conditional(
+        _result(),
+        prices,
+        strategy=None,
+        test_suitability={'permutation': suitable, 'bootstrap': suitable, 'randomized_entry': suitable},
+        metrics=['final_pnl'],
+        show_progress=False,
+        **kwargs
+    )
+
+
+def test_run_conditional_keeps_bootstrap_floor():
+    suite = _recording_suite()
+    rule = SequentialStop(threshold=0.05)
+    _run_conditional(suite, early_stop=rule)
+
+    assert EARLY_STOP_MIN_ITERATIONS['bootstrap'] == 1000
+    assert suite.permutation_engine.early_stop is rule
+    assert suite.randomized_entry_engine.early_stop is rule
+    assert suite.bootstrap_engine.early_stop == SequentialStop(threshold=0.05, min_iterations=1000)
+
+
+def test_run_conditional_custom_floors_and_no_early_stop():
+    suite = _recording_suite()
+    rule = SequentialStop(threshold=0.05, min_iterations=300)
+    _run_conditional(suite, early_stop=rule, min_iterations={'permutation': 500, 'bootstrap': 200})
+
+    assert suite.permutation_engine.early_stop.min_iterations == 500
+    # A floor below the rule's own minimum leaves the rule unchanged
+    assert suite.bootstrap_engine.early_stop is rule
+
+    suite = _recording_suite()
+    _run_conditional(suite)
+    assert suite.bootstrap_engine.early_stop is None
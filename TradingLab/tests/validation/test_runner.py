@@ -0,0 +1,152 @@
+"""Tests for the validation runner."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.backtest_engine import BacktestResult, Trade
+from strategies.base import StrategyBase
+from validation.runner import ValidationRunner
+from validation.walkforward import WalkForwardResult, WalkForwardStep
+
+
+def _trade(day: int, pnl: float) -> Trade:
+    entry = pd.Timestamp('2023-01-01') + pd.Timedelta(days=day)
+    return Trade(
+        entry_time=entry,
+        exit_time=entry + pd.Timedelta(hours=12),
+        direction='long',
+        entry_price=100.0,
+        exit_price=100.0,
+        quantity=1.0,
+        pnl_raw=pnl,
+        pnl_after_costs=pnl,
+        commission=1.0,
+        slippage=0.5
+    )
+
+
+def _window_result(trades, initial_capital=10000.0) -> BacktestResult:
+    pnls = [t.pnl_after_costs for t in trades]
+    equity = initial_capital + np.concatenate(([0.0], np.cumsum(pnls)))
+    return BacktestResult(
+        initial_capital=initial_capital,
+        final_capital=float(equity[-1]),
+        equity_curve=pd.Series(equity),
+        trades=trades,
+        total_pnl=float(equity[-1] - initial_capital),
+        total_trades=len(trades),
+        strategy_name='TEST',
+        symbol='TESTUSDT'
+    )
+
+
+def _step(number: int, trades, excluded: bool = False) -> WalkForwardStep:
+    start = pd.Timestamp('2023-01-01') + pd.Timedelta(days=30 * number)
+    result = _window_result(trades)
+    return WalkForwardStep(
+        step_number=number,
+        train_start=start,
+        train_end=start + pd.Timedelta(days=20),
+        test_start=start + pd.Timedelta(days=20),
+        test_end=start + pd.Timedelta(days=30),
+        train_result=result,
+        test_result=result,
+        train_metrics={'pf': 1.0, 'sharpe': 0.0},
+        test_metrics={'pf': 1.0, 'sharpe': 0.0},
+        excluded_from_stats=excluded
+    )
+
+
+@pytest.fixture
+def runner():
+    return ValidationRunner(StrategyBase)
+
+
+def test_combine_oos_results_chains_included_windows(runner):
+    """Test windows are chained onto one equity curve; excluded steps are dropped."""
+    wf_result = WalkForwardResult(
+        steps=[
+            _step(0, [_trade(0, 100.0), _trade(1, -300.0)]),
+            _step(1, [_trade(40, 5000.0)], excluded=True),
+            _step(2, [_trade(70, 50.0), _trade(71, 200.0)]),
+        ],
+        summary={},
+        config=None
+    )
+
+    combined = runner._combine_oos_results(wf_result)
+
+    expected_equity = [10000.0, 10100.0, 9800.0, 9850.0, 10050.0]
+    np.testing.assert_allclose(combined.equity_curve.to_numpy(), expected_equity)
+    assert combined.total_trades == 4
+    assert len(combined.trades) == 4
+    assert combined.final_capital == pytest.approx(10050.0)
+    assert combined.total_pnl == pytest.approx(50.0)
+    assert combined.winning_trades == 3
+    assert combined.losing_trades == 1
+    assert combined.total_commission == pytest.approx(4.0)
+    # Peak 10100 -> trough 9800
+    assert combined.max_drawdown == pytest.approx(300.0 / 10100.0 * 100.0)
+    np.testing.assert_allclose(
+        combined.trade_returns,
+        [100.0 / 10000.0, -300.0 / 10100.0, 50.0 / 9800.0, 200.0 / 9850.0]
+    )
+
+
+def test_combine_oos_results_without_included_trades(runner):
+    """None when every window with trades is excluded."""
+    wf_result = WalkForwardResult(
+        steps=[_step(0, []), _step(1, [_trade(40, 10.0)], excluded=True)],
+        summary={},
+        config=None
+    )
+    assert runner._combine_oos_results(wf_result) is None
+
+
+def test_run_monte_carlo_independent_of_worker_count(runner, monkeypatch):
+    """Chunked permutations give the same distributions for any worker count."""
+    rng = np.random.default_rng(7)
+    result = _window_result([_trade(i, float(p)) for i, p in enumerate(rng.normal(20.0, 100.0, 40))])
+    n_iterations = 120
+
+    outcomes = {}
+    for workers in (1, 2, 3):
+        monkeypatch.setattr(ValidationRunner, 'monte_carlo_workers', workers)
+        outcomes[workers] = runner.run_monte_carlo(
+            result, metrics=['final_pnl', 'ulcer_index'], n_iterations=n_iterations, seed=11
+        )
+
+    # Path-dependent metric, so the chunks really draw different orderings
+    assert np.std(outcomes[1]['ulcer_index'].permuted_values) > 0
+
+    for metric, baseline in outcomes[1].items():
+        assert baseline.permuted_values.shape == (n_iterations,)
+        for workers in (2, 3):
+            other = outcomes[workers][metric]
+            np.testing.assert_array_equal(other.permuted_values, baseline.permuted_values)
+            assert other.p_value == baseline.p_value
+            assert other.percentile_rank == baseline.percentile_rank
+
+
+def test_validate_strategy_uses_oos_trades_without_full_backtest(runner, monkeypatch):
+    """With walk-forward trades, Monte Carlo and enhanced_metrics skip the full-data run."""
+    wf_result = WalkForwardResult(
+        steps=[_step(0, [_trade(0, 100.0), _trade(1, -30.0)]), _step(1, [_trade(40, 60.0)])],
+        summary={},
+        config=None
+    )
+    monkeypatch.setattr(runner, 'run_walk_forward', lambda *args: wf_result)
+
+    def full_backtest(*args):
+        raise AssertionError("full-data backtest should not run")
+
+    monkeypatch.setattr(runner, '_build_engine', full_backtest)
+    mc_inputs = []
+    monkeypatch.setattr(runner, 'run_monte_carlo', lambda result, n_iterations: mc_inputs.append(result) or {})
+
+    results = runner.validate_strategy(pd.DataFrame(), {}, wf_config=object(), monte_carlo_iterations=10)
+
+    assert len(mc_inputs) == 1 and mc_inputs[0].total_trades == 3
+    assert results['enhanced_metrics']['final_pnl'] == pytest.approx(130.0)
+    assert 'oos_enhanced_metrics' not in results
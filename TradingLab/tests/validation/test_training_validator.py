@@ -0,0 +1,156 @@
+"""Tests for the training validator's parallel paths."""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from adapters.data.data_loader import DataLoader
+from engine._market_math import pnl_batch
+from tests.test_backtest import DummyStrategy, create_test_csv
+from validation import training_validator
+from validation._pool import worker_context
+from validation.pipeline import ValidationPipeline
+from validation.training_validator import TrainingValidator
+
+
+CONFIG = {
+    "strategy_name": "test_strategy",
+    "market": {"exchange": "binance", "symbol": "BTCUSDT", "base_timeframe": "1m"},
+    "timeframes": {"signal_tf": "1h", "entry_tf": "15m"},
+    "moving_averages": {"ema5": {"enabled": True, "length": 5}},
+    "alignment_rules": {
+        "long": {"macd_bars_signal_tf": 1, "macd_bars_entry_tf": 2},
+        "short": {"macd_bars_signal_tf": 1, "macd_bars_entry_tf": 2},
+    },
+}
+
+GRID = {
+    'risk.risk_per_trade_pct': [0.5, 1.0],
+    'moving_averages.ema5.length': [5, 8],
+}
+
+
+class EntryStrategy(DummyStrategy):
+    """DummyStrategy with the hooks the backtest engine calls (module-level so it pickles)."""
+
+    __slots__ = ()
+
+    def get_indicators(self, df, tf=None):
+        return df
+
+    def _check_ema_alignment(self, *args):
+        return True
+
+    def _check_macd_progression(self, *args):
+        return True
+
+    def _calculate_stop_loss(self, entry_row, dir_int, *args, **kwargs):
+        return entry_row['close'] * (0.99 if dir_int == 1 else 1.01)
+
+
+@pytest.fixture(scope='module')
+def data(tmp_path_factory):
+    path = create_test_csv(tmp_path_factory.mktemp('data') / 'bars.csv', n_bars=3000)
+    return DataLoader().load(path)
+
+
+def _sensitivity(data, workers):
+    validator = TrainingValidator(EntryStrategy)
+    validator.sensitivity_workers = workers
+    return validator._run_sensitivity(data, CONFIG, GRID)
+
+
+def test_parallel_sensitivity_matches_serial(data):
+    serial = _sensitivity(data, 1)
+    parallel = _sensitivity(data, 2)
+
+    assert len(serial['results_df']) == 4
+    pd.testing.assert_frame_equal(serial['results_df'], parallel['results_df'])
+    assert serial['sensitivity_analysis'] == parallel['sensitivity_analysis']
+
+
+def test_parallel_sensitivity_does_not_fork_with_other_threads(data, monkeypatch):
+    """With another thread alive, workers are spawned rather than forked."""
+    methods = []
+
+    def recording_worker_context():
+        context = worker_context()
+        methods.append(context.get_start_method())
+        return context
+
+    monkeypatch.setattr(training_validator, 'worker_context', recording_worker_context)
+
+    serial = _sensitivity(data, 1)
+    release = threading.Event()
+    other = threading.Thread(target=release.wait)
+    other.start()
+    try:
+        parallel = _sensitivity(data, 2)
+    finally:
+        release.set()
+        other.join()
+
+    assert methods and 'fork' not in methods
+    pd.testing.assert_frame_equal(serial['results_df'], parallel['results_df'])
+
+
+def test_worker_context_does_not_fork_after_parallel_kernels():
+    """Numba's worker threads are invisible to threading but still rule out fork."""
+    pytest.importorskip('numba')
+    ones = np.ones(8)
+    pnl_batch(ones, ones, ones, ones)
+    assert worker_context().get_start_method() != 'fork'
+
+
+def test_get_nested_param():
+    analyzer = training_validator.SensitivityAnalyzer(EntryStrategy)
+    assert analyzer.get_nested_param(CONFIG, 'moving_averages.ema5.length') == 5
+    assert analyzer.get_nested_param(CONFIG, 'risk.risk_per_trade_pct', 1.0) == 1.0
+    assert analyzer.get_nested_param(CONFIG, 'market.symbol.x') is None
+
+
+def test_fast_fail_skips_monte_carlo_and_reports_it(data, tmp_path, capsys):
+    """A backtest failing the quality checks returns no MC results, shown as skipped."""
+    result = TrainingValidator(EntryStrategy).validate(data, CONFIG, verbose=False)
+
+    assert not result.passed and result.monte_carlo_results == {}
+    ValidationPipeline(EntryStrategy, state_dir=tmp_path)._print_phase1_results(result)
+    out = capsys.readouterr().out
+    assert "Skipped: training backtest failed the quality checks" in out
+    assert "Legacy" not in out
+
+
+def _summary(result):
+    """Comparable view of a TrainingValidationResult."""
+    mc = {
+        name: (test.get('p_values'), test.get('percentiles'))
+        for name, test in result.monte_carlo_results.items() if name != 'combined'
+    }
+    return (
+        result.passed,
+        result.criteria_checks,
+        result.failure_reasons,
+        result.backtest_result.trades,
+        result.backtest_result.equity_curve.tolist(),
+        mc,
+    )
+
+
+@pytest.mark.parametrize('executor_cls', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_validate_many_matches_sequential_validate(data, executor_cls):
+    third = len(data) // 3
+    ema8 = {**CONFIG, 'moving_averages': {'ema5': {'enabled': True, 'length': 8}}}
+    folds = [(data.iloc[:2 * third], CONFIG), (data.iloc[third:], ema8), (data, CONFIG)]
+    kwargs = dict(run_sensitivity=False, mc_iterations=20, fast_fail=False, verbose=False)
+
+    sequential = [TrainingValidator(EntryStrategy).validate(d, c, **kwargs) for d, c in folds]
+    concurrent = TrainingValidator.validate_many(
+        EntryStrategy, folds, max_workers=2, executor_cls=executor_cls, **kwargs
+    )
+
+    assert len(concurrent) == len(folds)
+    assert all(r.monte_carlo_results for r in sequential)
+    assert [_summary(r) for r in concurrent] == [_summary(r) for r in sequential]
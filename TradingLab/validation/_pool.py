@@ -0,0 +1,23 @@
+"""Start-method choice for the validation process pools."""
+
+import multiprocessing
+import threading
+from multiprocessing.context import BaseContext
+
+from engine.jit import parallel_threads_started
+
+
+def worker_context() -> BaseContext:
+    """Multiprocessing context for a validation process pool.
+    
+    'fork' lets workers inherit large inputs through copy-on-write memory
+    instead of pickling them, but fork() only copies the calling thread: a
+    lock held by another thread (validate_many, logging, progress bars) or
+    Numba's worker pool would be left in an unusable state in the child. With
+    other threads alive, or where fork is unavailable, workers are started with
+    forkserver (or spawn) and callers must pass their inputs explicitly.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if 'fork' in methods and threading.active_count() == 1 and not parallel_threads_started():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
@@ -27,7 +27,7 @@ except ImportError:
 
 from engine.backtest_engine import BacktestResult, Trade
 from metrics.metrics import calculate_enhanced_metrics
-from .utils import calculate_unified_metrics, calculate_p_value_with_kde, validate_distribution
+from .utils import calculate_unified_metrics, calculate_p_value_with_kde, validate_distribution, SequentialStop, exceedance_counts
 
 
 @dataclass
@@ -228,7 +228,8 @@ class MonteCarloBlockBootstrap:
         price_series: pd.Series,
         metrics: Optional[List[str]] = None,
         n_iterations: int = 1000,
-        show_progress: bool = True
+        show_progress: bool = True,
+        early_stop: Optional[SequentialStop] = None
     ) -> BootstrapResult:
         """
         Run block bootstrap Monte Carlo test.
@@ -246,6 +247,7 @@ class MonteCarloBlockBootstrap:
             metrics: List of metrics to test (default: ['final_pnl', 'sharpe_ratio', 'profit_factor'])
             n_iterations: Number of bootstrap iterations (must be ≥ 1000)
             show_progress: Show progress bar
+            early_stop: Stop before n_iterations once the p-values are settled
         
         Returns:
             BootstrapResult with distributions, p-values, and percentiles
@@ -374,6 +376,11 @@ class MonteCarloBlockBootstrap:
             # Store each metric
             for metric in metrics:
                 bootstrap_distributions[metric][i] = bootstrap_metrics.get(metric, 0.0)
+            
+            if early_stop is not None and early_stop.settled(bootstrap_distributions, observed_metrics, i + 1):
+                n_iterations = i + 1
+                bootstrap_distributions = {m: v[:n_iterations] for m, v in bootstrap_distributions.items()}
+                break
         
         # Calculate p-values and percentiles
         # p-value: p = (# simulated >= observed) / N
@@ -394,12 +401,10 @@ class MonteCarloBlockBootstrap:
                 percentiles[metric] = 0.0
                 continue
             
-            # Calculate p-value: p = (# simulated >= observed) / N
-            n_greater_equal = np.sum(bootstrap_values >= observed_value)
+            # p-value: p = (# simulated >= observed) / N
+            # percentile: rank(observed) / N * 100
+            n_greater_equal, n_less = exceedance_counts(bootstrap_values, observed_value)
             p_value = float(n_greater_equal / n_iterations)
-            
-            # Calculate percentile: rank(observed) / N * 100
-            n_less = np.sum(bootstrap_values < observed_value)
             percentile = float((n_less / n_iterations) * 100.0)
             
             # Use KDE smoothing if variance is very low
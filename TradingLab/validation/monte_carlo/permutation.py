@@ -24,7 +24,24 @@ except ImportError:
     def tqdm(it, desc=None): return it
 
 from engine.backtest_engine import BacktestResult, Trade
+from engine.jit import njit
 from metrics.metrics import calculate_enhanced_metrics
+from .utils import SequentialStop, exceedance_counts
+
+
+@njit(cache=True)
+def _compound_returns(returns, initial_capital):
+    # Sequential dependency on equity[i], so this loop cannot be vectorized
+    n = returns.shape[0]
+    equity = np.empty(n + 1)
+    pnl_path = np.empty(n)
+    equity[0] = initial_capital
+    for i in range(n):
+        pnl = returns[i] * equity[i]
+        pnl_path[i] = pnl
+        equity[i + 1] = equity[i] + pnl  # equivalent to equity[i] * (1 + returns[i])
+    return equity, pnl_path
+
 
 # Utility: safe extraction of trade pnl
 def _trade_pnl(trade: Trade) -> float:
@@ -137,15 +154,7 @@ class MonteCarloPermutation:
           - equity_path: array length = len(returns) + 1 (initial + after each trade)
           - pnl_path: array length = len(returns) (pnl amounts per step = return * equity_before)
         """
-        n = len(returns)
-        equity = np.empty(n + 1, dtype=float)
-        pnl_path = np.empty(n, dtype=float)
-        equity[0] = initial_capital
-        for i in range(n):
-            pnl = returns[i] * equity[i]
-            pnl_path[i] = pnl
-            equity[i + 1] = equity[i] + pnl  # equivalent to equity[i] * (1 + returns[i])
-        return equity, pnl_path
+        return _compound_returns(np.ascontiguousarray(returns, dtype=np.float64), float(initial_capital))
 
     def _validate_distribution(self, arr: np.ndarray) -> Tuple[bool, Optional[str]]:
         """Basic checks for a valid numeric distribution with non-zero variance."""
@@ -166,22 +175,52 @@ class MonteCarloPermutation:
         n = len(simulated)
         if n == 0:
             return 1.0, 0.0
-        ge = np.sum(simulated >= observed)
-        lt = np.sum(simulated < observed)
+        ge, lt = exceedance_counts(simulated, observed)
         p = float(ge / n)
         perc = float((lt / n) * 100.0)
         return p, perc
 
+    def summarize(
+        self,
+        observed_metrics: Dict[str, float],
+        permuted_distributions: Dict[str, np.ndarray]
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Compute p-values and percentiles of the observed metrics against the
+        permuted distributions. Distributions from several runs can be
+        concatenated before calling this.
+        """
+        p_values = {}
+        percentiles = {}
+        for m, sim in permuted_distributions.items():
+            observed = float(observed_metrics.get(m, 0.0))
+
+            # Validate distribution
+            valid, err = self._validate_distribution(sim)
+            if not valid:
+                # If distribution invalid (likely constant), return conservative p-value
+                warnings.warn(f"Permutation test {m}: {err}. Using conservative p-value=1.0")
+                p_values[m] = 1.0
+                percentiles[m] = 0.0
+                continue
+
+            p, perc = self._empirical_p_and_percentile(sim, observed)
+            p_values[m] = p
+            percentiles[m] = perc
+        return p_values, percentiles
+
     def run(
         self,
         backtest_result: BacktestResult,
         metrics: Optional[List[str]] = None,
         n_iterations: int = 2000,
-        show_progress: bool = True
+        show_progress: bool = True,
+        early_stop: Optional[SequentialStop] = None
     ) -> PermutationResult:
         """
         Run permutation MC.
         metrics: choose among ['final_pnl', 'sharpe', 'profit_factor', 'total_return_pct']
+        early_stop: stop before n_iterations once the p-values are settled
         NOTES:
           - PF is invariant to order; permutation test is not meaningful for PF.
           - We compute PF distribution as informational but will warn if invariant.
@@ -281,25 +320,12 @@ class MonteCarloPermutation:
                 # we still store what was computed, but permutation test is not meaningful.
                 permuted_distributions[m][i] = float(perm_metrics.get(m, 0.0))
 
-        # Calculate p-values and percentiles
-        p_values = {}
-        percentiles = {}
-        for m in metrics:
-            observed = float(observed_metrics.get(m, 0.0))
-            sim = permuted_distributions[m]
+            if early_stop is not None and early_stop.settled(permuted_distributions, observed_metrics, i + 1):
+                n_iterations = i + 1
+                permuted_distributions = {m: v[:n_iterations] for m, v in permuted_distributions.items()}
+                break
 
-            # Validate distribution
-            valid, err = self._validate_distribution(sim)
-            if not valid:
-                # If distribution invalid (likely constant), return conservative p-value
-                warnings.warn(f"Permutation test {m}: {err}. Using conservative p-value=1.0")
-                p_values[m] = 1.0
-                percentiles[m] = 0.0
-                continue
-
-            p, perc = self._empirical_p_and_percentile(sim, observed)
-            p_values[m] = p
-            percentiles[m] = perc
+        p_values, percentiles = self.summarize(observed_metrics, permuted_distributions)
 
         return PermutationResult(
             observed_metrics=observed_metrics,
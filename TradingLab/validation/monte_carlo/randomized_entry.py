@@ -59,7 +59,7 @@ from engine.market import MarketSpec
 from engine.account import AccountState
 from metrics.metrics import calculate_enhanced_metrics
 from strategies.base import StrategyBase
-from .utils import calculate_unified_metrics, calculate_p_value_with_kde, validate_distribution
+from .utils import calculate_unified_metrics, calculate_p_value_with_kde, validate_distribution, SequentialStop, exceedance_counts
 
 
 @dataclass
@@ -1357,7 +1357,8 @@ class MonteCarloRandomizedEntry:
         strategy: StrategyBase,
         metrics: Optional[List[str]] = None,
         n_iterations: int = 1000,
-        show_progress: bool = True
+        show_progress: bool = True,
+        early_stop: Optional[SequentialStop] = None
     ) -> RandomizedEntryResult:
         """
         Run randomized entry Monte Carlo test.
@@ -1375,6 +1376,7 @@ class MonteCarloRandomizedEntry:
             metrics: List of metrics to test (default: ['final_pnl', 'sharpe_ratio', 'profit_factor'])
             n_iterations: Number of random iterations
             show_progress: Show progress bar
+            early_stop: Stop before n_iterations once the p-values are settled
         
         Returns:
             RandomizedEntryResult with distributions, p-values, and percentiles
@@ -1698,6 +1700,11 @@ class MonteCarloRandomizedEntry:
             for metric in metrics:
                 iteration_aggregate[f"random_{metric}"] = random_distributions[metric][i]
             iteration_aggregates.append(iteration_aggregate)
+            
+            if early_stop is not None and early_stop.settled(random_distributions, observed_metrics, i + 1):
+                n_iterations = i + 1
+                random_distributions = {m: v[:n_iterations] for m, v in random_distributions.items()}
+                break
         
         avg_random_trades = total_random_trades / n_iterations if n_iterations > 0 else 0.0
         
@@ -1819,12 +1826,10 @@ class MonteCarloRandomizedEntry:
             if not np.isfinite(observed_value):
                 observed_value = 0.0
             
-            # Calculate p-value: p = (# simulated >= observed) / N
-            n_greater_equal = np.sum(random_values >= observed_value)
+            # p-value: p = (# simulated >= observed) / N
+            # percentile: rank(observed) / N * 100
+            n_greater_equal, n_less = exceedance_counts(random_values, observed_value)
             p_value = float(n_greater_equal / n_iterations)
-            
-            # Calculate percentile: rank(observed) / N * 100
-            n_less = np.sum(random_values < observed_value)
             percentile = float((n_less / n_iterations) * 100.0)
             
             # Use KDE smoothing if variance is very low
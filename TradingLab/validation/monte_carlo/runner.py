@@ -8,7 +8,7 @@ This module provides a unified interface to run all three Monte Carlo engines:
 It combines results and computes a robustness score.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, List, Optional, Any
 import numpy as np
 import pandas as pd
@@ -16,9 +16,17 @@ import pandas as pd
 from .permutation import MonteCarloPermutation, PermutationResult
 from .block_bootstrap import MonteCarloBlockBootstrap, BootstrapResult
 from .randomized_entry import MonteCarloRandomizedEntry, RandomizedEntryResult, RandomizedEntryConfig
-from .utils import normalize_to_z_scores, normalize_to_ranks
+from .utils import normalize_to_z_scores, normalize_to_ranks, SequentialStop
 from engine.backtest_engine import BacktestResult
 from strategies.base import StrategyBase
+from engine._pandas_compat import copy_on_write_enabled
+
+
+# Fewest iterations a test may stop at under early stopping, where its
+# specification asks for more than SequentialStop.min_iterations
+EARLY_STOP_MIN_ITERATIONS: Dict[str, int] = {
+    'bootstrap': 1000,
+}
 
 
 @dataclass
@@ -406,7 +414,9 @@ class MonteCarloSuite:
         test_suitability: Dict[str, Any],  # Dict[str, TestSuitability]
         metrics: Optional[List[str]] = None,
         n_iterations: int = 1000,
-        show_progress: bool = True
+        show_progress: bool = True,
+        early_stop: Optional[SequentialStop] = None,
+        min_iterations: Optional[Dict[str, int]] = None
     ) -> MonteCarloSuiteResult:
         """
         Run Monte Carlo tests conditionally based on suitability assessment.
@@ -420,14 +430,25 @@ class MonteCarloSuite:
             strategy: Strategy instance (needed for randomized entry test)
             test_suitability: Dictionary mapping test names to TestSuitability objects
             metrics: List of metrics to test (default: ['final_pnl', 'sharpe_ratio', 'profit_factor'])
-            n_iterations: Number of iterations per test
+            n_iterations: Number of iterations per test (upper bound when early_stop is set)
             show_progress: Show progress bars
+            early_stop: Sequential stopping rule; each test stops once its p-values are settled
+            min_iterations: Per-test floor on where early_stop may stop, by test name
+                (default: EARLY_STOP_MIN_ITERATIONS)
             
         Returns:
             MonteCarloSuiteResult with results from suitable tests and skipped test info
         """
         if metrics is None:
             metrics = ['final_pnl', 'sharpe', 'profit_factor']
+        if min_iterations is None:
+            min_iterations = EARLY_STOP_MIN_ITERATIONS
+        
+        def stop_rule(test: str) -> Optional[SequentialStop]:
+            floor = min_iterations.get(test, 0)
+            if early_stop is None or floor <= early_stop.min_iterations:
+                return early_stop
+            return replace(early_stop, min_iterations=floor)
         
         results = {}
         skipped = {}
@@ -441,7 +462,8 @@ class MonteCarloSuite:
                 backtest_result=backtest_result,
                 metrics=metrics,
                 n_iterations=n_iterations,
-                show_progress=show_progress
+                show_progress=show_progress,
+                early_stop=stop_rule('permutation')
             )
             results['permutation'] = {
                 'observed_metrics': permutation_result.observed_metrics,
@@ -479,7 +501,8 @@ class MonteCarloSuite:
                 price_series=bootstrap_price_series,
                 metrics=metrics,
                 n_iterations=n_iterations,
-                show_progress=show_progress
+                show_progress=show_progress,
+                early_stop=stop_rule('bootstrap')
             )
             results['bootstrap'] = {
                 'observed_metrics': bootstrap_result.observed_metrics,
@@ -529,7 +552,7 @@ class MonteCarloSuite:
             })
         elif isinstance(price_series, pd.DataFrame):
             # Full DataFrame provided - use as-is but ensure required columns exist
-            price_data = price_series.copy()
+            price_data = price_series.copy(deep=not copy_on_write_enabled())
             required_cols = ['open', 'high', 'low', 'close', 'volume']
             missing_cols = [col for col in required_cols if col not in price_data.columns]
             
@@ -571,7 +594,8 @@ class MonteCarloSuite:
             strategy=strategy,
             metrics=metrics,
             n_iterations=n_iterations,
-            show_progress=show_progress
+            show_progress=show_progress,
+            early_stop=stop_rule('randomized_entry')
         )
         results['randomized_entry'] = {
             'observed_metrics': randomized_result.observed_metrics,
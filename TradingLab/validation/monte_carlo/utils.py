@@ -5,8 +5,11 @@ This module provides:
 2. KDE smoothing for p-value estimation
 3. Z-score normalization for combining results
 4. Distribution validation
+5. Sequential early stopping of MC loops
+6. Single-pass exceedance counts for empirical p-values
 """
 
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
@@ -15,6 +18,7 @@ from scipy import stats
 from scipy.stats import gaussian_kde
 
 from engine.backtest_engine import BacktestResult, Trade
+from engine.jit import NUMBA_AVAILABLE, njit
 from metrics.metrics import calculate_enhanced_metrics
 
 
@@ -300,6 +304,62 @@ def validate_distribution(
     return True, ""
 
 
+@njit(cache=True)
+def _exceedance_counts(values, observed):
+    n_ge = 0
+    n_lt = 0
+    for v in values:
+        if v >= observed:
+            n_ge += 1
+        elif v < observed:
+            n_lt += 1
+    return n_ge, n_lt
+
+
+def exceedance_counts(values: np.ndarray, observed: float) -> Tuple[int, int]:
+    """(# values >= observed, # values < observed) in one pass; NaNs count as neither."""
+    values = np.asarray(values, dtype=np.float64)
+    if not NUMBA_AVAILABLE:
+        return int(np.count_nonzero(values >= observed)), int(np.count_nonzero(values < observed))
+    n_ge, n_lt = _exceedance_counts(np.ascontiguousarray(values).ravel(), float(observed))
+    return int(n_ge), int(n_lt)
+
+
+@dataclass(frozen=True)
+class SequentialStop:
+    """Early-stopping rule for an MC loop whose p-values are (# simulated >= observed) / N.
+    
+    Every check_every iterations from min_iterations on, each metric's p-value
+    gets an Agresti-Coull confidence interval; once no interval contains
+    threshold, more iterations cannot flip the pass/fail decision.
+    """
+    threshold: float
+    min_iterations: int = 100
+    check_every: int = 50
+    ci_alpha: float = 0.01
+    
+    def settled(
+        self,
+        distributions: Dict[str, np.ndarray],
+        observed_metrics: Dict[str, float],
+        n_done: int
+    ) -> bool:
+        """True if the first n_done draws already decide every metric against threshold."""
+        if n_done < self.min_iterations or n_done % self.check_every:
+            return False
+        z = stats.norm.ppf(1.0 - self.ci_alpha / 2.0)
+        for metric, values in distributions.items():
+            observed = observed_metrics.get(metric, 0.0)
+            if not np.isfinite(observed):
+                return False
+            k, _ = exceedance_counts(values[:n_done], observed)
+            p_hat = (k + 2) / (n_done + 4)
+            half_width = z * np.sqrt(p_hat * (1.0 - p_hat) / (n_done + 4))
+            if p_hat - half_width <= self.threshold <= p_hat + half_width:
+                return False
+        return True
+
+
 def normalize_to_z_scores(
     values: np.ndarray,
     mean: Optional[float] = None,
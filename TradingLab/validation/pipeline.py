@@ -384,8 +384,10 @@ class ValidationPipeline:
         
         print(f"\nMonte Carlo Suite Results:")
         
-        # Check if new format (MonteCarloSuite) or old format (MonteCarloPermutation)
-        if 'permutation' in result.monte_carlo_results:
+        # Check if skipped (fast_fail), new format (MonteCarloSuite) or old format (MonteCarloPermutation)
+        if not result.monte_carlo_results:
+            print(f"  Skipped: training backtest failed the quality checks")
+        elif 'permutation' in result.monte_carlo_results:
             # New format: MonteCarloSuite results
             mc = result.monte_carlo_results
             
@@ -1,20 +1,92 @@
 """Validation runner that orchestrates walk-forward and Monte Carlo tests."""
 
-from typing import Dict, Optional
+import os
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 from strategies.base import StrategyBase
-from engine.backtest_engine import BacktestResult
+from engine.backtest_engine import BacktestEngine, BacktestResult
 from validation.walkforward import WalkForwardAnalyzer, WalkForwardResult
-from validation.monte_carlo import MonteCarloPermutation
+from validation._pool import worker_context
+from validation.monte_carlo import MonteCarloPermutation, MonteCarloResult
 from config.schema import WalkForwardConfig
 from metrics.metrics import calculate_enhanced_metrics
 
 
+# Below this many iterations, process start-up costs more than it saves
+PARALLEL_MC_MIN_ITERATIONS = 100
+
+# Permutations per independently seeded chunk; fixed so the null distribution
+# depends on seed and n_iterations only, not on how many workers ran it
+PARALLEL_MC_CHUNK_SIZE = 50
+
+
+def _period_label(start, end) -> str:
+    """Format a walk-forward window as 'start to end'."""
+    return f"{start} to {end}"
+
+
+def _steps_frame(steps: list) -> pd.DataFrame:
+    """Columnar view of walk-forward steps, one row per step, for analysis and plotting."""
+    n = len(steps)
+    
+    def metric(attr: str, key: str) -> np.ndarray:
+        return np.fromiter((getattr(s, attr)[key] for s in steps), dtype=np.float64, count=n)
+    
+    return pd.DataFrame({
+        'train_start': pd.DatetimeIndex([s.train_start for s in steps]),
+        'train_end': pd.DatetimeIndex([s.train_end for s in steps]),
+        'test_start': pd.DatetimeIndex([s.test_start for s in steps]),
+        'test_end': pd.DatetimeIndex([s.test_end for s in steps]),
+        'train_pf': metric('train_metrics', 'pf'),
+        'test_pf': metric('test_metrics', 'pf'),
+        'train_sharpe': metric('train_metrics', 'sharpe'),
+        'test_sharpe': metric('test_metrics', 'sharpe'),
+        'excluded_from_stats': np.fromiter((s.excluded_from_stats for s in steps), dtype=bool, count=n),
+    }, index=pd.Index(np.fromiter((s.step_number for s in steps), dtype=np.int64, count=n), name='step'))
+
+
+# One record per tested metric in validate_strategy's Monte Carlo summary
+MC_SUMMARY_DTYPE = np.dtype([
+    ('metric', 'U32'),
+    ('observed', 'f8'),
+    ('p_value', 'f8'),
+    ('percentile_rank', 'f8'),
+])
+
+
+def _mc_summary(mc_results: Dict[str, MonteCarloResult]) -> np.ndarray:
+    """Pack Monte Carlo results into a MC_SUMMARY_DTYPE array, in metric order."""
+    return np.fromiter(
+        ((m, r.observed_metric, r.p_value, r.percentile_rank) for m, r in mc_results.items()),
+        dtype=MC_SUMMARY_DTYPE,
+        count=len(mc_results)
+    )
+
+
+# Result under test, inherited by forked Monte Carlo workers instead of pickled
+_FORK_SHARED_RESULT: Optional[BacktestResult] = None
+
+
+def _permutation_chunk(result: Optional[BacktestResult], metrics: Optional[list], n_iterations: int, seed):
+    """Run one slice of the permutation iterations (module-level so it pickles)."""
+    if result is None:
+        result = _FORK_SHARED_RESULT
+    mc = MonteCarloPermutation(seed=seed)
+    perm = mc.run(result, metrics=metrics, n_iterations=n_iterations, show_progress=False)
+    return perm.observed_metrics, perm.permuted_distributions
+
+
 class ValidationRunner:
     """Orchestrates validation tests for strategies."""
     
+    # Processes for Monte Carlo permutations; None = one per CPU core
+    monte_carlo_workers: Optional[int] = None
+    
     def __init__(
         self,
         strategy_class: type[StrategyBase],
@@ -73,9 +145,15 @@ class ValidationRunner:
         """
         Run Monte Carlo permutation tests.
         
+        With n_iterations >= PARALLEL_MC_MIN_ITERATIONS the permutations run in
+        chunks of PARALLEL_MC_CHUNK_SIZE, each with an independent stream
+        spawned from seed, scheduled over monte_carlo_workers processes; the
+        null distributions are concatenated in chunk order before p-values are
+        computed, so results do not depend on the worker count.
+        
         Args:
             result: BacktestResult to test
-            metrics: List of metrics to test (default: ['final_pnl', 'sharpe', 'pf'])
+            metrics: List of metrics to test (default: ['final_pnl', 'sharpe', 'profit_factor'])
             n_iterations: Number of permutations
             seed: Random seed
         
@@ -83,12 +161,60 @@ class ValidationRunner:
             Dictionary of metric results
         """
         mc = MonteCarloPermutation(seed=seed)
-        return mc.run_multiple_metrics(
-            result=result,
-            metrics=metrics,
-            n_iterations=n_iterations,
-            show_progress=True
-        )
+        
+        if n_iterations < PARALLEL_MC_MIN_ITERATIONS:
+            perm = mc.run(result, metrics=metrics, n_iterations=n_iterations, show_progress=True)
+            observed, distributions = perm.observed_metrics, perm.permuted_distributions
+        else:
+            sizes = [
+                min(PARALLEL_MC_CHUNK_SIZE, n_iterations - start)
+                for start in range(0, n_iterations, PARALLEL_MC_CHUNK_SIZE)
+            ]
+            seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+            workers = min(self.monte_carlo_workers or os.cpu_count() or 1, len(sizes))
+            
+            if workers <= 1:
+                parts = [_permutation_chunk(result, metrics, n, s) for n, s in zip(sizes, seeds)]
+            else:
+                # Forked workers see the result through copy-on-write memory, so the
+                # trades are not pickled once per chunk; otherwise it is pickled
+                context = worker_context()
+                fork = context.get_start_method() == 'fork'
+                global _FORK_SHARED_RESULT
+                _FORK_SHARED_RESULT = result if fork else None
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=context
+                    ) as pool:
+                        parts = list(pool.map(
+                            _permutation_chunk,
+                            [None if fork else result] * len(sizes),
+                            [metrics] * len(sizes),
+                            sizes,
+                            seeds
+                        ))
+                finally:
+                    _FORK_SHARED_RESULT = None
+            observed = parts[0][0]
+            distributions = {
+                m: np.concatenate([dist[m] for _, dist in parts])
+                for m in parts[0][1]
+            }
+        
+        p_values, percentiles = mc.summarize(observed, distributions)
+        return {
+            m: MonteCarloResult(
+                observed_metric=float(observed.get(m, 0.0)),
+                permuted_values=dist,
+                p_value=p_values[m],
+                percentile_rank=percentiles[m],
+                observed_metrics=observed,
+                n_iterations=n_iterations,
+                metric_name=m
+            )
+            for m, dist in distributions.items()
+        }
     
     def validate_strategy(
         self,
@@ -105,53 +231,55 @@ class ValidationRunner:
             data: Full dataset
             strategy_config: Strategy configuration
             wf_config: Optional walk-forward config (if None, skips WFA)
-            run_monte_carlo: Whether to run Monte Carlo on full backtest
+            run_monte_carlo: Whether to run Monte Carlo (on the walk-forward
+                out-of-sample trades when wf_config is given, else a full backtest)
             monte_carlo_iterations: Number of MC iterations
         
         Returns:
-            Dictionary with all validation results
+            Dictionary with all validation results. 'enhanced_metrics' describes
+            the same result Monte Carlo ran on: the stitched out-of-sample trades
+            when walk-forward produced any, else the full-data backtest.
         """
         results = {
             'walk_forward': None,
             'monte_carlo': None,
+            'monte_carlo_summary': None,
             'enhanced_metrics': None,
         }
         
+        wf_result = None
+        
         # Run walk-forward if config provided
         if wf_config:
             wf_result = self.run_walk_forward(data, strategy_config, wf_config)
+            pf_sharpe = itemgetter('pf', 'sharpe')
+            steps = []
+            for s in wf_result.steps:
+                train_pf, train_sharpe = pf_sharpe(s.train_metrics)
+                test_pf, test_sharpe = pf_sharpe(s.test_metrics)
+                steps.append({
+                    'step': s.step_number,
+                    'train_period': _period_label(s.train_start, s.train_end),
+                    'test_period': _period_label(s.test_start, s.test_end),
+                    'train_pf': train_pf,
+                    'test_pf': test_pf,
+                    'train_sharpe': train_sharpe,
+                    'test_sharpe': test_sharpe,
+                })
             results['walk_forward'] = {
                 'summary': wf_result.summary,
-                'steps': [
-                    {
-                        'step': s.step_number,
-                        'train_period': f"{s.train_start} to {s.train_end}",
-                        'test_period': f"{s.test_start} to {s.test_end}",
-                        'train_pf': s.train_metrics['pf'],
-                        'test_pf': s.test_metrics['pf'],
-                        'train_sharpe': s.train_metrics['sharpe'],
-                        'test_sharpe': s.test_metrics['sharpe'],
-                    }
-                    for s in wf_result.steps
-                ]
+                'steps': steps,
+                'steps_frame': _steps_frame(wf_result.steps)
             }
         
-        # Run Monte Carlo on full backtest if requested
+        # Run Monte Carlo if requested
         if run_monte_carlo:
-            from engine.backtest_engine import BacktestEngine
-            
-            # Run full backtest
-            from config.schema import validate_strategy_config
-            strategy_config_obj = validate_strategy_config(strategy_config)
-            strategy = self.strategy_class(strategy_config_obj)
-            
-            engine = BacktestEngine(
-                strategy=strategy,
-                initial_capital=self.initial_capital,
-                commission_rate=self.commission_rate,
-                slippage_ticks=self.slippage_ticks
-            )
-            backtest_result = engine.run(data)
+            # Walk-forward already backtested every test window; stitch those
+            # out-of-sample trades together instead of re-running the full dataset
+            backtest_result = self._combine_oos_results(wf_result) if wf_result else None
+            if backtest_result is None:
+                engine, _ = self._build_engine(strategy_config)
+                backtest_result = engine.run(data)
             
             # Calculate enhanced metrics
             enhanced = calculate_enhanced_metrics(backtest_result)
@@ -163,14 +291,84 @@ class ValidationRunner:
                 n_iterations=monte_carlo_iterations
             )
             
+            summary = _mc_summary(mc_results)
+            fields = MC_SUMMARY_DTYPE.names[1:]
             results['monte_carlo'] = {
-                metric: {
-                    'observed': r.observed_metric,
-                    'p_value': r.p_value,
-                    'percentile_rank': r.percentile_rank,
-                }
-                for metric, r in mc_results.items()
+                metric: dict(zip(fields, values))
+                for metric, *values in summary.tolist()
             }
+            results['monte_carlo_summary'] = summary
         
         return results
-
+    
+    def _build_engine(self, strategy_config: Dict) -> Tuple[BacktestEngine, StrategyBase]:
+        """
+        Build a strategy and a BacktestEngine with this runner's cost settings.
+        
+        Args:
+            strategy_config: Strategy configuration dict
+        
+        Returns:
+            Tuple of (engine, strategy)
+        """
+        from config.schema import validate_strategy_config
+        # Not memoized: strategies mutate their config (e.g. force-enabling regime
+        # filters), so a cached StrategyConfig would need a deep copy per call,
+        # which costs several times more than validating the dict again.
+        strategy_config_obj = validate_strategy_config(strategy_config)
+        strategy = self.strategy_class(strategy_config_obj)
+        
+        engine = BacktestEngine(
+            strategy=strategy,
+            initial_capital=self.initial_capital,
+            commission_rate=self.commission_rate,
+            slippage_ticks=self.slippage_ticks
+        )
+        return engine, strategy
+    
+    def _combine_oos_results(self, wf_result: WalkForwardResult) -> Optional[BacktestResult]:
+        """
+        Concatenate the walk-forward test-window results into one BacktestResult.
+        
+        Every window starts from the same initial capital, so per-trade P&L is
+        chained onto a single trade-level equity curve and trade returns are
+        recomputed against it. Steps marked excluded_from_stats are left out.
+        
+        Args:
+            wf_result: WalkForwardResult from run_walk_forward
+        
+        Returns:
+            Combined BacktestResult, or None if the included test windows had no trades
+        """
+        test_results = [s.test_result for s in wf_result.steps if not s.excluded_from_stats]
+        trades = [t for r in test_results for t in r.trades]
+        if not trades:
+            return None
+        
+        initial_capital = test_results[0].initial_capital
+        pnls = np.fromiter((t.pnl_after_costs for t in trades), dtype=float, count=len(trades))
+        equity = np.concatenate(([initial_capital], initial_capital + np.cumsum(pnls)))
+        equity_before = equity[:-1]
+        trade_returns = np.divide(pnls, equity_before, out=np.zeros_like(pnls), where=equity_before > 0)
+        
+        peak = np.maximum.accumulate(equity)
+        max_drawdown = min(abs(float((((equity - peak) / peak) * 100.0).min())), 100.0)
+        winning = int((pnls > 0).sum())
+        
+        return BacktestResult(
+            initial_capital=initial_capital,
+            final_capital=float(equity[-1]),
+            equity_curve=pd.Series(equity),  # Integer-indexed for MC compatibility
+            trade_returns=trade_returns,
+            trades=trades,
+            total_pnl=float(equity[-1] - initial_capital),
+            total_trades=len(trades),
+            winning_trades=winning,
+            losing_trades=len(trades) - winning,
+            total_commission=sum(t.commission for t in trades),
+            total_slippage=sum(t.slippage for t in trades),
+            max_drawdown=max_drawdown,
+            strategy_name=test_results[0].strategy_name,
+            symbol=test_results[0].symbol,
+            win_rate=winning / len(trades) * 100.0
+        )
@@ -1,5 +1,6 @@
 """Parameter sensitivity analysis for strategies."""
 
+import copy
 from typing import Dict, List, Any, Optional
 import pandas as pd
 import numpy as np
@@ -7,7 +8,8 @@ from itertools import product
 
 from strategies.base import StrategyBase
 from engine.backtest_engine import BacktestEngine, BacktestResult
-from config.schema import StrategyConfig
+from config.schema import StrategyConfig, validate_strategy_config
+from metrics.metrics import calculate_enhanced_metrics
 
 
 class SensitivityAnalyzer:
@@ -54,10 +56,6 @@ class SensitivityAnalyzer:
         Returns:
             DataFrame with results for each parameter combination
         """
-        import tempfile
-        from pathlib import Path
-        from config.schema import validate_strategy_config
-        
         # Generate all parameter combinations
         param_names = list(param_grid.keys())
         param_values = list(param_grid.values())
@@ -66,53 +64,82 @@ class SensitivityAnalyzer:
         results = []
         
         for combo in combinations:
-            # Create config with this combination
-            test_config = base_config.copy()
-            for param_name, param_value in zip(param_names, combo):
-                # Handle nested parameter paths
-                self._set_nested_param(test_config, param_name, param_value)
-            
-            # Validate config
-            try:
-                strategy_config = validate_strategy_config(test_config)
-            except Exception as e:
-                continue  # Skip invalid configs
-            
-            # Run backtest
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-                data.to_csv(f.name)
-                temp_path = Path(f.name)
-            
-            try:
-                strategy = self.strategy_class(strategy_config)
-                engine = BacktestEngine(
-                    strategy=strategy,
-                    initial_capital=self.initial_capital,
-                    commission_rate=self.commission_rate,
-                    slippage_ticks=self.slippage_ticks
-                )
-                result = engine.run(temp_path)
-                
-                # Extract metrics
-                result_dict = {
-                    'profit_factor': result.profit_factor,
-                    'sharpe_ratio': result.sharpe_ratio,
-                    'total_pnl': result.total_pnl,
-                    'win_rate': result.win_rate,
-                    'total_trades': result.total_trades,
-                    'max_drawdown_pct': result.max_drawdown_pct,
-                }
-                
-                # Add parameter values
-                for param_name, param_value in zip(param_names, combo):
-                    result_dict[param_name] = param_value
-                
+            result_dict = self.evaluate_params(data, base_config, dict(zip(param_names, combo)))
+            if result_dict is not None:  # Skip invalid configs
                 results.append(result_dict)
-            finally:
-                temp_path.unlink()
         
         return pd.DataFrame(results)
     
+    def evaluate_params(
+        self,
+        data: pd.DataFrame,
+        base_config: Dict[str, Any],
+        overrides: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Backtest one parameter combination.
+        
+        Args:
+            data: Dataset to test on
+            base_config: Base strategy configuration (not modified)
+            overrides: Parameter paths to values, e.g. {'risk.risk_per_trade_pct': 1.0}
+        
+        Returns:
+            Metrics plus the parameter values, or None if the config is invalid
+        """
+        # Create config with this combination
+        test_config = copy.deepcopy(base_config)
+        for param_name, param_value in overrides.items():
+            # Handle nested parameter paths
+            self._set_nested_param(test_config, param_name, param_value)
+        
+        # Validate config
+        try:
+            strategy_config = validate_strategy_config(test_config)
+        except Exception:
+            return None
+        
+        # Run backtest
+        strategy = self.strategy_class(strategy_config)
+        engine = BacktestEngine(
+            strategy=strategy,
+            initial_capital=self.initial_capital,
+            commission_rate=self.commission_rate,
+            slippage_ticks=self.slippage_ticks
+        )
+        result = engine.run(data)
+        return self.metrics_row(result, calculate_enhanced_metrics(result), overrides)
+    
+    @staticmethod
+    def metrics_row(
+        result: BacktestResult,
+        enhanced: Dict[str, Any],
+        overrides: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build a grid_search row from a backtest result and its enhanced metrics."""
+        # Extract metrics
+        result_dict = {
+            'profit_factor': enhanced.get('profit_factor', 0.0),
+            'sharpe_ratio': enhanced.get('sharpe_ratio', 0.0),
+            'total_pnl': result.total_pnl,
+            'win_rate': result.win_rate,
+            'total_trades': result.total_trades,
+            'max_drawdown_pct': result.max_drawdown,
+        }
+        
+        # Add parameter values
+        result_dict.update(overrides)
+        return result_dict
+    
+    def get_nested_param(self, config: Dict, path: str, default: Any = None) -> Any:
+        """Get nested parameter using dot notation path."""
+        current = config
+        for key in path.split('.'):
+            if not isinstance(current, dict) or key not in current:
+                return default
+            current = current[key]
+        return current
+    
     def _set_nested_param(self, config: Dict, path: str, value: Any):
         """Set nested parameter using dot notation path."""
         keys = path.split('.')
@@ -1,15 +1,24 @@
 """Phase 1: Training Validation - Tests on training data only."""
 
-from typing import Dict, Optional, List, Any
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import product
+from typing import Dict, Optional, List, Any, Tuple, Union
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from strategies.base import StrategyBase
 from engine.backtest_engine import BacktestEngine, BacktestResult
 from validation.monte_carlo.runner import MonteCarloSuite
+from validation.monte_carlo.utils import SequentialStop
 from validation.suitability import ValidationSuitabilityAssessor
 from validation.sensitivity import SensitivityAnalyzer
+from validation._pool import worker_context
 from config.schema import (
+    StrategyConfig,
     ValidationCriteriaConfig,
     TrainingValidationCriteria,
     validate_strategy_config
@@ -17,21 +26,88 @@ from config.schema import (
 from metrics.metrics import calculate_enhanced_metrics
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# (analyzer, data, base_config) inherited by forked sensitivity workers instead of pickled;
+# the lock keeps concurrent validate() calls (validate_many) from swapping it mid-fork
+_FORK_SENSITIVITY_JOB: Optional[tuple] = None
+_FORK_SENSITIVITY_LOCK = threading.Lock()
+
+
+def _evaluate_one_combo(job: Optional[tuple], overrides: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Backtest one sensitivity grid cell (module-level so it pickles)."""
+    analyzer, data, base_config = job if job is not None else _FORK_SENSITIVITY_JOB
+    return analyzer.evaluate_params(data, base_config, overrides)
+
+
+def _validate_fold(
+    validator: 'TrainingValidator',
+    data: pd.DataFrame,
+    strategy_config: Union[Dict[str, Any], StrategyConfig],
+    kwargs: Dict[str, Any]
+) -> 'TrainingValidationResult':
+    """Validate one fold (module-level so it pickles for process executors)."""
+    return validator.validate(data, strategy_config, **kwargs)
+
+
+def _majority_pass(p_values: Dict[str, float], thresh: float) -> bool:
+    """True if at least half of the metrics have p <= thresh (False when there are none)."""
+    arr = np.fromiter(p_values.values(), dtype=np.float64, count=len(p_values))
+    return arr.size > 0 and bool((arr <= thresh).sum() * 2 >= arr.size)
+
+
+# Suitability report templates (filled with format_map in validate())
+_SUIT_HEADER = (
+    "\n" + "=" * 60 + "\n"
+    "STRATEGY SUITABILITY ASSESSMENT\n"
+    + "=" * 60 + "\n"
+    "Strategy Type: {strategy_type}\n"
+    "Return CV: {return_cv:.4f}\n"
+    "Exit Uniformity: {exit_uniformity:.1%}\n"
+    "Number of Trades: {n_trades}\n"
+    "Number of Bars: {n_bars}\n"
+    "Final Equity CV (from quick permutation): {final_equity_cv:.6f}\n"
+    "\n"
+    "Test Suitability:"
+)
+_SUIT_ROW = "  {test_name}: {status}\n    Reason: {reason}"
+_SUIT_ALTERNATIVES = "\n    Alternatives: {}"
+_MC_BANNER = "\n" + "=" * 60 + "\nMONTE CARLO VALIDATION\n" + "=" * 60
+
+# Per-iteration metric arrays in MonteCarloSuite.run_conditional test results
+_MC_DISTRIBUTION_KEYS = ('permuted_distributions', 'bootstrap_distributions', 'random_distributions')
+
+
+def _mc_individual_reason(n_suitable: int) -> str:
+    if n_suitable == 2:
+        return "Monte Carlo individual tests: Required at least 1/2 suitable tests to pass (majority rule)"
+    if n_suitable == 3:
+        return "Monte Carlo individual tests: Required at least 2/3 suitable tests to pass"
+    return "Monte Carlo individual tests: Required suitable test(s) to pass"
+
+
+# (check key, message builder) in report order; builders take (enhanced_metrics, backtest_result,
+# criteria, mc_score, mc_percentile, n_suitable) and only run for failed checks
+_REASON_BUILDERS = (
+    ('min_profit_factor', lambda em, br, cr, score, pct, n: f"Training PF {em.get('profit_factor', 0.0):.2f} < {cr.training_min_profit_factor}"),
+    ('min_sharpe', lambda em, br, cr, score, pct, n: f"Training Sharpe {em.get('sharpe_ratio', 0.0):.2f} < {cr.training_min_sharpe}"),
+    ('min_trades', lambda em, br, cr, score, pct, n: f"Training trades {br.total_trades} < {cr.training_min_trades}"),
+    ('mc_score', lambda em, br, cr, score, pct, n: f"Monte Carlo robustness score {score:.2f} < {cr.min_mc_score}"),
+    ('mc_percentile', lambda em, br, cr, score, pct, n: f"Monte Carlo percentile {pct:.1f} < {cr.min_mc_percentile}"),
+    ('mc_individual_tests', lambda em, br, cr, score, pct, n: _mc_individual_reason(n)),
+    ('sensitivity_cv', lambda em, br, cr, score, pct, n: "Parameter sensitivity too high (strategy not robust)"),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class TrainingValidationResult:
     """Results from Phase 1: Training Validation."""
     passed: bool
     backtest_result: BacktestResult
     monte_carlo_results: Dict[str, Any]
     sensitivity_results: Optional[Dict[str, Any]] = None
-    criteria_checks: Dict[str, bool] = None
-    failure_reasons: List[str] = None
-    
-    def __post_init__(self):
-        if self.criteria_checks is None:
-            self.criteria_checks = {}
-        if self.failure_reasons is None:
-            self.failure_reasons = []
+    criteria_checks: Dict[str, bool] = field(default_factory=dict)
+    failure_reasons: List[str] = field(default_factory=list)
 
 
 class TrainingValidator:
@@ -44,13 +120,21 @@ class TrainingValidator:
     3. Parameter Sensitivity (tests robustness)
     """
     
+    # Processes for the sensitivity grid; None = one per CPU core
+    sensitivity_workers: Optional[int] = None
+    
+    # dtype of the per-iteration MC distributions kept on the result (p-values and
+    # percentiles are computed before the cast); np.float64 keeps full precision
+    float_dtype: np.dtype = np.float32
+    
     def __init__(
         self,
         strategy_class: type[StrategyBase],
         initial_capital: float = 10000.0,
         commission_rate: Optional[float] = None,
         slippage_ticks: Optional[float] = None,
-        criteria: Optional[TrainingValidationCriteria] = None
+        criteria: Optional[TrainingValidationCriteria] = None,
+        support_sensitivity: bool = True
     ):
         """
         Initialize training validator.
@@ -61,37 +145,102 @@ class TrainingValidator:
             commission_rate: Commission rate per trade
             slippage_ticks: Slippage in ticks
             criteria: Pass/fail criteria (uses defaults if None)
+            support_sensitivity: False for validators that never run the sensitivity
+                grid (e.g. walk-forward folds); validate() then skips it regardless of
+                run_sensitivity/sensitivity_params
         """
         self.strategy_class = strategy_class
         self.initial_capital = initial_capital
         self.commission_rate = commission_rate
         self.slippage_ticks = slippage_ticks
         self.criteria = criteria or TrainingValidationCriteria()
+        self.support_sensitivity = support_sensitivity
         self.suitability_assessor = ValidationSuitabilityAssessor()  # NEW: Suitability assessment
     
+    @classmethod
+    def validate_many(
+        cls,
+        strategy_class: type[StrategyBase],
+        folds: List[Tuple[pd.DataFrame, Union[Dict[str, Any], StrategyConfig]]],
+        *,
+        max_workers: Optional[int] = None,
+        executor_cls: type = ThreadPoolExecutor,
+        validator_kwargs: Optional[Dict[str, Any]] = None,
+        **validate_kwargs
+    ) -> List[TrainingValidationResult]:
+        """
+        Validate several (training_data, strategy_config) folds concurrently.
+        
+        One validator is built per fold; results are returned in fold order.
+        Threads help where the engine's numeric work releases the GIL and require
+        strategy_class to be reentrant (no mutable class-level state). Pass
+        executor_cls=ProcessPoolExecutor for strategies that hold the GIL; its
+        workers are started as worker_context() decides.
+        
+        Args:
+            strategy_class: Strategy class to validate
+            folds: List of (training_data, strategy_config) pairs
+            max_workers: Executor workers (executor default if None)
+            executor_cls: ThreadPoolExecutor or ProcessPoolExecutor
+            validator_kwargs: Constructor kwargs for each TrainingValidator
+            **validate_kwargs: Passed to every validate() call (verbose=False is
+                advisable so progress output does not interleave)
+        
+        Returns:
+            List of TrainingValidationResult, one per fold
+        """
+        validators = [cls(strategy_class, **(validator_kwargs or {})) for _ in folds]
+        pool_kwargs = {'max_workers': max_workers}
+        if issubclass(executor_cls, ProcessPoolExecutor):
+            pool_kwargs['mp_context'] = worker_context()
+        with executor_cls(**pool_kwargs) as pool:
+            futures = [
+                pool.submit(_validate_fold, validator, data, strategy_config, validate_kwargs)
+                for validator, (data, strategy_config) in zip(validators, folds)
+            ]
+            return [future.result() for future in futures]
+    
     def validate(
         self,
         training_data: pd.DataFrame,
-        strategy_config: Dict[str, Any],
+        strategy_config: Union[Dict[str, Any], StrategyConfig],
         run_sensitivity: bool = True,
         sensitivity_params: Optional[Dict[str, List[Any]]] = None,
-        mc_iterations: int = 1000
+        mc_iterations: int = 1000,
+        fast_fail: bool = True,
+        mc_adaptive: bool = True,
+        verbose: bool = True
     ) -> TrainingValidationResult:
         """
         Run complete Phase 1 validation on training data.
         
         Args:
             training_data: Training dataset (datetime index)
-            strategy_config: Strategy configuration dict
+            strategy_config: Strategy configuration dict, or an already validated
+                StrategyConfig (used as-is; strategy templates may enable their
+                default regime filter on it)
             run_sensitivity: Whether to run parameter sensitivity analysis
             sensitivity_params: Parameters to test for sensitivity (if None, skips)
-            mc_iterations: Number of Monte Carlo iterations
+            mc_iterations: Number of Monte Carlo iterations (maximum when mc_adaptive)
+            fast_fail: Skip Monte Carlo and sensitivity when the training backtest
+                already fails the quality criteria (set False to always run the full suite)
+            mc_adaptive: Stop each Monte Carlo test early once its p-values are clearly
+                above or below monte_carlo_p_value_max
+            verbose: Log the suitability assessment and show MC progress
         
         Returns:
             TrainingValidationResult with pass/fail status
         """
-        # Validate config
-        strategy_config_obj = validate_strategy_config(strategy_config)
+        # Backtest, MC and sensitivity all read the same frame; fix its layout once
+        training_data = self._ensure_contiguous(training_data)
+        
+        # Validate config (skipped when given a StrategyConfig); the sensitivity grid
+        # overrides dotted paths, so it keeps working on the dict form
+        if isinstance(strategy_config, StrategyConfig):
+            strategy_config_obj = strategy_config
+            strategy_config = strategy_config.model_dump()
+        else:
+            strategy_config_obj = validate_strategy_config(strategy_config)
         strategy = self.strategy_class(strategy_config_obj)
         
         # 1. Run backtest on training data
@@ -110,32 +259,36 @@ class TrainingValidator:
         
         # 2. Check backtest quality criteria
         quality_checks = self._check_backtest_quality(backtest_result, enhanced_metrics)
+        quality_pass = all(quality_checks.values())
+        
+        # passed requires quality_pass, so MC/sensitivity cannot change the outcome
+        if fast_fail and not quality_pass:
+            return TrainingValidationResult(
+                passed=False,
+                backtest_result=backtest_result,
+                monte_carlo_results={},
+                criteria_checks=quality_checks,
+                failure_reasons=self._failure_reasons(quality_checks, enhanced_metrics, backtest_result)
+            )
         
         # 3. Assess strategy suitability for MC tests
-        print("\n" + "="*60)
-        print("STRATEGY SUITABILITY ASSESSMENT")
-        print("="*60)
         profile = self.suitability_assessor.assess_strategy(backtest_result)
         test_suitability = self.suitability_assessor.get_test_suitability(profile)
-        
-        print(f"Strategy Type: {profile.strategy_type}")
-        print(f"Return CV: {profile.return_cv:.4f}")
-        print(f"Exit Uniformity: {profile.exit_uniformity:.1%}")
-        print(f"Number of Trades: {profile.n_trades}")
-        print(f"Number of Bars: {profile.n_bars}")
-        print(f"Final Equity CV (from quick permutation): {profile.final_equity_cv:.6f}")
-        print("\nTest Suitability:")
-        for test_name, suit in test_suitability.items():
-            status = "✅ SUITABLE" if suit.suitable else "❌ NOT SUITABLE"
-            print(f"  {test_name.upper()}: {status}")
-            print(f"    Reason: {suit.reason}")
-            if suit.alternatives:
-                print(f"    Alternatives: {', '.join(suit.alternatives)}")
+        suitable_tests = frozenset(name for name, suit in test_suitability.items() if suit.suitable)
+        
+        if verbose:
+            # One log record for the whole table rather than a write per line
+            rows = [
+                _SUIT_ROW.format_map({
+                    'test_name': test_name.upper(),
+                    'status': "SUITABLE" if suit.suitable else "NOT SUITABLE",
+                    'reason': suit.reason,
+                }) + (_SUIT_ALTERNATIVES.format(', '.join(suit.alternatives)) if suit.alternatives else "")
+                for test_name, suit in test_suitability.items()
+            ]
+            logger.info("\n".join([_SUIT_HEADER.format_map(vars(profile)), *rows, _MC_BANNER]))
         
         # 4. Run Monte Carlo Suite (conditionally based on suitability)
-        print("\n" + "="*60)
-        print("MONTE CARLO VALIDATION")
-        print("="*60)
         mc_suite = MonteCarloSuite(seed=42)
         # Pass full OHLCV DataFrame (not just close prices) so randomized entry test
         # can properly simulate intrabar stop losses and take profits
@@ -146,19 +299,30 @@ class TrainingValidator:
             test_suitability=test_suitability,
             metrics=['final_pnl', 'sharpe_ratio', 'profit_factor'],
             n_iterations=mc_iterations,
-            show_progress=True
+            show_progress=verbose,
+            early_stop=SequentialStop(threshold=self.criteria.monte_carlo_p_value_max) if mc_adaptive else None
         )
         
-        mc_checks = self._check_monte_carlo_suite_conditional(mc_results, test_suitability)
+        combined = mc_results.combined
+        mc_score = combined.get('score', 0.0)
+        mc_percentile = combined.get('percentile', 0.0)
+        mc_checks = self._check_monte_carlo_suite_conditional(
+            mc_results,
+            test_suitability,
+            suitable_tests,
+            combined_score=mc_score,
+            combined_percentile=mc_percentile
+        )
         
-        # 4. Run Parameter Sensitivity (if requested and params provided)
+        # 4. Run Parameter Sensitivity (if supported, requested and params provided)
         sensitivity_results = None
         sensitivity_checks = {}
-        if run_sensitivity and sensitivity_params:
+        if self.support_sensitivity and run_sensitivity and sensitivity_params:
             sensitivity_results = self._run_sensitivity(
                 training_data,
                 strategy_config,
-                sensitivity_params
+                sensitivity_params,
+                baseline=(backtest_result, enhanced_metrics)
             )
             sensitivity_checks = self._check_sensitivity(sensitivity_results)
         
@@ -172,46 +336,22 @@ class TrainingValidator:
         mc_individual_tests_pass = all_checks.get('mc_individual_tests', False)
         mc_score_pass = all_checks.get('mc_score', False)
         mc_percentile_pass = all_checks.get('mc_percentile', False)
-        quality_pass = all(quality_checks.values())
         
         # Pass if: quality checks pass AND (MC score/percentile pass) AND (suitable MC tests pass)
         passed = quality_pass and (mc_score_pass and mc_percentile_pass) and mc_individual_tests_pass
         
         # Collect failure reasons
-        failure_reasons = []
-        profit_factor = enhanced_metrics.get('profit_factor', 0.0)
-        sharpe_ratio = enhanced_metrics.get('sharpe_ratio', 0.0)
-        if not all_checks.get('min_profit_factor', True):
-            failure_reasons.append(f"Training PF {profit_factor:.2f} < {self.criteria.training_min_profit_factor}")
-        if not all_checks.get('min_sharpe', True):
-            failure_reasons.append(f"Training Sharpe {sharpe_ratio:.2f} < {self.criteria.training_min_sharpe}")
-        if not all_checks.get('min_trades', True):
-            failure_reasons.append(f"Training trades {backtest_result.total_trades} < {self.criteria.training_min_trades}")
-        if not all_checks.get('mc_score', True):
-            combined_score = mc_results.combined.get('score', 0.0)
-            failure_reasons.append(f"Monte Carlo robustness score {combined_score:.2f} < {self.criteria.min_mc_score}")
-        if not all_checks.get('mc_percentile', True):
-            combined_percentile = mc_results.combined.get('percentile', 0.0)
-            failure_reasons.append(f"Monte Carlo percentile {combined_percentile:.1f} < {self.criteria.min_mc_percentile}")
-        if not all_checks.get('mc_individual_tests', True):
-            # Get suitable test count for better error message
-            suitable_count = len([name for name, suit in test_suitability.items() if suit.suitable])
-            if suitable_count == 2:
-                failure_reasons.append("Monte Carlo individual tests: Required at least 1/2 suitable tests to pass (majority rule)")
-            elif suitable_count == 3:
-                failure_reasons.append("Monte Carlo individual tests: Required at least 2/3 suitable tests to pass")
-            else:
-                failure_reasons.append("Monte Carlo individual tests: Required suitable test(s) to pass")
-        if sensitivity_checks and not all_checks.get('sensitivity_cv', True):
-            failure_reasons.append("Parameter sensitivity too high (strategy not robust)")
+        failure_reasons = self._failure_reasons(
+            all_checks, enhanced_metrics, backtest_result, mc_score, mc_percentile, len(suitable_tests)
+        )
         
         return TrainingValidationResult(
             passed=passed,
             backtest_result=backtest_result,
             monte_carlo_results={
-                'permutation': mc_results.permutation,
-                'bootstrap': mc_results.bootstrap,
-                'randomized_entry': mc_results.randomized_entry,
+                'permutation': self._compact_mc_payload(mc_results.permutation),
+                'bootstrap': self._compact_mc_payload(mc_results.bootstrap),
+                'randomized_entry': self._compact_mc_payload(mc_results.randomized_entry),
                 'combined': mc_results.combined,
             },
             sensitivity_results=sensitivity_results,
@@ -219,6 +359,35 @@ class TrainingValidator:
             failure_reasons=failure_reasons
         )
     
+    def _compact_mc_payload(self, test_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of an MC test result with its distributions stored as float_dtype."""
+        payload = dict(test_result)
+        for key in _MC_DISTRIBUTION_KEYS:
+            if key in payload:
+                payload[key] = {
+                    metric: np.asarray(values).astype(self.float_dtype, copy=False)
+                    for metric, values in payload[key].items()
+                }
+        return payload
+    
+    @staticmethod
+    def _ensure_contiguous(df: pd.DataFrame) -> pd.DataFrame:
+        """Return df with every float column backed by a C-contiguous float64 array.
+        
+        df is returned as-is when it already is; otherwise only the offending
+        columns are rebuilt on a copy.
+        """
+        float_cols = [
+            col for col in df.select_dtypes(include='floating').columns
+            if df[col].dtype != np.float64 or not df[col].to_numpy().flags.c_contiguous
+        ]
+        if not float_cols:
+            return df
+        df = df.copy()
+        for col in float_cols:
+            df[col] = np.ascontiguousarray(df[col].to_numpy(), dtype=np.float64)
+        return df
+    
     def _check_backtest_quality(self, result: BacktestResult, enhanced_metrics: Dict[str, float]) -> Dict[str, bool]:
         """Check if backtest meets quality criteria."""
         profit_factor = enhanced_metrics.get('profit_factor', 0.0)
@@ -229,10 +398,29 @@ class TrainingValidator:
             'min_trades': result.total_trades >= self.criteria.training_min_trades,
         }
     
+    def _failure_reasons(
+        self,
+        checks: Dict[str, bool],
+        enhanced_metrics: Dict[str, float],
+        result: BacktestResult,
+        mc_score: float = 0.0,
+        mc_percentile: float = 0.0,
+        n_suitable: int = 0
+    ) -> List[str]:
+        """Failure reasons for every failed check in checks (absent checks count as passed)."""
+        return [
+            build(enhanced_metrics, result, self.criteria, mc_score, mc_percentile, n_suitable)
+            for key, build in _REASON_BUILDERS
+            if not checks.get(key, True)
+        ]
+    
     def _check_monte_carlo_suite_conditional(
         self, 
         mc_results, 
-        test_suitability: Dict[str, Any]
+        test_suitability: Dict[str, Any],
+        suitable_tests: Optional[frozenset] = None,
+        combined_score: Optional[float] = None,
+        combined_percentile: Optional[float] = None
     ) -> Dict[str, bool]:
         """Check Monte Carlo suite results accounting for skipped tests.
         
@@ -245,112 +433,67 @@ class TrainingValidator:
         Args:
             mc_results: MonteCarloSuiteResult from run_conditional()
             test_suitability: Dictionary mapping test names to TestSuitability objects
+            suitable_tests: Names of the suitable tests (derived from test_suitability if None)
+            combined_score: mc_results.combined['score'] if already read by the caller
+            combined_percentile: mc_results.combined['percentile'] if already read by the caller
         """
         checks = {}
         
-        combined = mc_results.combined
+        if combined_score is None:
+            combined_score = mc_results.combined.get('score', 0.0)
+        if combined_percentile is None:
+            combined_percentile = mc_results.combined.get('percentile', 0.0)
         
         # Check combined robustness score
-        checks['mc_score'] = combined.get('score', 0.0) >= self.criteria.min_mc_score
+        checks['mc_score'] = combined_score >= self.criteria.min_mc_score
         
         # Check combined percentile
-        checks['mc_percentile'] = combined.get('percentile', 0.0) >= self.criteria.min_mc_percentile
+        checks['mc_percentile'] = combined_percentile >= self.criteria.min_mc_percentile
         
         # Count suitable tests
-        suitable_tests = [
-            name for name, suit in test_suitability.items() 
-            if suit.suitable
-        ]
+        if suitable_tests is None:
+            suitable_tests = frozenset(name for name, suit in test_suitability.items() if suit.suitable)
         
         # Check individual test results (only count suitable tests that ran)
         # NEW LOGIC: A test passes if MAJORITY of its metrics pass (not all)
         # This is more reasonable since some metrics (like profit_factor) may be
         # less meaningful for certain tests
-        perm_pass = False
-        bootstrap_pass = False
-        randomized_pass = False
-        
-        # Permutation test
-        if 'permutation' in suitable_tests and not mc_results.permutation.get('skipped', False):
-            perm_p_values = mc_results.permutation.get('p_values', {})
-            if perm_p_values:
-                # Test passes if majority of metrics pass
-                passing_metrics = sum(1 for p in perm_p_values.values() if p <= self.criteria.monte_carlo_p_value_max)
-                perm_pass = passing_metrics >= (len(perm_p_values) / 2)  # Majority rule
-        
-        # Bootstrap test
-        if 'bootstrap' in suitable_tests and not mc_results.bootstrap.get('skipped', False):
-            bootstrap_p_values = mc_results.bootstrap.get('p_values', {})
-            if bootstrap_p_values:
-                # Test passes if majority of metrics pass
-                passing_metrics = sum(1 for p in bootstrap_p_values.values() if p <= self.criteria.monte_carlo_p_value_max)
-                bootstrap_pass = passing_metrics >= (len(bootstrap_p_values) / 2)  # Majority rule
-        
-        # Randomized entry test (always runs)
-        randomized_p_values = mc_results.randomized_entry.get('p_values', {})
-        if randomized_p_values:
-            # Test passes if majority of metrics pass
-            passing_metrics = sum(1 for p in randomized_p_values.values() if p <= self.criteria.monte_carlo_p_value_max)
-            randomized_pass = passing_metrics >= (len(randomized_p_values) / 2)  # Majority rule
+        passes = {
+            name: (
+                name in suitable_tests
+                and not result.get('skipped', False)
+                and _majority_pass(result.get('p_values', {}), self.criteria.monte_carlo_p_value_max)
+            )
+            for name, result in (
+                ('permutation', mc_results.permutation),
+                ('bootstrap', mc_results.bootstrap),
+                ('randomized_entry', mc_results.randomized_entry),
+            )
+        }
         
         # REDEFINED LOGIC: Pass/fail based on suitable tests
         # - If 3 suitable tests: require at least 2 to pass
         # - If 2 suitable tests: require at least 1 to pass (majority)
         # - If 1 suitable test: require it to pass
+        # - No suitable tests (shouldn't happen): fail
         n_suitable = len(suitable_tests)
-        
-        if n_suitable == 3:
-            # All 3 tests suitable: require at least 2 to pass
-            individual_passes = sum([perm_pass, bootstrap_pass, randomized_pass])
-            checks['mc_individual_tests'] = individual_passes >= 2
-        elif n_suitable == 2:
-            # 2 tests suitable: require at least 1 to pass (majority)
-            # Only count the suitable tests
-            suitable_passes = []
-            if 'permutation' in suitable_tests:
-                suitable_passes.append(perm_pass)
-            if 'bootstrap' in suitable_tests:
-                suitable_passes.append(bootstrap_pass)
-            if 'randomized_entry' in suitable_tests:
-                suitable_passes.append(randomized_pass)
-            
-            checks['mc_individual_tests'] = sum(suitable_passes) >= 1  # At least 1/2 must pass
-        elif n_suitable == 1:
-            # Only 1 suitable test: require it to pass
-            if 'permutation' in suitable_tests:
-                checks['mc_individual_tests'] = perm_pass
-            elif 'bootstrap' in suitable_tests:
-                checks['mc_individual_tests'] = bootstrap_pass
-            else:  # randomized_entry
-                checks['mc_individual_tests'] = randomized_pass
-        else:
-            # No suitable tests (shouldn't happen, but handle gracefully)
-            checks['mc_individual_tests'] = False
+        checks['mc_individual_tests'] = n_suitable > 0 and sum(passes.values()) * 2 >= n_suitable
         
         return checks
     
-    def _check_monte_carlo_suite(self, mc_results) -> Dict[str, bool]:
-        """Legacy method for backward compatibility.
-        
-        This method is kept for compatibility but should use
-        _check_monte_carlo_suite_conditional() instead.
-        """
-        # Create dummy suitability (all tests suitable) for legacy compatibility
-        from validation.suitability import TestSuitability
-        test_suitability = {
-            'permutation': TestSuitability(suitable=True, reason="Legacy mode", priority=0.2),
-            'bootstrap': TestSuitability(suitable=True, reason="Legacy mode", priority=0.3),
-            'randomized_entry': TestSuitability(suitable=True, reason="Legacy mode", priority=0.5)
-        }
-        return self._check_monte_carlo_suite_conditional(mc_results, test_suitability)
-    
     def _run_sensitivity(
         self,
         data: pd.DataFrame,
         base_config: Dict[str, Any],
-        param_grid: Dict[str, List[Any]]
+        param_grid: Dict[str, List[Any]],
+        baseline: Optional[tuple] = None
     ) -> Dict[str, Any]:
-        """Run parameter sensitivity analysis."""
+        """Run parameter sensitivity analysis.
+        
+        baseline is the (BacktestResult, enhanced metrics) of base_config on the
+        same data; the grid cell equal to base_config reuses it instead of
+        backtesting again.
+        """
         analyzer = SensitivityAnalyzer(
             strategy_class=self.strategy_class,
             initial_capital=self.initial_capital,
@@ -358,12 +501,50 @@ class TrainingValidator:
             slippage_ticks=self.slippage_ticks
         )
         
-        results_df = analyzer.grid_search(
-            data=data,
-            base_config=base_config,
-            param_grid=param_grid,
-            metric='profit_factor'
-        )
+        # Each grid cell is an independent backtest, so cells run in parallel
+        param_names = list(param_grid.keys())
+        tasks = [dict(zip(param_names, combo)) for combo in product(*param_grid.values())]
+        rows = [None] * len(tasks)
+        
+        # validate() backtests with market-profile costs, so its result only stands
+        # in for a grid cell when the analyzer uses the same (default) costs
+        if baseline is not None and self.commission_rate is None and self.slippage_ticks is None:
+            _missing = object()
+            base_values = {name: analyzer.get_nested_param(base_config, name, _missing) for name in param_names}
+            for i, overrides in enumerate(tasks):
+                if overrides == base_values:
+                    rows[i] = analyzer.metrics_row(*baseline, overrides)
+        pending = [i for i, row in enumerate(rows) if row is None]
+        workers = min(self.sensitivity_workers or os.cpu_count() or 1, len(pending))
+        
+        if workers <= 1:
+            for i in pending:
+                rows[i] = analyzer.evaluate_params(data, base_config, tasks[i])
+        else:
+            # Forked workers see the data through copy-on-write memory instead of
+            # receiving a pickled copy per cell; otherwise the job is pickled
+            global _FORK_SENSITIVITY_JOB
+            context = worker_context()
+            fork = context.get_start_method() == 'fork'
+            job = (analyzer, data, base_config)
+            with _FORK_SENSITIVITY_LOCK:
+                _FORK_SENSITIVITY_JOB = job if fork else None
+                try:
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=context
+                    ) as pool:
+                        futures = {
+                            pool.submit(_evaluate_one_combo, None if fork else job, tasks[i]): i
+                            for i in pending
+                        }
+                        for future in as_completed(futures):
+                            rows[futures[future]] = future.result()
+                finally:
+                    _FORK_SENSITIVITY_JOB = None
+        
+        # Same rows, in grid order, as SensitivityAnalyzer.grid_search (invalid configs skipped)
+        results_df = pd.DataFrame([row for row in rows if row is not None])
         
         # Analyze sensitivity for each parameter
         sensitivity_analysis = {}
@@ -385,18 +566,18 @@ class TrainingValidator:
         if not sensitivity_results:
             return {}
         
-        checks = {}
         sensitivity_analysis = sensitivity_results.get('sensitivity_analysis', {})
+        cvs = np.fromiter(
+            (analysis.get('coefficient_of_variation', np.inf) for analysis in sensitivity_analysis.values()),
+            dtype=np.float64,
+            count=len(sensitivity_analysis)
+        )
+        within = cvs <= self.criteria.sensitivity_max_cv
         
-        for param_name, analysis in sensitivity_analysis.items():
-            cv = analysis.get('coefficient_of_variation', float('inf'))
-            checks[f'sensitivity_{param_name}_cv'] = cv <= self.criteria.sensitivity_max_cv
+        checks = {f'sensitivity_{param_name}_cv': bool(ok) for param_name, ok in zip(sensitivity_analysis, within)}
         
         # Overall sensitivity check (all params must pass)
-        checks['sensitivity_cv'] = all(
-            analysis.get('coefficient_of_variation', float('inf')) <= self.criteria.sensitivity_max_cv
-            for analysis in sensitivity_analysis.values()
-        )
+        checks['sensitivity_cv'] = bool(within.all())
         
         return checks
 